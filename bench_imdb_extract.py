@@ -0,0 +1,104 @@
+"""
+저장된 IMDb 리뷰 페이지(debug/imdb_reviews_*_last.html[.gz|.zst] 등)를 headless 크롬으로 열고
+카드 추출 경로 두 가지의 처리량(cards/sec)을 비교한다.
+
+  - js     : execute_script 1회로 구간 전체 추출
+  - element: 카드마다 find_element 로 조회 (기존 방식)
+
+사용 예:
+  python bench_imdb_extract.py
+  python bench_imdb_extract.py debug/imdb_reviews_tt10919420_last.html.gz --repeat 5
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+from typing import List, Dict
+
+from debug_snapshots import read_snapshot
+from imdb_reviews_selenium import (
+    create_driver,
+    count_review_cards,
+    _extract_review_rows,
+)
+
+
+def bench_page(driver, path: str, repeat: int) -> Dict[str, float]:
+    if path.endswith(".html"):
+        driver.get("file://" + os.path.abspath(path))
+    else:
+        # 압축 스냅샷은 풀어서 임시 .html 로 연다
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".html", encoding="utf-8", delete=False
+        ) as f:
+            f.write(read_snapshot(path))
+        try:
+            driver.get("file://" + f.name)
+        finally:
+            os.remove(f.name)
+    n_cards = count_review_cards(driver)
+
+    result = {"cards": float(n_cards)}
+    if n_cards == 0:
+        return result
+
+    for mode in ("js", "element"):
+        elapsed = 0.0
+        n_rows = 0
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            rows = _extract_review_rows(
+                driver, 0, n_cards, 0, "", "", 0, extraction=mode
+            )
+            elapsed += time.perf_counter() - t0
+            n_rows = sum(1 for _, r in rows if r)
+        result[f"{mode}_cards_per_sec"] = n_cards * repeat / elapsed
+        result[f"{mode}_rows"] = float(n_rows)
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "pages",
+        nargs="*",
+        help="저장된 IMDb 리뷰 HTML (기본: debug/imdb_reviews_*_last.html*)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages: List[str] = args.pages or sorted(
+        glob.glob(os.path.join("debug", "imdb_reviews_*_last.html*"))
+    )
+    if not pages:
+        print("[BENCH] 벤치마크할 저장 페이지가 없습니다.")
+        return
+
+    driver = create_driver(headless=True)
+    try:
+        for path in pages:
+            r = bench_page(driver, path, args.repeat)
+            if not r["cards"]:
+                print(f"[BENCH] {path}: 리뷰 카드 없음, 스킵")
+                continue
+            speedup = r["js_cards_per_sec"] / r["element_cards_per_sec"]
+            print(
+                f"[BENCH] {os.path.basename(path)}: 카드 {int(r['cards'])}개 | "
+                f"js {r['js_cards_per_sec']:.1f} cards/s | "
+                f"element {r['element_cards_per_sec']:.1f} cards/s | "
+                f"x{speedup:.1f}"
+            )
+            if r["js_rows"] != r["element_rows"]:
+                print(
+                    f"[BENCH]   ⚠ 추출 row 수 불일치: "
+                    f"js={int(r['js_rows'])}, element={int(r['element_rows'])}"
+                )
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
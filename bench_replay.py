@@ -0,0 +1,584 @@
+"""
+녹화된 리뷰 페이지를 로컬 HTTP 서버로 재생해서 크롤러 처리량을 재는 벤치마크.
+
+실제 사이트에 접속하지 않고 crawl_imdb_reviews_for_title /
+crawl_rt_audience_reviews_for_target 를 headless 크롬으로 그대로 돌린다.
+
+  - fixture: 저장된 스냅샷에서 리뷰 카드를 떼어 내 첫 페이지에는 page_size 개만 남기고,
+    "25 more" / Load More 버튼을 누르면 /__replay/more/... 에서 다음 카드 묶음을 받아
+    붙이는 작은 스크립트를 넣는다. 원본 <script> / 외부 리소스는 지워서
+    실행마다 같은 페이지가 된다.
+  - 측정: 타이틀별 reviews/sec, 클릭 간격(서버가 받은 더보기 요청 사이 시간) p50/p95,
+    브라우저 프로세스 트리 최대 RSS (psutil 이 있을 때)
+  - --out 으로 결과 JSON(커밋 해시 포함)을 남기고 --compare 로 이전 결과와 비교.
+    reviews/sec 가 --tolerance 이상 떨어지거나 클릭 간격 p50 이 그만큼 늘면 종료 코드 1
+
+fixture 준비 (debug 스냅샷 imdb_reviews_<ttid>_last.html* / rt_<slug>_last.html* 에서):
+  python bench_replay.py --import-snapshots debug
+
+사용 예:
+  python bench_replay.py --out bench_base.json
+  python bench_replay.py --compare bench_base.json --bounded-dom
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import lxml.html
+
+from crawl_utils import browser_rss_bytes
+from debug_snapshots import configure_snapshots, read_snapshot
+
+
+REPLAY_FIXTURE_DIR = os.path.join("fixtures", "replay")
+
+# 사이트별 첫 페이지 / 더보기 한 번에 붙는 카드 수 (실제 사이트와 같게)
+REPLAY_PAGE_SIZES = {"IMDB": 25, "RT": 10}
+
+_FIXTURE_RE = re.compile(r"^(imdb|rt)_(.+?)\.html(?:\.gz|\.zst)?$")
+_IMDB_SNAPSHOT_RE = re.compile(r"^imdb_reviews_(tt\d+)_last(\.html(?:\.gz|\.zst)?)$")
+_RT_SNAPSHOT_RE = re.compile(r"^rt_(.+)_last(\.html(?:\.gz|\.zst)?)$")
+
+_CARD_XPATHS = {
+    "IMDB": "//div[@data-testid='review-card-parent']",
+    "RT": (
+        "//div[contains(concat(' ', normalize-space(@class), ' '), ' reviews-cards ')"
+        " and @data-pagemediareviewsmanager='cards']//review-card"
+    ),
+}
+_MORE_BUTTON_XPATHS = {
+    "IMDB": "//button[.//span[contains(@class, 'ipc-see-more__text')]]",
+    "RT": "//rt-button[@data-pagemediareviewsmanager='loadMoreBtn']",
+}
+_MORE_BUTTON_HTML = {
+    "IMDB": (
+        '<button data-replay-more="1">'
+        '<span class="ipc-see-more__text">25 more</span></button>'
+    ),
+    "RT": (
+        '<rt-button data-pagemediareviewsmanager="loadMoreBtn" '
+        'data-replay-more="1">Load More</rt-button>'
+    ),
+}
+# 마지막 묶음을 붙인 뒤: IMDb 는 버튼이 사라지고, RT 는 hidden 이 붙는다
+_MORE_DONE_JS = {
+    "IMDB": "btn.remove();",
+    "RT": "btn.setAttribute('hidden', '');",
+}
+# RT 쿠키/약관 배너 대역 (close_rt_cookie_banner 가 바로 찾고 닫을 수 있게)
+_RT_BANNER_HTML = (
+    '<div data-replay-banner="1">'
+    '<button onclick="this.parentNode.remove()">Continue</button></div>'
+)
+
+_MORE_JS = """
+(function () {
+    var btn = document.querySelector("[data-replay-more]");
+    var box = document.querySelector("[data-replay-cards]");
+    if (!btn || !box) return;
+    var next = %(offset)d;
+    var busy = false;
+    btn.addEventListener("click", function () {
+        if (busy || next === null) return;
+        busy = true;
+        fetch("%(more_url)s?offset=" + next)
+            .then(function (r) { return r.json(); })
+            .then(function (d) {
+                box.insertAdjacentHTML("beforeend", d.html);
+                next = d.next;
+                if (next === null) { %(done)s }
+                busy = false;
+            });
+    });
+})();
+"""
+
+
+# =========================================================
+# 1. fixture 만들기
+# =========================================================
+
+def import_snapshots(snapshot_dir: str, fixture_dir: str) -> int:
+    """debug 스냅샷(*_last.html*)을 fixture_dir 에 imdb_<ttid> / rt_<slug> 이름으로 복사."""
+    os.makedirs(fixture_dir, exist_ok=True)
+    n = 0
+    for path in sorted(glob.glob(os.path.join(snapshot_dir, "*_last.html*"))):
+        name = os.path.basename(path)
+        m = _IMDB_SNAPSHOT_RE.match(name)
+        if m:
+            dest = f"imdb_{m.group(1)}{m.group(2)}"
+        else:
+            m = _RT_SNAPSHOT_RE.match(name)
+            if not m:
+                continue
+            dest = f"rt_{m.group(1)}{m.group(2)}"
+        shutil.copyfile(path, os.path.join(fixture_dir, dest))
+        print(f"[BENCH] fixture {name} → {dest}")
+        n += 1
+    return n
+
+
+def build_fixture(html: str, site: str, page_size: int) -> Tuple[str, List[str]]:
+    """
+    스냅샷 HTML → (첫 페이지 HTML, 더보기로 붙일 카드 HTML 목록).
+    첫 페이지의 스크립트(_MORE_JS)는 재생 서버가 주소를 알 때 넣는다.
+    """
+    doc = lxml.html.fromstring(html)
+
+    # 원본 스크립트 / 외부 리소스 제거 (실행마다 같은 페이지, 실제 사이트 접속 없음)
+    for el in doc.xpath("//script | //link | //iframe | //noscript"):
+        el.drop_tree()
+    for el in doc.xpath("//*[@src or @srcset]"):
+        el.attrib.pop("src", None)
+        el.attrib.pop("srcset", None)
+
+    cards = []
+    for card in doc.xpath(_CARD_XPATHS[site]):
+        # bounded DOM 으로 비워진 채 저장된 카드는 버린다
+        pruned = card.get("data-miner-pruned") is not None
+        if pruned or not card.text_content().strip():
+            card.drop_tree()
+            continue
+        card.attrib.pop("data-miner-seen", None)
+        cards.append(card)
+    if not cards:
+        raise ValueError("리뷰 카드 없음")
+
+    container = cards[0].getparent()
+    container.set("data-replay-cards", "1")
+    rest = cards[page_size:]
+    fragments = [
+        lxml.html.tostring(c, encoding="unicode", with_tail=False) for c in rest
+    ]
+    for card in rest:
+        card.drop_tree()
+
+    for el in doc.xpath(_MORE_BUTTON_XPATHS[site]):
+        el.drop_tree()
+    button = lxml.html.fragment_fromstring(_MORE_BUTTON_HTML[site])
+    if not fragments:
+        if site == "IMDB":
+            button = None
+        else:
+            button.set("hidden", "")
+    if button is not None:
+        container.addnext(button)
+
+    if site == "RT":
+        for el in doc.xpath("//button[contains(normalize-space(.), 'Continue')]"):
+            el.drop_tree()
+        body = doc.find("body") if doc.tag == "html" else doc
+        body.insert(0, lxml.html.fragment_fromstring(_RT_BANNER_HTML))
+
+    page = lxml.html.tostring(doc, encoding="unicode", doctype="<!DOCTYPE html>")
+    return page, fragments
+
+
+def load_fixtures(fixture_dir: str, page_sizes: Dict[str, int]) -> List[Dict]:
+    """fixture_dir 의 imdb_<ttid>.html* / rt_<slug>.html* 을 build_fixture 로 준비."""
+    from imdb_reviews_selenium import IMDB_TARGETS
+    from rt_reviews_selenium import RT_TARGETS, _slugify
+
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html*"))):
+        m = _FIXTURE_RE.match(os.path.basename(path))
+        if not m:
+            continue
+        site = m.group(1).upper()
+        key = m.group(2)
+        if site == "IMDB":
+            target = next((t for t in IMDB_TARGETS if t["ttid"] == key), None)
+        else:
+            target = next(
+                (t for t in RT_TARGETS if _slugify(t["title_en"]) == key), None
+            )
+        if target is None:
+            target = {"title_ko": key, "title_en": key, "year": 0, "ttid": key}
+        try:
+            page, fragments = build_fixture(
+                read_snapshot(path), site, page_sizes[site]
+            )
+        except ValueError as e:
+            print(f"[BENCH] {path}: {e}, 스킵")
+            continue
+        fixtures.append(
+            {
+                "site": site,
+                "key": key,
+                "target": target,
+                "page": page,
+                "fragments": fragments,
+                "page_size": page_sizes[site],
+            }
+        )
+        print(f"[BENCH] fixture {site}:{key} – 더보기로 붙일 카드 {len(fragments)}개")
+    return fixtures
+
+
+# =========================================================
+# 2. 재생 서버
+# =========================================================
+
+def make_fixture_server(
+    fixtures: List[Dict],
+    latency: float = 0.0,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> ThreadingHTTPServer:
+    """
+    fixture 를 서빙하는 로컬 서버. port=0 이면 빈 포트.
+      GET /title/<ttid>/reviews          IMDb 첫 페이지
+      GET /rt/<slug>/reviews             RT 첫 페이지
+      GET /__replay/more/<site>/<key>    ?offset=N → {"html": ..., "next": N' | null}
+    더보기 요청은 latency 초만큼 늦게 응답한다 (네트워크 왕복 흉내).
+    요청 시각(perf_counter)은 server.hits[(site, key)] 에 쌓인다.
+    """
+    by_key = {(fx["site"], fx["key"]): fx for fx in fixtures}
+    hits: Dict[Tuple[str, str], List[float]] = {}
+    hits_lock = threading.Lock()
+
+    def _page_for(fx: Dict) -> str:
+        more_url = f"/__replay/more/{fx['site']}/{fx['key']}"
+        script = _MORE_JS % {
+            "offset": 0,
+            "more_url": more_url,
+            "done": _MORE_DONE_JS[fx["site"]],
+        }
+        return fx["page"].replace("</body>", f"<script>{script}</script></body>", 1)
+
+    pages = {k: _page_for(fx) for k, fx in by_key.items()}
+
+    class _Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: bytes, ctype: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _hit(self, k: Tuple[str, str]) -> None:
+            with hits_lock:
+                hits.setdefault(k, []).append(time.perf_counter())
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            parts = [p for p in url.path.split("/") if p]
+
+            is_page = len(parts) == 3 and parts[2] == "reviews"
+            if is_page and parts[0] in ("title", "rt"):
+                k = ("IMDB" if parts[0] == "title" else "RT", parts[1])
+                if k in pages:
+                    self._hit(k)
+                    self._send(
+                        200, pages[k].encode("utf-8"), "text/html; charset=utf-8"
+                    )
+                    return
+
+            if len(parts) == 4 and parts[:2] == ["__replay", "more"]:
+                fx = by_key.get((parts[2], parts[3]))
+                if fx is not None:
+                    self._hit((fx["site"], fx["key"]))
+                    if latency > 0:
+                        time.sleep(latency)
+                    offset = int((parse_qs(url.query).get("offset") or ["0"])[0])
+                    chunk = fx["fragments"][offset:offset + fx["page_size"]]
+                    nxt = offset + len(chunk)
+                    data = json.dumps(
+                        {
+                            "html": "".join(chunk),
+                            "next": nxt if nxt < len(fx["fragments"]) else None,
+                        }
+                    ).encode("utf-8")
+                    self._send(200, data, "application/json")
+                    return
+
+            self._send(404, b"", "text/plain")
+
+        def log_message(self, fmt, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.hits = hits
+    return server
+
+
+# =========================================================
+# 3. 측정
+# =========================================================
+
+class _RssSampler:
+    """크롤 도중 interval 초마다 브라우저 프로세스 트리 RSS 를 재서 최대값을 보관."""
+
+    def __init__(self, driver, interval: float = 0.2) -> None:
+        self.driver = driver
+        self.interval = interval
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while True:
+            rss = browser_rss_bytes(self.driver)
+            if rss is None:
+                return
+            self.peak = rss if self.peak is None else max(self.peak, rss)
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self) -> "_RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def bench_fixture(
+    server: ThreadingHTTPServer, fx: Dict, args: argparse.Namespace
+) -> Dict[str, float]:
+    """fixture 하나를 새 headless 드라이버로 한 번 크롤링하고 지표를 돌려준다."""
+    base_url = "http://%s:%d" % server.server_address[:2]
+    k = (fx["site"], fx["key"])
+    server.hits.pop(k, None)
+
+    if fx["site"] == "IMDB":
+        from imdb_reviews_selenium import (
+            create_driver,
+            crawl_imdb_reviews_for_title,
+        )
+    else:
+        from rt_reviews_selenium import (
+            create_driver,
+            crawl_rt_audience_reviews_for_target,
+        )
+
+    driver = create_driver(headless=True)
+    try:
+        with _RssSampler(driver) as sampler:
+            t0 = time.perf_counter()
+            if fx["site"] == "IMDB":
+                t = fx["target"]
+                rows = crawl_imdb_reviews_for_title(
+                    driver,
+                    t["title_ko"],
+                    t["title_en"],
+                    t["year"],
+                    fx["key"],
+                    max_reviews=args.max_reviews,
+                    max_clicks=args.max_clicks,
+                    extraction=args.extraction,
+                    bounded_dom=args.bounded_dom,
+                    base_url=base_url,
+                )
+            else:
+                rt_url = f"{base_url}/rt/{fx['key']}/reviews?type=user"
+                target = dict(fx["target"], rt_url=rt_url)
+                rows = crawl_rt_audience_reviews_for_target(
+                    driver,
+                    target,
+                    max_pages=args.max_clicks + 1,
+                    extraction=args.extraction,
+                    bounded_dom=args.bounded_dom,
+                )
+            elapsed = time.perf_counter() - t0
+    finally:
+        driver.quit()
+
+    # 첫 페이지 요청부터 더보기 요청 사이 간격 = 클릭 한 번(클릭 → 새 카드 파싱 → 다음 클릭)
+    times = server.hits.get(k, [])
+    gaps_ms = [(b - a) * 1000 for a, b in zip(times, times[1:])]
+    return {
+        "reviews": float(len(rows)),
+        "seconds": elapsed,
+        "reviews_per_sec": len(rows) / elapsed if elapsed > 0 else 0.0,
+        "clicks": float(len(gaps_ms)),
+        "click_ms_p50": _percentile(gaps_ms, 0.5),
+        "click_ms_p95": _percentile(gaps_ms, 0.95),
+        "peak_rss_mb": (
+            sampler.peak / 1024 / 1024 if sampler.peak is not None else -1.0
+        ),
+    }
+
+
+def _median_run(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """reviews/sec 중앙값인 실행의 지표 (peak RSS 는 전체 최대)."""
+    ordered = sorted(runs, key=lambda r: r["reviews_per_sec"])
+    result = dict(ordered[len(ordered) // 2])
+    result["peak_rss_mb"] = max(r["peak_rss_mb"] for r in runs)
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare_results(old: Dict, new: Dict, tolerance: float) -> List[str]:
+    """이전 결과 대비 회귀한 fixture 목록 (reviews/sec 하락 / 클릭 간격 p50 증가)."""
+    regressions = []
+    for name, cur in new["results"].items():
+        prev = old.get("results", {}).get(name)
+        if prev is None:
+            continue
+        rps_ratio = (
+            cur["reviews_per_sec"] / prev["reviews_per_sec"]
+            if prev["reviews_per_sec"]
+            else 1.0
+        )
+        click_ratio = (
+            cur["click_ms_p50"] / prev["click_ms_p50"] if prev["click_ms_p50"] else 1.0
+        )
+        flag = rps_ratio < 1 - tolerance or click_ratio > 1 + tolerance
+        print(
+            f"[BENCH] {name}: reviews/s {prev['reviews_per_sec']:.1f} → "
+            f"{cur['reviews_per_sec']:.1f} (x{rps_ratio:.2f}) | "
+            f"click p50 {prev['click_ms_p50']:.0f} → {cur['click_ms_p50']:.0f} ms "
+            f"(x{click_ratio:.2f})" + ("  ⚠ 회귀" if flag else "")
+        )
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+# =========================================================
+# 4. 엔트리 포인트
+# =========================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 재생 서버 기반 크롤 벤치마크")
+    parser.add_argument("--fixtures", default=REPLAY_FIXTURE_DIR)
+    parser.add_argument(
+        "--import-snapshots",
+        metavar="DIR",
+        help="DIR 의 *_last.html* 스냅샷을 --fixtures 로 복사한 뒤 종료",
+    )
+    parser.add_argument("--site", choices=["all", "imdb", "rt"], default="all")
+    parser.add_argument(
+        "--extraction",
+        default=None,
+        help="크롤러 extraction (기본: IMDb js / RT element)",
+    )
+    parser.add_argument("--bounded-dom", action="store_true")
+    parser.add_argument("--max-reviews", type=int, default=100000)
+    parser.add_argument("--max-clicks", type=int, default=200)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=50.0,
+        help="더보기 응답 지연 (실행 간 비교를 위해 고정값)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="fixture 별 반복 (중앙값 사용)"
+    )
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="이전 결과 JSON 과 비교")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    if args.import_snapshots:
+        n = import_snapshots(args.import_snapshots, args.fixtures)
+        print(f"[BENCH] fixture {n}개 → {args.fixtures}")
+        return
+
+    fixtures = [
+        fx
+        for fx in load_fixtures(args.fixtures, REPLAY_PAGE_SIZES)
+        if args.site == "all" or fx["site"].lower() == args.site
+    ]
+    if not fixtures:
+        print(
+            f"[BENCH] {args.fixtures} 에 fixture 가 없습니다 "
+            "(--import-snapshots debug 로 준비)"
+        )
+        return
+
+    # 스냅샷 쓰기는 측정에서 뺀다
+    configure_snapshots(level="off")
+
+    server = make_fixture_server(fixtures, latency=args.latency_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print("[BENCH] 재생 서버 → http://%s:%d" % server.server_address[:2])
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for fx in fixtures:
+            name = f"{fx['site']}:{fx['key']}"
+            fx_args = argparse.Namespace(**vars(args))
+            if fx_args.extraction is None:
+                fx_args.extraction = "js" if fx["site"] == "IMDB" else "element"
+            runs = [
+                bench_fixture(server, fx, fx_args)
+                for _ in range(max(1, args.repeat))
+            ]
+            r = _median_run(runs)
+            results[name] = r
+            rss = (
+                f"{r['peak_rss_mb']:.0f} MB"
+                if r["peak_rss_mb"] >= 0
+                else "n/a (psutil 없음)"
+            )
+            print(
+                f"[BENCH] {name}: {int(r['reviews'])}개 / {r['seconds']:.1f}s = "
+                f"{r['reviews_per_sec']:.1f} reviews/s | 클릭 {int(r['clicks'])}회 "
+                f"p50 {r['click_ms_p50']:.0f} ms / p95 {r['click_ms_p95']:.0f} ms | "
+                f"peak RSS {rss}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    report = {
+        "commit": _git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "options": {
+            "extraction": args.extraction,
+            "bounded_dom": args.bounded_dom,
+            "latency_ms": args.latency_ms,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[SAVE] {args.out}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        print(f"[BENCH] 비교 기준: {args.compare} (commit {old.get('commit') or '?'})")
+        regressions = compare_results(old, report, args.tolerance)
+        if regressions:
+            print(f"[BENCH] 회귀 {len(regressions)}개: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+리뷰 row 표현별 메모리 사용량 비교 (tracemalloc).
+
+  - dict   : 예전 row (리뷰마다 title_ko / title_en / str(year) / site 를 dict 에 보관)
+  - record : review_record.ReviewRecord (__slots__ + 공유 TitleMeta + intern 된 rating/date)
+
+저장된 CSV(imdb_reviews.csv / rt_reviews.csv) 의 리뷰를 --copies 번 복제해서
+크롤러가 row 를 만드는 것과 같은 방식으로 만들고, row 당 바이트를 출력한다.
+본문 문자열은 두 방식 모두 같은 객체를 가리키게 해서 표현 차이만 잰다.
+
+사용 예:
+  python bench_row_memory.py
+  python bench_row_memory.py rt_reviews.csv --copies 20
+"""
+
+import argparse
+import csv
+import gc
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from review_record import ReviewRecord, title_meta
+
+
+def _fresh(s: str) -> str:
+    """파서가 매번 새로 만드는 문자열처럼 같은 값의 새 객체."""
+    return (s + ".")[:-1]
+
+
+def load_source(paths: List[str], copies: int) -> List[Tuple[Dict[str, str], str]]:
+    """(CSV row, 본문) 목록. 본문 객체는 두 방식이 공유한다."""
+    out = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        for _ in range(copies):
+            out.extend((r, _fresh(r["review"])) for r in rows)
+    return out
+
+
+def build_dicts(src) -> List[Dict[str, str]]:
+    rows = []
+    for r, text in src:
+        row = {
+            "title_ko": r["title_ko"],
+            "title_en": r["title_en"],
+            "year": str(int(r["year"])),
+            "rating": _fresh(r["rating"]),
+            "date": _fresh(r["date"]),
+            "review": text,
+        }
+        if r.get("site"):
+            row = {"site": r["site"], **row}
+        rows.append(row)
+    return rows
+
+
+def build_records(src) -> List[ReviewRecord]:
+    rows = []
+    for r, text in src:
+        meta = title_meta(
+            r.get("site"), r["title_ko"], r["title_en"], int(r["year"])
+        )
+        rows.append(
+            ReviewRecord(meta, _fresh(r["rating"]), _fresh(r["date"]), text)
+        )
+    return rows
+
+
+def measure(build: Callable, src) -> Tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    rows = build(src)
+    gc.collect()
+    cur, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cur - base, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "csvs", nargs="*", default=["imdb_reviews.csv", "rt_reviews.csv"]
+    )
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+
+    src = load_source(args.csvs, args.copies)
+    n = len(src)
+    if not n:
+        print("[BENCH] row 없음")
+        return
+
+    results = {}
+    for name, build in (("dict", build_dicts), ("record", build_records)):
+        nbytes, rows = measure(build, src)
+        results[name] = nbytes
+        print(
+            f"[BENCH] {name:6s}: {n}개 row, 본문 제외 {nbytes / 1024 / 1024:.1f} MB "
+            f"({nbytes / n:.0f} B/row)"
+        )
+        del rows
+
+    print(f"[BENCH] record / dict = {results['record'] / results['dict']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+미리 띄워 두는 크롬 드라이버 풀.
+
+webdriver.Chrome(...) 한 번에 몇 초가 걸리고, 워커 시작 / watchdog 재시작 / 주기적 교체
+때마다 그 시간을 크롤 스레드가 그대로 기다린다. BrowserPool 은
+
+  - start() 하자마자 드라이버 warm + spares 개를 백그라운드 스레드에서 동시에 띄우고
+    warm_fn(driver) 가 있으면 그것까지 끝내 둔다 (크롤러 main 들은 쓰지 않는다:
+    사이트 요청은 타이틀 안에서만, limiter 속도 안에서 나가게).
+    main 은 그동안 델타 인덱스 / 체크포인트 / DB 를 준비한다
+  - acquire() 는 준비된 드라이버를 바로 내주고, 예비가 spares 개보다 적어지면
+    다음 예비를 백그라운드에서 띄운다 (교체 / 재시작이 거의 즉시)
+  - release() 는 드라이버를 끄지 않고 탭 / 페이지 상태만 비워서 다시 풀에 넣는다
+  - discard() 는 종료(또는 강제 종료)를 백그라운드에서 하고 바로 반환
+
+쿠키는 기본적으로 지우지 않는다: 같은 드라이버가 타이틀을 이어서 처리할 때처럼
+동의 쿠키 / 프로필 쿠키(browser_profile)를 유지해야 배너 대기가 없다.
+
+풀은 실행(프로세스) 하나 안에서만 산다: 줄어드는 것은 그 실행 안의 첫 드라이버 대기와
+재시작 / 교체 대기이고, 실행이 끝나면 close() 가 드라이버를 모두 종료한다.
+다음 실행은 크롬을 다시 띄우며, 실행 사이에 남는 것은 browser_profile 의
+디스크 캐시 / 쿠키 / 동의 기록뿐이다.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from driver_supervisor import retire_driver
+
+
+class BrowserPool:
+    """
+    create_driver_fn : 새 드라이버를 만드는 함수
+    warm             : start() 때 띄울 드라이버 수 (보통 워커 수)
+    spares           : 그 외에 늘 준비해 둘 예비 드라이버 수
+    warm_fn          : 띄운 직후 한 번 실행 (예: 첫 화면 이동). 실패해도 드라이버는 쓴다
+    clear_cookies    : release() 때 쿠키까지 지울지
+    """
+
+    def __init__(
+        self,
+        create_driver_fn: Callable[[], object],
+        warm: int = 1,
+        spares: int = 0,
+        warm_fn: Optional[Callable[[object], None]] = None,
+        clear_cookies: bool = False,
+        label: str = "POOL",
+    ) -> None:
+        self.create_driver_fn = create_driver_fn
+        self.warm = warm
+        self.spares = spares
+        self.warm_fn = warm_fn
+        self.clear_cookies = clear_cookies
+        self.label = label
+        self._ready: Deque[object] = deque()
+        self._launching = 0
+        self._launched = 0
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._threads: List[threading.Thread] = []
+        self._cond = threading.Condition()
+
+    # ---- 드라이버 띄우기 ----
+
+    def start(self) -> "BrowserPool":
+        with self._cond:
+            for _ in range(self.warm + self.spares):
+                self._launch_locked()
+        return self
+
+    def _launch_locked(self) -> None:
+        if self._closed:
+            return
+        self._launching += 1
+        self._launched += 1
+        th = threading.Thread(
+            target=self._launch,
+            args=(self._launched,),
+            name=f"{self.label}-launch-{self._launched}",
+            daemon=True,
+        )
+        self._threads.append(th)
+        th.start()
+
+    def _launch(self, n: int) -> None:
+        t0 = time.perf_counter()
+        driver = None
+        try:
+            driver = self.create_driver_fn()
+            if self.warm_fn is not None:
+                try:
+                    self.warm_fn(driver)
+                except Exception as e:
+                    print(f"[{self.label}] 드라이버 #{n} 예열 실패 (그대로 사용): {e}")
+        except Exception as e:
+            print(f"[{self.label}] 드라이버 #{n} 생성 실패: {e}")
+            with self._cond:
+                self._launching -= 1
+                self._error = e
+                self._cond.notify_all()
+            return
+
+        with self._cond:
+            self._launching -= 1
+            closed = self._closed
+            if not closed:
+                self._ready.append(driver)
+            self._cond.notify_all()
+        if closed:
+            retire_driver(driver)
+            return
+        print(
+            f"[{self.label}] 드라이버 #{n} 준비 완료 "
+            f"({time.perf_counter() - t0:.1f}초)"
+        )
+
+    # ---- 빌려주기 / 돌려받기 ----
+
+    def acquire(self) -> object:
+        """
+        준비된 드라이버 하나. 준비 중인 것만 있으면 기다리고, 아무것도 없으면 새로 띄운다.
+        띄우는 중인 드라이버가 모두 실패하면 마지막 생성 예외를 던진다.
+        """
+        t0 = time.perf_counter()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"[{self.label}] 닫힌 풀")
+            if not self._ready and self._launching == 0:
+                self._launch_locked()
+            while not self._ready:
+                if self._launching == 0:
+                    raise self._error or RuntimeError(f"[{self.label}] 드라이버 없음")
+                self._cond.wait()
+            driver = self._ready.popleft()
+            # 예비가 모자라면 다음 것을 미리 띄운다
+            for _ in range(self.spares - len(self._ready) - self._launching):
+                self._launch_locked()
+        waited = time.perf_counter() - t0
+        if waited >= 0.1:
+            print(f"[{self.label}] 드라이버 준비를 {waited:.1f}초 기다림")
+        return driver
+
+    def _reset(self, driver) -> bool:
+        """탭 하나만 남기고 about:blank 로. 실패하면 False (버린다)."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get("about:blank")
+            if self.clear_cookies:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            return True
+        except Exception:
+            return False
+
+    def release(self, driver) -> None:
+        """다 쓴 드라이버를 끄지 않고 상태만 비워서 풀에 되돌린다."""
+        if not self._reset(driver):
+            self.discard(driver, clean=False)
+            return
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._ready.append(driver)
+                self._cond.notify_all()
+        if closed:
+            retire_driver(driver)
+
+    def discard(self, driver, clean: bool = True) -> None:
+        """드라이버 종료를 백그라운드에서 (교체하는 워커는 기다리지 않는다)."""
+        th = threading.Thread(
+            target=retire_driver,
+            args=(driver, clean),
+            name=f"{self.label}-retire",
+            daemon=True,
+        )
+        with self._cond:
+            self._threads.append(th)
+        th.start()
+
+    def close(self) -> None:
+        """띄우는 중인 것까지 기다린 뒤 남은 드라이버를 모두 종료."""
+        with self._cond:
+            self._closed = True
+            ready, self._ready = list(self._ready), deque()
+            threads = list(self._threads)
+        for driver in ready:
+            retire_driver(driver)
+        for th in threads:
+            th.join()
@@ -0,0 +1,180 @@
+"""
+실행마다 재사용하는 크롬 프로필 (user-data-dir).
+
+새 프로필로 띄우면 매번 정적 리소스(JS / CSS / 폰트)를 처음부터 받고, RT 는 타이틀마다
+쿠키/약관 배너를 최대 5초씩 기다린다. BrowserProfiles 는 root 아래에
+
+  seed/      : 마지막으로 정상 종료된 프로필의 쿠키 / 설정 / 동의 기록 (캐시 제외)
+  worker-N/  : 드라이버 하나가 쓰는 프로필. HTTP 디스크 캐시까지 실행 간에 남는다
+
+를 두고, 드라이버를 만들 때 빈 슬롯 하나를 빌려 준다 (크롬은 user-data-dir 하나를
+두 프로세스가 같이 쓰지 못한다). 처음 쓰는 슬롯은 seed 를 복사해서 시작하고,
+드라이버를 정상 종료하면 그 프로필로 seed 를 갱신한다. watchdog 이 죽인 드라이버의
+프로필은 쓰다 만 파일이 있을 수 있어서 seed 로 올리지 않는다.
+
+동의 기록: 배너를 처리한 뒤 mark_consent(driver, "rt") 로 프로필에 남겨 두면
+다음 드라이버 / 다음 실행부터 has_consent() 가 참이라 배너 대기를 건너뛸 수 있다.
+프로필 없는 드라이버도 같은 드라이버 안에서는 기억한다 (browser_pool 예열 때 처리한 배너).
+
+root 하나는 한 프로세스만 쓴다 (크롤러마다 다른 root: chrome_profile/imdb, chrome_profile/rt).
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import weakref
+from typing import List, Optional, Set
+
+
+# 크롬이 실행 중에 만드는 잠금 파일. 죽은 실행이 남긴 것은 지워야 다시 뜬다
+_LOCK_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile")
+# seed 로 올리지 않는 캐시 디렉터리 (worker 프로필에만 남긴다)
+_CACHE_DIRS = (
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+    "DawnCache",
+    "CacheStorage",
+    "Crashpad",
+)
+CONSENT_FILE = "miner_consent.json"
+
+# driver → (BrowserProfiles, 프로필 경로)
+_driver_profiles: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# driver → 이 드라이버에서 동의를 처리한 site 집합
+_session_consent: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class BrowserProfiles:
+    """
+    root     : 프로필들을 둘 디렉터리
+    cache_mb : 프로필마다 HTTP 디스크 캐시 상한 (--disk-cache-size)
+    """
+
+    def __init__(self, root: str, cache_mb: int = 256) -> None:
+        self.root = root
+        self.cache_mb = cache_mb
+        self._lock = threading.Lock()
+        self._in_use: Set[int] = set()
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def seed_dir(self) -> str:
+        return os.path.join(self.root, "seed")
+
+    def acquire(self) -> str:
+        """빈 worker 슬롯의 프로필 경로 (없으면 seed 를 복사해서 만든다)."""
+        with self._lock:
+            slot = 0
+            while slot in self._in_use:
+                slot += 1
+            self._in_use.add(slot)
+        path = os.path.join(self.root, f"worker-{slot}")
+        try:
+            if not os.path.isdir(path):
+                if os.path.isdir(self.seed_dir):
+                    shutil.copytree(
+                        self.seed_dir,
+                        path,
+                        ignore=shutil.ignore_patterns(*_LOCK_FILES),
+                        symlinks=True,
+                    )
+                    print(f"[PROFILE] {path} ← seed 복사 (쿠키 / 동의 기록)")
+                else:
+                    os.makedirs(path)
+            for name in _LOCK_FILES:
+                lock_path = os.path.join(path, name)
+                # SingletonLock 은 깨진 심볼릭 링크라 exists 로는 안 보인다
+                if os.path.lexists(lock_path):
+                    os.remove(lock_path)
+        except Exception:
+            with self._lock:
+                self._in_use.discard(slot)
+            raise
+        return path
+
+    def chrome_args(self, path: str) -> List[str]:
+        return [
+            f"--user-data-dir={os.path.abspath(path)}",
+            f"--disk-cache-size={self.cache_mb * 1024 * 1024}",
+        ]
+
+    def attach(self, driver, path: str) -> None:
+        """driver 가 path 프로필을 쓴다고 기록 (release_driver_profile / has_consent 용)."""
+        _driver_profiles[driver] = (self, path)
+
+    def release(self, path: str, promote: bool = True) -> None:
+        """드라이버를 닫은 뒤 슬롯을 돌려준다. promote=True 면 이 프로필로 seed 갱신."""
+        slot = int(os.path.basename(path).rsplit("-", 1)[1])
+        try:
+            if promote:
+                self._promote(path, slot)
+        except OSError as e:
+            print(f"[PROFILE] seed 갱신 실패 ({path}): {e}")
+        finally:
+            with self._lock:
+                self._in_use.discard(slot)
+
+    def _promote(self, path: str, slot: int) -> None:
+        # 복사는 lock 밖에서, 교체(rename 두 번)만 lock 안에서
+        tmp = f"{self.seed_dir}.tmp-{slot}"
+        old = f"{self.seed_dir}.old-{slot}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.copytree(
+            path,
+            tmp,
+            ignore=shutil.ignore_patterns(*_LOCK_FILES, *_CACHE_DIRS),
+            symlinks=True,
+        )
+        with self._lock:
+            if os.path.isdir(self.seed_dir):
+                os.rename(self.seed_dir, old)
+            os.rename(tmp, self.seed_dir)
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def profile_dir(driver) -> Optional[str]:
+    entry = _driver_profiles.get(driver)
+    return entry[1] if entry is not None else None
+
+
+def release_driver_profile(driver, clean: bool = True) -> None:
+    """드라이버를 닫은 뒤 호출. 프로필 없는 드라이버면 아무것도 안 한다."""
+    entry = _driver_profiles.pop(driver, None)
+    if entry is not None:
+        profiles, path = entry
+        profiles.release(path, promote=clean)
+
+
+def _read_consent(path: str) -> dict:
+    try:
+        with open(os.path.join(path, CONSENT_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def has_consent(driver, site: str) -> bool:
+    """이 드라이버(또는 그 프로필)에 site 의 쿠키/약관 동의가 기록돼 있는지."""
+    if site in _session_consent.get(driver, ()):
+        return True
+    path = profile_dir(driver)
+    return path is not None and site in _read_consent(path)
+
+
+def mark_consent(driver, site: str) -> None:
+    _session_consent.setdefault(driver, set()).add(site)
+    path = profile_dir(driver)
+    if path is None:
+        return
+    consent = _read_consent(path)
+    if site in consent:
+        return
+    consent[site] = round(time.time())
+    with open(os.path.join(path, CONSENT_FILE), "w", encoding="utf-8") as f:
+        json.dump(consent, f)
@@ -0,0 +1,188 @@
+"""
+타이틀별 크롤 진행 상황 체크포인트.
+
+키(IMDb ttid / RT rt_url)마다 아래 상태를 기록한다.
+
+  seen     : 이미 수집한 리뷰 id (IMDb 리뷰 URL / RT (date, 본문 해시))
+  progress : 도달한 '25 more' / Load More 클릭 수
+  cursor   : HTTP 페이지네이션 커서 (imdb_http)
+  done     : 타이틀 완료 여부
+
+재시작한 실행은 done 인 타이틀을 건너뛰고, 나머지는 progress 까지 파싱 없이
+클릭만 해서 빨리 감은 뒤 seen 에 없는 리뷰부터 이어서 수집한다.
+
+저장은 append-only 저널(JSON Lines): update() 는 그 배치에서 새로 본 id 와
+progress / cursor 만 한 줄 덧붙이고, 문서 전체를 다시 쓰지 않는다.
+  - 줄마다 spool 과 저널을 OS 버퍼까지만 flush (프로세스가 죽어도 둘이 어긋나지 않는다)
+  - fsync 는 sync_interval 초마다 / 타이틀 완료(mark_done) 때만, spool 을 먼저
+    (row_sink 의 --fsync-interval 과 같은 간격: 전원이 나가면 잃을 수 있는 범위가 같다)
+로드할 때 저널을 재생하고, 줄이 많이 쌓였으면 한 번 압축해서 다시 쓴다.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, IO, Iterable, List, Optional, Set, Tuple
+
+
+def _empty_state() -> Dict:
+    return {"seen": [], "progress": 0, "cursor": None, "done": False}
+
+
+class CheckpointStore:
+    """
+    before_save(key, durable): 저널에 key 의 줄을 쓰기 직전에 호출.
+    row 출력(spool)을 먼저 내보내서, 체크포인트가 파일에 없는 row 를 '수집함'으로
+    기록하는 일이 없게 하는 용도. durable=True 면 fsync 까지 (CsvSpoolWriter.sync).
+    sync_interval: 저널 fsync 최소 간격(초)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        before_save: Optional[Callable[[str, bool], None]] = None,
+        sync_interval: float = 5.0,
+    ) -> None:
+        self.path = path
+        self.before_save = before_save
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict] = {}
+        self._dirty: Set[str] = set()  # 마지막 fsync 이후 줄을 쓴 key
+        self._last_sync = time.monotonic()
+        self._f: Optional[IO[str]] = None
+
+        if os.path.exists(path):
+            try:
+                n_lines, torn = self._replay()
+                print(f"[CHECKPOINT] {path} 에서 {len(self._state)}개 타이틀 상태 로드")
+                # 쓰다 만 줄이 남아 있으면 그 뒤에 덧붙일 수 없으니 같이 다시 쓴다
+                if torn or n_lines > len(self._state):
+                    self._compact()
+            except OSError as e:
+                print(f"[CHECKPOINT] {path} 로드 실패, 새로 시작: {e}")
+                self._state = {}
+
+    # ---- 로드 ----
+
+    def _replay(self) -> Tuple[int, bool]:
+        n_lines, torn = 0, False
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                    key = rec["key"]
+                except (ValueError, KeyError, TypeError):
+                    # 쓰다 만 마지막 줄 (크래시)
+                    torn = True
+                    continue
+                n_lines += 1
+                st = self._state.setdefault(key, _empty_state())
+                st["seen"].extend(rec.get("seen") or [])
+                for field in ("progress", "cursor", "done"):
+                    if field in rec:
+                        st[field] = rec[field]
+        return n_lines, torn
+
+    def _compact(self) -> None:
+        """key 마다 한 줄로 다시 쓴다 (임시 파일 + os.replace)."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, st in self._state.items():
+                f.write(self._line({"key": key, **st}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    # ---- 조회 ----
+
+    def get(self, key: str) -> Dict:
+        """key 상태의 복사본 (없으면 빈 상태)."""
+        with self._lock:
+            st = self._state.get(key) or _empty_state()
+            return {**st, "seen": list(st.get("seen") or [])}
+
+    def is_done(self, key: str) -> bool:
+        with self._lock:
+            return bool((self._state.get(key) or {}).get("done"))
+
+    def all_done(self, keys: List[str]) -> bool:
+        return all(self.is_done(k) for k in keys)
+
+    # ---- 기록 ----
+
+    def update(
+        self,
+        key: str,
+        new_seen: Iterable = (),
+        progress: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> None:
+        """seen 에 new_seen 을 더하고 progress / cursor 를 갱신 (저널에 한 줄)."""
+        seen = [list(k) if isinstance(k, tuple) else k for k in new_seen]
+        rec: Dict = {"key": key, "seen": seen}
+        with self._lock:
+            st = self._state.setdefault(key, _empty_state())
+            st["seen"].extend(seen)
+            if progress is not None:
+                st["progress"] = rec["progress"] = progress
+            if cursor is not None:
+                st["cursor"] = rec["cursor"] = cursor
+        self._append(key, rec, durable=False)
+
+    def mark_done(self, key: str) -> None:
+        """타이틀 완료. 타이틀 경계라서 바로 fsync 한다."""
+        with self._lock:
+            self._state.setdefault(key, _empty_state())["done"] = True
+        self._append(key, {"key": key, "done": True}, durable=True)
+
+    def close(self) -> None:
+        """남은 줄을 fsync 하고 저널을 닫는다 (실행 끝, clear 하지 않을 때)."""
+        self._sync()
+        with self._lock:
+            if self._f is not None:
+                self._f.close()
+                self._f = None
+
+    def clear(self) -> None:
+        """전체 실행이 끝났을 때 체크포인트 파일 삭제."""
+        with self._lock:
+            self._state = {}
+            self._dirty.clear()
+            if self._f is not None:
+                self._f.close()
+                self._f = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    @staticmethod
+    def _line(rec: Dict) -> str:
+        return json.dumps(rec, ensure_ascii=False) + "\n"
+
+    def _append(self, key: str, rec: Dict, durable: bool) -> None:
+        # spool 이 먼저: 저널 줄이 가리키는 row 는 항상 spool 에 먼저 나가 있다
+        if self.before_save is not None:
+            self.before_save(key, False)
+        with self._lock:
+            if self._f is None:
+                self._f = open(self.path, "a", encoding="utf-8")
+            self._f.write(self._line(rec))
+            self._f.flush()
+            self._dirty.add(key)
+            due = time.monotonic() - self._last_sync >= self.sync_interval
+        if durable or due:
+            self._sync()
+
+    def _sync(self) -> None:
+        with self._lock:
+            keys, self._dirty = self._dirty, set()
+            self._last_sync = time.monotonic()
+        if not keys:
+            return
+        if self.before_save is not None:
+            for key in keys:
+                self.before_save(key, True)
+        with self._lock:
+            if self._f is not None:
+                os.fsync(self._f.fileno())
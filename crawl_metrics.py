@@ -0,0 +1,309 @@
+"""
+크롤 단계별 타이머 / 카운터와 구조화된 출력.
+
+  - title_metrics("IMDB", title_en) 블록 안에서 stage("navigate") / count("clicks") 를
+    쓰면 타이틀별로 단계 시간·호출 수와 카운터가 쌓인다
+  - events_path 를 주면 단계 / 타이틀 시작·종료마다 JSON 한 줄 (jq, pandas 로 분석)
+  - prom_path 를 주면 타이틀이 끝날 때마다 전체 요약을 Prometheus textfile 형식으로
+    원자적으로 다시 쓴다 (node_exporter textfile collector 가 읽는 .prom)
+  - log(msg, LOG_DEBUG) 는 verbosity 가 낮으면 출력 자체를 건너뛴다
+    (클릭 / 페이지마다 찍던 진행 로그는 LOG_DEBUG)
+
+현재 타이틀은 스레드 로컬이라 병렬 워커끼리 섞이지 않고, row_sink 처럼 크롤 함수
+밖의 코드도 같은 스레드에서 count() 로 현재 타이틀에 기록할 수 있다.
+다른 스레드(백그라운드 쓰기)는 attach_title(current_title()) 로 같은 타이틀에 붙는다.
+타이틀 블록 밖에서 부른 stage() / count() 는 아무것도 하지 않는다.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+LOG_INFO = 1  # 타이틀 단위 진행 (기본)
+LOG_DEBUG = 2  # 클릭 / 페이지마다
+
+# Prometheus HELP 문구 (없는 카운터는 이름 그대로)
+_COUNTER_HELP = {
+    "reviews": "수집한 리뷰 row 수",
+    "pages": "로드한 리뷰 페이지 수 (첫 페이지 + 더보기)",
+    "clicks": "더보기 / Load More 클릭 수",
+    "rows_written": "spool CSV 에 쓴 row 수",
+    "bytes_written": "spool CSV 에 쓴 바이트 수 (utf-8)",
+    "crosscheck_mismatch": "RT 네트워크 모드의 API/DOM 대조 불일치 수",
+}
+
+
+def _label_value(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**kv: str) -> str:
+    return "{" + ",".join(f'{k}="{_label_value(v)}"' for k, v in kv.items()) + "}"
+
+
+class TitleMetrics:
+    """
+    타이틀 하나의 단계 시간 / 카운터 / 대기 시간.
+    크롤 스레드와 그 타이틀의 백그라운드 쓰기 스레드가 같이 기록한다.
+    """
+
+    def __init__(self, registry: "CrawlMetrics", site: str, title: str) -> None:
+        self.registry = registry
+        self.site = site
+        self.title = title
+        self.counters: Dict[str, float] = {}
+        self.stages: Dict[str, List[float]] = {}  # name → [호출 수, 초]
+        self.waits: Dict[str, float] = {}
+        self.timeouts: Dict[str, int] = {}
+        self.seconds = 0.0
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def count(self, name: str, n: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            with self._lock:
+                st = self.stages.setdefault(name, [0, 0.0])
+                st[0] += 1
+                st[1] += dt
+            self.registry.emit(
+                "stage",
+                site=self.site,
+                title=self.title,
+                stage=name,
+                seconds=round(dt, 6),
+            )
+
+    def add_waits(self, clock) -> None:
+        """WaitClock 의 종류별 대기 시간 / 타임아웃 수를 옮겨 담는다."""
+        for kind, sec in clock.by_kind.items():
+            self.waits[kind] = self.waits.get(kind, 0.0) + sec
+        for kind, n in clock.timeouts.items():
+            self.timeouts[kind] = self.timeouts.get(kind, 0) + n
+
+    def as_dict(self) -> Dict:
+        return {
+            "site": self.site,
+            "title": self.title,
+            "seconds": round(self.seconds, 3),
+            "counters": dict(self.counters),
+            "stages": {
+                k: {"calls": int(v[0]), "seconds": round(v[1], 6)}
+                for k, v in self.stages.items()
+            },
+            "waits": {k: round(v, 6) for k, v in self.waits.items()},
+            "timeouts": dict(self.timeouts),
+        }
+
+
+class CrawlMetrics:
+    """
+    events_path : JSON-lines 이벤트 파일 (append). None 이면 이벤트를 쓰지 않는다.
+    prom_path   : Prometheus textfile 경로. None 이면 쓰지 않는다.
+    verbosity   : log() 출력 상한 (LOG_INFO / LOG_DEBUG)
+    """
+
+    def __init__(
+        self,
+        events_path: Optional[str] = None,
+        prom_path: Optional[str] = None,
+        verbosity: int = LOG_INFO,
+    ) -> None:
+        self.events_path = events_path
+        self.prom_path = prom_path
+        self.verbosity = verbosity
+        self._lock = threading.Lock()
+        self._events = None
+        self._done: List[TitleMetrics] = []
+        self._local = threading.local()
+
+    # ---- 출력 ----
+
+    def log(self, msg: str, level: int = LOG_INFO) -> None:
+        if level <= self.verbosity:
+            print(msg)
+
+    def emit(self, event: str, **fields) -> None:
+        if self.events_path is None:
+            return
+        line = json.dumps(
+            {"ts": round(time.time(), 3), "event": event, **fields},
+            ensure_ascii=False,
+        )
+        with self._lock:
+            if self._events is None:
+                self._events = open(self.events_path, "a", encoding="utf-8")
+            self._events.write(line + "\n")
+
+    # ---- 타이틀 블록 ----
+
+    def current(self) -> Optional[TitleMetrics]:
+        return getattr(self._local, "title", None)
+
+    @contextmanager
+    def attach(self, tm: Optional[TitleMetrics]) -> Iterator[None]:
+        """현재 스레드의 기록 대상을 잠시 tm 으로 (다른 스레드가 연 타이틀)."""
+        prev = self.current()
+        self._local.title = tm
+        try:
+            yield
+        finally:
+            self._local.title = prev
+
+    @contextmanager
+    def title(self, site: str, title: str) -> Iterator[TitleMetrics]:
+        tm = TitleMetrics(self, site, title)
+        prev = self.current()
+        self._local.title = tm
+        self.emit("title_start", site=site, title=title)
+        try:
+            yield tm
+        finally:
+            self._local.title = prev
+            tm.seconds = time.perf_counter() - tm._t0
+            with self._lock:
+                self._done.append(tm)
+            self.emit("title_done", **tm.as_dict())
+            self.write_prometheus()
+
+    # ---- Prometheus textfile ----
+
+    def _prometheus_text(self) -> str:
+        with self._lock:
+            done = list(self._done)
+
+        # 같은 (site, title) 이 여러 번 돌았으면 (재시도 등) 합친다
+        counters: Dict[str, Dict[Tuple[str, str], float]] = {}
+        stage_calls: Dict[Tuple[str, str, str], float] = {}
+        stage_secs: Dict[Tuple[str, str, str], float] = {}
+        waits: Dict[Tuple[str, str, str], float] = {}
+        timeouts: Dict[Tuple[str, str, str], float] = {}
+        seconds: Dict[Tuple[str, str], float] = {}
+        for tm in done:
+            key = (tm.site, tm.title)
+            seconds[key] = seconds.get(key, 0.0) + tm.seconds
+            for name, v in tm.counters.items():
+                per = counters.setdefault(name, {})
+                per[key] = per.get(key, 0) + v
+            for name, (calls, secs) in tm.stages.items():
+                k = key + (name,)
+                stage_calls[k] = stage_calls.get(k, 0) + calls
+                stage_secs[k] = stage_secs.get(k, 0.0) + secs
+            for kind, v in tm.waits.items():
+                k = key + (kind,)
+                waits[k] = waits.get(k, 0.0) + v
+            for kind, v in tm.timeouts.items():
+                k = key + (kind,)
+                timeouts[k] = timeouts.get(k, 0) + v
+
+        out: List[str] = []
+
+        def _family(name: str, help_: str, samples, label: str = "") -> None:
+            if not samples:
+                return
+            out.append(f"# HELP {name} {help_}")
+            out.append(f"# TYPE {name} counter")
+            for k, v in sorted(samples.items()):
+                labels = {"site": k[0], "title": k[1]}
+                if label:
+                    labels[label] = k[2]
+                out.append(f"{name}{_labels(**labels)} {float(v)!r}")
+
+        for cname in sorted(counters):
+            _family(
+                f"miner_{cname}_total", _COUNTER_HELP.get(cname, cname), counters[cname]
+            )
+        _family("miner_title_seconds_total", "타이틀 크롤 시간(초)", seconds)
+        _family("miner_stage_seconds_total", "단계별 누적 시간(초)", stage_secs, "stage")
+        _family("miner_stage_calls_total", "단계별 호출 수", stage_calls, "stage")
+        _family("miner_wait_seconds_total", "종류별 명시적 대기 시간(초)", waits, "kind")
+        _family("miner_wait_timeouts_total", "종류별 대기 타임아웃 수", timeouts, "kind")
+        out.append("# HELP miner_last_update_timestamp_seconds 마지막 갱신 시각")
+        out.append("# TYPE miner_last_update_timestamp_seconds gauge")
+        out.append(f"miner_last_update_timestamp_seconds {time.time():.3f}")
+        return "\n".join(out) + "\n"
+
+    def write_prometheus(self) -> None:
+        """prom_path 를 tmp + os.replace 로 교체 (collector 가 반쯤 쓴 파일을 읽지 않게)."""
+        if self.prom_path is None:
+            return
+        text = self._prometheus_text()
+        tmp = f"{self.prom_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, self.prom_path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._events is not None:
+                self._events.close()
+                self._events = None
+        if self._done:
+            self.write_prometheus()
+
+
+# 크롤러들이 같이 쓰는 기본 인스턴스 (main 에서 configure_metrics 로 설정)
+_metrics = CrawlMetrics()
+
+
+def configure_metrics(**kwargs) -> CrawlMetrics:
+    """기본 인스턴스를 새 설정으로 교체 (이전 인스턴스는 닫는다)."""
+    global _metrics
+    _metrics.close()
+    _metrics = CrawlMetrics(**kwargs)
+    return _metrics
+
+
+def title_metrics(site: str, title: str):
+    """with title_metrics("IMDB", title_en) as tm: ... (현재 스레드의 타이틀 블록)"""
+    return _metrics.title(site, title)
+
+
+def current_title() -> Optional[TitleMetrics]:
+    return _metrics.current()
+
+
+def attach_title(tm: Optional[TitleMetrics]):
+    """with attach_title(tm): ... (다른 스레드에서 tm 타이틀에 기록)"""
+    return _metrics.attach(tm)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """현재 타이틀의 name 단계 시간 측정. 타이틀 블록 밖이면 그냥 실행."""
+    tm = _metrics.current()
+    if tm is None:
+        yield
+        return
+    with tm.stage(name):
+        yield
+
+
+def count(name: str, n: float = 1) -> None:
+    tm = _metrics.current()
+    if tm is not None:
+        tm.count(name, n)
+
+
+def log(msg: str, level: int = LOG_INFO) -> None:
+    _metrics.log(msg, level)
+
+
+def close_metrics() -> None:
+    _metrics.close()
+
+
+atexit.register(close_metrics)
@@ -0,0 +1,150 @@
+"""
+여러 크롬 드라이버로 타겟 목록을 병렬 크롤링하는 워커 풀.
+
+워커(스레드) 하나가 드라이버 하나를 소유하고(driver_supervisor 가 감시 / 교체),
+공용 스케줄러(crawl_scheduler)에서 타겟을 하나씩 꺼내 처리한다. 결과는 완료 순서와 상관없이 targets 순서대로
+on_result 에 전달/반환된다.
+"""
+
+import contextlib
+import threading
+from typing import Callable, Dict, List, Optional
+
+from crawl_scheduler import CrawlScheduler, DomainLimiter
+from driver_supervisor import DriverSupervisor
+
+
+def crawl_targets_parallel(
+    targets: List[Dict],
+    create_driver_fn: Optional[Callable[[], object]],
+    crawl_fn: Callable[[object, Dict], List[Dict[str, str]]],
+    workers: int = 2,
+    on_result: Optional[Callable[[int, Dict, List[Dict[str, str]]], None]] = None,
+    label: str = "POOL",
+    limiter: Optional[DomainLimiter] = None,
+    max_retries: int = 0,
+    retry_delay: float = 30.0,
+    title_timeout: Optional[float] = None,
+    recycle_after: Optional[int] = None,
+    max_rss_mb: Optional[float] = None,
+    browser_pool=None,
+    on_failed: Optional[Callable[[int, Dict, Exception], None]] = None,
+) -> List[List[Dict[str, str]]]:
+    """
+    targets 를 workers 개의 드라이버에 나눠서 crawl_fn(driver, target) 실행.
+
+    - 반환값: targets 와 같은 순서의 결과 리스트 (실패한 타겟은 빈 리스트)
+    - on_result(idx, target, rows): 앞선 타겟이 모두 끝난 시점에 targets 순서대로 호출
+      (CSV 저장처럼 순서가 중요한 후처리를 병렬 실행 중에도 바로 할 수 있게)
+    - limiter 를 주면 crawl_fn 안의 pace() 가 그 도메인 속도에 맞춰 기다리고,
+      스로틀 신호(ThrottledError / TimeoutException)로 실패한 타겟은 max_retries 번까지
+      retry_delay 초부터 두 배씩 늦춰 다시 시도한다. target["priority"] 가 작을수록 먼저.
+    - title_timeout 초를 넘기거나 브라우저 메모리가 max_rss_mb 의 1.5배를 넘긴 타이틀은
+      드라이버를 죽이고 새 드라이버로 바로 재시도 (max_retries 안에서, 체크포인트에서 이어서).
+      recycle_after 개 타이틀마다 / 타이틀 뒤 max_rss_mb 초과 시 드라이버를 새로 띄운다.
+    - browser_pool(BrowserPool, 이미 start() 한 것)을 주면 드라이버는 create_driver_fn 대신
+      거기서 미리 띄워 둔 것을 받고, 끝나면 끄지 않고 풀에 돌려준다 (종료는 호출한 쪽에서).
+    - on_failed(idx, target, error): 재시도까지 모두 실패한 타겟마다 (on_result 보다 먼저,
+      완료 순서대로). soft ThrottledError 를 0개 완료로 기록하는 등 실패 종류별 처리용
+    - create_driver_fn=None 이면 브라우저 없이 돈다: 워커는 드라이버를 띄우지 않고
+      crawl_fn(None, target) 을 부른다 (imdb --extraction http. 감시 / 교체도 없음)
+    """
+    n_workers = max(1, min(workers, len(targets)))
+    results: List[Optional[List[Dict[str, str]]]] = [None] * len(targets)
+
+    scheduler = CrawlScheduler(
+        targets,
+        limiter=limiter,
+        max_retries=max_retries,
+        retry_delay=retry_delay,
+        label=label,
+    )
+
+    lock = threading.Lock()
+    next_emit = [0]
+
+    def _emit_ready() -> None:
+        # lock 을 잡은 상태에서 호출: 앞에서부터 끝난 결과를 순서대로 흘려보냄
+        while next_emit[0] < len(targets) and results[next_emit[0]] is not None:
+            i = next_emit[0]
+            next_emit[0] += 1
+            if on_result is not None:
+                try:
+                    on_result(i, targets[i], results[i])
+                except Exception as e:
+                    print(f"[{label}] 결과 처리 중 예외 (#{i}): {e}")
+
+    def _worker(worker_id: int) -> None:
+        supervisor = None
+        if create_driver_fn is not None:
+            supervisor = DriverSupervisor(
+                create_driver_fn,
+                title_timeout=title_timeout,
+                max_titles=recycle_after,
+                max_rss_mb=max_rss_mb,
+                label=f"{label}-{worker_id}",
+                pool=browser_pool,
+            )
+            try:
+                supervisor.start()
+            except Exception as e:
+                # 이 워커는 빠지고, 남은 타겟은 다른 워커가 처리
+                print(f"[{label}] worker {worker_id} 드라이버 생성 실패: {e}")
+                return
+
+        try:
+            while True:
+                item = scheduler.next()
+                if item is None:
+                    break
+                idx, tgt, attempt = item
+
+                rows: List[Dict[str, str]] = []
+                error: Optional[Exception] = None
+                title = (
+                    supervisor.title(tgt.get("title_en", ""))
+                    if supervisor is not None
+                    else contextlib.nullcontext()
+                )
+                try:
+                    with scheduler.activate(), title as driver:
+                        rows = crawl_fn(driver, tgt)
+                except Exception as e:
+                    error = e
+                    print(
+                        f"[{label}] worker {worker_id} – "
+                        f"{tgt.get('title_en')} 크롤링 중 예외: {e}"
+                    )
+
+                if not scheduler.finish(idx, tgt, attempt, error):
+                    continue  # 재시도 예약됨
+                if error is not None and on_failed is not None:
+                    try:
+                        on_failed(idx, tgt, error)
+                    except Exception as e:
+                        print(f"[{label}] 실패 처리 중 예외 (#{idx}): {e}")
+                with lock:
+                    results[idx] = rows
+                    _emit_ready()
+        finally:
+            if supervisor is not None:
+                supervisor.close()
+
+    threads = [
+        threading.Thread(target=_worker, args=(i,), name=f"{label}-{i}")
+        for i in range(n_workers)
+    ]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    # 모든 워커의 드라이버 생성이 실패해서 남은 타겟은 빈 결과로 처리
+    with lock:
+        for i in range(len(targets)):
+            if results[i] is None:
+                print(f"[{label}] {targets[i].get('title_en')} – 처리할 워커 없음, 스킵")
+                results[i] = []
+        _emit_ready()
+
+    return [r or [] for r in results]
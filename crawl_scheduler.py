@@ -0,0 +1,284 @@
+"""
+도메인별 적응형 요청 속도 제한 + 타겟 우선순위 스케줄러.
+
+  - TokenBucket    : 초당 rate 개, 최대 burst 개까지 모아 둘 수 있는 토큰
+  - DomainLimiter  : 한 도메인(www.imdb.com 등)의 워커들이 같이 쓰는 버킷.
+                     타이틀이 정상으로 끝나면 rate 를 조금씩 올리고(+increase),
+                     스로틀 신호가 오면 절반으로 내린 뒤 cooldown 동안 요청을 멈춘다.
+                     (AIMD: 사이트가 버티는 최대 속도 근처에 머문다)
+  - CrawlScheduler : 타겟 우선순위 큐. 스로틀로 실패한 타겟은 지수 백오프 뒤 다시 넣고,
+                     재시도 한도를 넘으면 포기한다. crawl_pool 워커가 여기서 타겟을 꺼낸다.
+  - pace()         : 크롤 함수가 페이지 로드 / 더보기 클릭 직전에 부른다.
+                     현재 워커 스레드의 limiter 토큰을 기다린다 (limiter 가 없으면 바로 반환)
+
+스로틀 신호: ThrottledError (캡차·차단 페이지, 빈 카드 목록) 와 selenium TimeoutException.
+빈 카드 목록(soft)은 리뷰가 정말 없는 타이틀일 수도 있어서 limiter 는 늦추지 않고
+soft_retries 번만 재시도한다. 그래도 비어 있으면 호출한 쪽이 0개로 완료 처리한다.
+RetryableError (드라이버 감시가 끊은 타이틀 등)는 limiter 를 늦추지 않고 바로 다시 넣는다.
+"""
+
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+
+
+class ThrottledError(Exception):
+    """
+    사이트가 요청을 막거나 늦추는 것으로 보일 때 크롤 함수가 던진다.
+    soft=True 는 차단 표식 없이 리뷰 카드만 비어 있는 경우.
+    """
+
+    def __init__(self, reason: str, soft: bool = False) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.soft = soft
+
+
+class RetryableError(Exception):
+    """사이트 탓이 아닌, 다시 시도하면 될 실패 (limiter 는 그대로 두고 바로 재시도)."""
+
+
+def throttle_reason(error: Optional[BaseException]) -> Optional[str]:
+    """error 가 스로틀 신호면 이유 문자열, 아니면 None."""
+    if isinstance(error, ThrottledError):
+        return error.reason
+    if isinstance(error, TimeoutException):
+        return "timeout"
+    return None
+
+
+# =========================================================
+# 1. 토큰 버킷 / 도메인 limiter
+# =========================================================
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 그 토큰이 찰 때까지 기다려야 할 초를 반환."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class DomainLimiter:
+    """
+    rate     : 시작 요청 속도 (초당 페이지 로드 + 클릭 수, 워커 전체 합)
+    min_rate / max_rate : rate 조절 범위
+    increase : 타이틀 하나가 스로틀 없이 끝날 때마다 더하는 값
+    decrease : 스로틀 신호 때 곱하는 값
+    cooldown : 스로틀 신호 뒤 모든 요청을 멈추는 시간(초). 연속 신호면 두 배씩 (최대 16배)
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: float = 4.0,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+        cooldown: float = 30.0,
+        burst: float = 2.0,
+    ) -> None:
+        self.domain = domain
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.bucket = TokenBucket(rate, burst)
+        self._strikes = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                pause = self._paused_until - time.monotonic()
+            if pause <= 0:
+                break
+            time.sleep(pause)
+        self.bucket.acquire()
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._strikes = 0
+            rate = min(self.max_rate, self.bucket.rate + self.increase)
+        self.bucket.set_rate(rate)
+
+    def on_throttle(self, reason: str) -> None:
+        with self._lock:
+            pause = self.cooldown * (2 ** min(self._strikes, 4))
+            self._strikes += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            rate = max(self.min_rate, self.bucket.rate * self.decrease)
+        self.bucket.set_rate(rate)
+        print(
+            f"[SCHED] {self.domain} – 스로틀 신호({reason}): "
+            f"{rate:.2f} req/s 로 낮추고 {pause:.0f}초 대기"
+        )
+
+
+_limiters: Dict[str, DomainLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(domain: str, **kwargs) -> DomainLimiter:
+    """도메인마다 하나. 처음 부를 때의 kwargs 로 만들고 이후엔 같은 인스턴스."""
+    with _limiters_lock:
+        lim = _limiters.get(domain)
+        if lim is None:
+            lim = _limiters[domain] = DomainLimiter(domain, **kwargs)
+        return lim
+
+
+_local = threading.local()
+
+
+def pace() -> None:
+    """현재 스레드에 걸린 limiter 의 토큰 하나를 기다린다 (없으면 바로 반환)."""
+    lim = getattr(_local, "limiter", None)
+    if lim is not None:
+        lim.acquire()
+
+
+# =========================================================
+# 2. 타겟 스케줄러
+# =========================================================
+
+class CrawlScheduler:
+    """
+    targets 를 (priority, 원래 순서) 로 꺼내 준다. priority 는 작을수록 먼저
+    (기본: target.get("priority", 0)). 재시도 타겟은 not_before 가 지나야 다시 나온다.
+
+    워커 사용법:
+        item = sched.next()            # 더 없으면 None
+        idx, target, attempt = item
+        with sched.activate():         # 이 안의 pace() 가 limiter 를 쓴다
+            rows = crawl_fn(driver, target)
+        final = sched.finish(idx, target, attempt, error)   # False 면 재시도 예약됨
+    """
+
+    def __init__(
+        self,
+        targets: List[Dict],
+        limiter: Optional[DomainLimiter] = None,
+        priority_fn: Optional[Callable[[Dict], int]] = None,
+        max_retries: int = 0,
+        soft_retries: int = 1,
+        retry_delay: float = 30.0,
+        label: str = "SCHED",
+    ) -> None:
+        self.limiter = limiter
+        self.priority_fn = priority_fn or (lambda t: t.get("priority", 0))
+        self.max_retries = max_retries
+        self.soft_retries = min(soft_retries, max_retries)
+        self.retry_delay = retry_delay
+        self.label = label
+        # ready: (priority, idx, attempt, target) / waiting: (not_before, idx, attempt)
+        self._ready: List[Tuple[int, int, int, Dict]] = []
+        self._waiting: List[Tuple[float, int, int]] = []
+        self._targets = targets
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        for idx, t in enumerate(targets):
+            heapq.heappush(self._ready, (self.priority_fn(t), idx, 0, t))
+
+    def next(self) -> Optional[Tuple[int, Dict, int]]:
+        """다음 타겟 (idx, target, attempt). 남은 게 없고 처리 중인 것도 없으면 None."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._waiting and self._waiting[0][0] <= now:
+                    _, idx, attempt = heapq.heappop(self._waiting)
+                    t = self._targets[idx]
+                    heapq.heappush(self._ready, (self.priority_fn(t), idx, attempt, t))
+                if self._ready:
+                    _, idx, attempt, t = heapq.heappop(self._ready)
+                    self._in_flight += 1
+                    return idx, t, attempt
+                if not self._waiting and self._in_flight == 0:
+                    return None
+                # 처리 중인 타겟이 재시도로 돌아올 수도 있으니 끝날 때까지 기다린다
+                timeout = self._waiting[0][0] - now if self._waiting else None
+                self._cond.wait(timeout)
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        prev = getattr(_local, "limiter", None)
+        _local.limiter = self.limiter
+        try:
+            yield
+        finally:
+            _local.limiter = prev
+
+    def finish(
+        self,
+        idx: int,
+        target: Dict,
+        attempt: int,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """
+        타겟 하나의 결과를 알린다. 스로틀 신호면 limiter 를 늦추고,
+        재시도 한도 안이면 다시 큐에 넣고 False. 그 외에는 True (결과 확정).
+        """
+        reason = throttle_reason(error)
+        soft = isinstance(error, ThrottledError) and error.soft
+        if self.limiter is not None:
+            if error is None:
+                self.limiter.on_success()
+            elif reason is not None and not soft:
+                # 빈 카드 목록만으로는 사이트가 늦추라는 신호인지 알 수 없다
+                self.limiter.on_throttle(reason)
+
+        limit = self.soft_retries if soft else self.max_retries
+        if reason is None and isinstance(error, RetryableError):
+            reason, delay = str(error), 0.0
+        else:
+            delay = self.retry_delay * (2 ** attempt)
+        retry = reason is not None and attempt < limit
+        with self._cond:
+            self._in_flight -= 1
+            if retry:
+                heapq.heappush(
+                    self._waiting, (time.monotonic() + delay, idx, attempt + 1)
+                )
+            self._cond.notify_all()
+        if retry:
+            print(
+                f"[{self.label}] {target.get('title_en')} – {reason}, "
+                f"{delay:.0f}초 뒤 재시도 ({attempt + 1}/{limit})"
+            )
+        return not retry
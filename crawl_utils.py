@@ -0,0 +1,451 @@
+"""
+IMDb / RT 크롤러가 같이 쓰는 유틸.
+"""
+
+import csv
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from selenium.common.exceptions import TimeoutException
+
+import crawl_metrics
+
+
+# =========================================================
+# 1. 선택 필드 조회 (대기 없음)
+# =========================================================
+
+def find_optional(parent, by: str, selector: str):
+    """
+    있으면 첫 번째 요소, 없으면 None.
+
+    find_elements 는 못 찾아도 예외 없이 빈 리스트를 돌려주므로
+    implicitly_wait(0) 상태에서는 즉시 반환된다.
+    (평점 없는 카드처럼 '없을 수도 있는' 필드 조회용)
+    """
+    try:
+        elems = parent.find_elements(by, selector)
+    except Exception:
+        return None
+    return elems[0] if elems else None
+
+
+# =========================================================
+# 2. 대기 시간 집계
+# =========================================================
+
+class WaitClock:
+    """
+    타이틀 하나를 크롤링하는 동안 명시적 대기(WebDriverWait)와
+    sleep 에 쓴 시간, 상한까지 기다리고 끝난 대기(타임아웃) 수를 종류별로 누적한다.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.by_kind: Dict[str, float] = {}
+        self.timeouts: Dict[str, int] = {}
+
+    def add(self, kind: str, seconds: float) -> None:
+        self.total += seconds
+        self.by_kind[kind] = self.by_kind.get(kind, 0.0) + seconds
+
+    def timeout(self, kind: str) -> None:
+        self.timeouts[kind] = self.timeouts.get(kind, 0) + 1
+
+    def until(self, wait, condition, kind: str = "wait"):
+        """wait.until(condition) 을 실행하면서 걸린 시간을 기록 (예외는 그대로 전달)."""
+        t0 = time.perf_counter()
+        try:
+            return wait.until(condition)
+        except TimeoutException:
+            self.timeout(kind)
+            raise
+        finally:
+            self.add(kind, time.perf_counter() - t0)
+
+    def sleep(self, seconds: float, kind: str = "sleep") -> None:
+        t0 = time.perf_counter()
+        time.sleep(seconds)
+        self.add(kind, time.perf_counter() - t0)
+
+    def summary(self, limit: Optional[int] = None) -> str:
+        parts = sorted(self.by_kind.items(), key=lambda kv: -kv[1])
+        if limit is not None:
+            parts = parts[:limit]
+        detail = ", ".join(f"{k} {v:.1f}s" for k, v in parts)
+        n_timeouts = sum(self.timeouts.values())
+        return (
+            f"{self.total:.1f}s"
+            + (f" ({detail})" if detail else "")
+            + (f", 타임아웃 {n_timeouts}회" if n_timeouts else "")
+        )
+
+
+# =========================================================
+# 2-1. 이벤트 기반 로드 대기 (MutationObserver)
+# =========================================================
+
+# selector 에 맞는 요소가 min_count 개 이상 붙는 순간 바로 resolve.
+# timeout_ms 는 상한일 뿐이고, 그때까지 안 늘면 현재 개수로 resolve.
+_WAIT_FOR_COUNT_JS = """
+var selector = arguments[0], minCount = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+function count() { return document.querySelectorAll(selector).length; }
+var n0 = count();
+if (n0 >= minCount) { done(n0); return; }
+var timer = null;
+var obs = new MutationObserver(function () {
+    var n = count();
+    if (n >= minCount) { obs.disconnect(); clearTimeout(timer); done(n); }
+});
+obs.observe(document.documentElement, {childList: true, subtree: true});
+timer = setTimeout(function () { obs.disconnect(); done(count()); }, timeoutMs);
+"""
+
+# selector 요소 안에서 DOM 변경이 한 번이라도 일어나면 resolve (탭 전환 후 재렌더 감지용).
+# clickEl 을 주면 observer 를 건 다음에 클릭해서, 클릭 직후 변경을 놓치지 않는다.
+_WAIT_FOR_MUTATION_JS = """
+var selector = arguments[0], timeoutMs = arguments[1], clickEl = arguments[2];
+var done = arguments[arguments.length - 1];
+var root = document.querySelector(selector) || document.documentElement;
+var timer = null;
+var obs = new MutationObserver(function () {
+    obs.disconnect(); clearTimeout(timer); done(true);
+});
+obs.observe(root, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function () { obs.disconnect(); done(false); }, timeoutMs);
+if (clickEl) { clickEl.click(); }
+"""
+
+# execute_async_script 상한. 위 스크립트들의 timeout 은 이보다 작아야 한다.
+SCRIPT_TIMEOUT = 60
+
+
+def wait_for_card_count(
+    driver,
+    selector: str,
+    min_count: int,
+    timeout: float,
+    clock: Optional[WaitClock] = None,
+    kind: str = "cards",
+) -> int:
+    """
+    selector 요소가 min_count 개 이상 붙을 때까지 (최대 timeout 초) 기다린 뒤
+    현재 개수를 반환. 고정 sleep 과 달리 카드가 붙는 즉시 돌아온다.
+    """
+    t0 = time.perf_counter()
+    try:
+        n = driver.execute_async_script(
+            _WAIT_FOR_COUNT_JS, selector, min_count, int(timeout * 1000)
+        )
+    finally:
+        if clock is not None:
+            clock.add(kind, time.perf_counter() - t0)
+    n = int(n or 0)
+    if n < min_count and clock is not None:
+        clock.timeout(kind)
+    return n
+
+
+def wait_for_dom_change(
+    driver,
+    selector: str,
+    timeout: float,
+    clock: Optional[WaitClock] = None,
+    kind: str = "mutation",
+    click_element=None,
+) -> bool:
+    """
+    selector 요소 안에서 DOM 변경이 일어나면 True, timeout 초 동안 없으면 False.
+    click_element 를 주면 감시를 시작한 뒤 그 요소를 클릭한다.
+    """
+    t0 = time.perf_counter()
+    try:
+        changed = bool(
+            driver.execute_async_script(
+                _WAIT_FOR_MUTATION_JS, selector, int(timeout * 1000), click_element
+            )
+        )
+    finally:
+        if clock is not None:
+            clock.add(kind, time.perf_counter() - t0)
+    if not changed and clock is not None:
+        clock.timeout(kind)
+    return changed
+
+
+# =========================================================
+# 2-2. 파싱이 끝난 카드 비우기 (bounded DOM)
+# =========================================================
+
+# cards[start:end] 중 아직 안 비운 카드의 자식(과 열린 shadow root)을 지우고
+# data-miner-pruned 표시를 남긴다. 카드 노드 자체는 남겨서 querySelectorAll
+# 개수 / 인덱스 기반 구간 추출과 페이지네이션 버튼은 그대로 동작한다.
+# requireAttr 를 주면 그 속성이 붙은 카드만 (RT: data-miner-seen).
+_PRUNE_CARDS_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var start = arguments[1];
+var end = arguments[2] === null ? cards.length : Math.min(arguments[2], cards.length);
+var requireAttr = arguments[3];
+var pruned = 0;
+for (var i = start; i < end; i++) {
+    var el = cards[i];
+    if (el.hasAttribute("data-miner-pruned")) { continue; }
+    if (requireAttr && !el.hasAttribute(requireAttr)) { continue; }
+    el.replaceChildren();
+    if (el.shadowRoot) { el.shadowRoot.replaceChildren(); }
+    el.setAttribute("data-miner-pruned", "1");
+    pruned++;
+}
+return pruned;
+"""
+
+
+def prune_cards(
+    driver,
+    selector: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    require_attr: Optional[str] = None,
+) -> int:
+    """
+    이미 파싱해서 seen 에 기록한 카드를 라이브 DOM 에서 비운다.
+    (클릭 수천 번 뒤에도 노드 수 / page_source / 크롬 메모리가 늘지 않게)
+    비운 카드 수를 반환. 실패하면 0 (크롤은 계속).
+    """
+    try:
+        return int(
+            driver.execute_script(
+                _PRUNE_CARDS_JS, selector, start, end, require_attr
+            )
+            or 0
+        )
+    except Exception as e:
+        print(f"[DEBUG] 카드 비우기 실패 (무시): {e}")
+        return 0
+
+
+# =========================================================
+# 3. row 누적기 (스트리밍 sink 연결용)
+# =========================================================
+
+class RowCollector:
+    """
+    크롤 함수 안에서 쓰는 row 누적기.
+
+    sink 가 없으면 리스트처럼 전부 보관하고, 있으면 flush() 때마다 쌓인 배치를
+    sink(rows) 로 넘긴 뒤 비운다. len() 은 지금까지 모은 전체 개수
+    (이전 실행에서 이미 모은 initial_count 포함).
+    sink 호출은 "write" 단계로, 이번에 모은 개수는 result() 때 "reviews" 로 기록.
+
+    pipeline(CommitPipeline)을 주면 sink 호출과 flush(after=...) 는 그 백그라운드
+    스레드에서 순서대로 실행되고, 크롤 스레드는 기다리지 않고 다음 페이지로 간다.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+        initial_count: int = 0,
+        pipeline: Optional["CommitPipeline"] = None,
+    ):
+        self.sink = sink
+        self.rows: List[Dict[str, str]] = []
+        self.count = initial_count
+        self.initial_count = initial_count
+        self.pipeline = pipeline if sink is not None else None
+
+    def append(self, row: Dict[str, str]) -> None:
+        self.rows.append(row)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def flush(self, after: Optional[Callable[[], None]] = None) -> None:
+        """
+        쌓인 배치를 sink 로 넘긴 뒤 after() (체크포인트 기록 등: row 가 먼저 저장돼야
+        하는 작업). pipeline 이 있으면 둘 다 백그라운드에 맡기고 바로 반환.
+        """
+        batch: List[Dict[str, str]] = []
+        if self.sink is not None and self.rows:
+            batch, self.rows = self.rows, []
+
+        def _commit() -> None:
+            if batch:
+                with crawl_metrics.stage("write"):
+                    self.sink(batch)
+            if after is not None:
+                after()
+
+        if self.pipeline is not None:
+            self.pipeline.submit(_commit)
+        else:
+            _commit()
+
+    def result(self) -> List[Dict[str, str]]:
+        """
+        남은 배치를 flush 하고 (pipeline 이면 쓰기가 다 끝날 때까지 기다린다),
+        sink 가 없을 때만 전체 row 를 반환.
+        """
+        self.flush()
+        if self.pipeline is not None:
+            self.pipeline.drain()
+        crawl_metrics.count("reviews", self.count - self.initial_count)
+        return self.rows
+
+
+class CommitPipeline:
+    """
+    타이틀 하나의 배치 쓰기(sink: spool / DB / 중복 판정)와 체크포인트 기록을
+    백그라운드 스레드 하나에서 submit 순서대로 실행한다. 크롤 스레드는 카드를 뽑자마자
+    다음 '25 more' / Load More 를 누르고, 그동안 이전 배치가 저장된다
+    (타이틀 시간 ≈ max(로드, 처리)).
+
+    depth 개가 밀려 있으면 submit 이 기다린다 (쓰기가 로드보다 느려도 메모리가 안 쌓이게).
+    작업이 예외를 내면 뒤 작업은 건너뛰고 (저장 못 한 row 를 체크포인트가 앞지르지 않게),
+    다음 submit / drain / close 에서 크롤 스레드로 다시 던진다.
+    백그라운드 스레드의 "write" 단계 / 카운터는 만든 스레드의 현재 타이틀에 기록된다.
+    """
+
+    def __init__(self, depth: int = 2, name: str = "commit") -> None:
+        self._jobs: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue(
+            maxsize=depth
+        )
+        self._error: Optional[BaseException] = None
+        self._failed = False
+        self._title = crawl_metrics.current_title()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        with crawl_metrics.attach_title(self._title):
+            while True:
+                job = self._jobs.get()
+                try:
+                    if job is None:
+                        return
+                    if not self._failed:
+                        job()
+                except BaseException as e:
+                    self._failed = True
+                    self._error = e
+                finally:
+                    self._jobs.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise err
+
+    def submit(self, job: Callable[[], None]) -> None:
+        self._raise_error()
+        if self._failed:
+            # 앞 작업 예외는 이미 던졌다. 이후 쓰기는 하지 않는다
+            return
+        self._jobs.put(job)
+
+    def drain(self) -> None:
+        """지금까지 submit 한 작업이 다 끝날 때까지 기다린다."""
+        self._jobs.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """남은 작업을 마저 실행하고 스레드를 끝낸다 (크롤 함수의 finally 에서)."""
+        if self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join()
+        self._raise_error()
+
+
+# =========================================================
+# 4. 기존 CSV 리뷰 인덱스 (델타 크롤용)
+# =========================================================
+
+def load_known_review_keys(
+    path: str, key_fn: Callable[[Dict[str, str]], object]
+) -> Dict[str, Set]:
+    """
+    이미 저장된 CSV 를 읽어 title_en 별 리뷰 키 집합을 만든다.
+    파일이 없으면 빈 dict. (row 전체가 아니라 키만 메모리에 둔다)
+    """
+    index: Dict[str, Set] = {}
+    if not os.path.exists(path):
+        return index
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            if not row.get("review"):
+                continue
+            index.setdefault(row.get("title_en") or "", set()).add(key_fn(row))
+
+    n = sum(len(v) for v in index.values())
+    print(f"[DELTA] {path} 에서 {len(index)}개 타이틀, 리뷰 키 {n}개 로드")
+    return index
+
+
+# =========================================================
+# 5. 브라우저 메모리 (드라이버 프로세스 트리 RSS)
+# =========================================================
+
+def browser_rss_bytes(driver) -> Optional[int]:
+    """
+    chromedriver 와 그 자식(크롬 브라우저 / 렌더러 / GPU 프로세스)의 RSS 합.
+    psutil 이 없거나 프로세스를 못 찾으면 None.
+    """
+    try:
+        # psutil 은 메모리 측정에서만 필요
+        import psutil
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+    total = 0
+    for proc in procs:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            # 측정 중에 끝난 렌더러 등
+            continue
+    return total
+
+
+# =========================================================
+# 6. 차단 / 캡차 페이지 감지 (스로틀 신호)
+# =========================================================
+
+# 캡차 위젯 / 차단 페이지 표식. 찾으면 그 표식을, 없으면 "" 를 돌려준다.
+# 본문은 앞부분만 본다 (리뷰 본문에 우연히 들어간 단어에 덜 걸리게).
+_BLOCK_PAGE_JS = """
+var sels = ["#px-captcha", "iframe[src*='captcha']", "form[action*='captcha']",
+            "#captcha-container", "#challenge-form", "#cf-challenge-running",
+            "script[src*='awswaf']"];
+for (var i = 0; i < sels.length; i++) {
+    if (document.querySelector(sels[i])) return sels[i];
+}
+var body = document.body ? document.body.innerText.slice(0, 2000) : "";
+var text = ((document.title || "") + " " + body).toLowerCase();
+var words = ["captcha", "access denied", "are you a robot", "verify you are human",
+             "unusual traffic", "too many requests", "request blocked",
+             "service unavailable"];
+for (var j = 0; j < words.length; j++) {
+    if (text.indexOf(words[j]) >= 0) return words[j];
+}
+return "";
+"""
+
+
+def detect_block_page(driver) -> str:
+    """
+    현재 페이지가 캡차 / 차단 / 요청 과다 페이지면 찾은 표식, 아니면 "".
+    카드를 못 찾았거나 더보기가 멈췄을 때만 부른다 (정상 경로에서는 안 씀).
+    """
+    try:
+        return str(driver.execute_script(_BLOCK_PAGE_JS) or "")
+    except Exception:
+        return ""
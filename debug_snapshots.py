@@ -0,0 +1,212 @@
+"""
+크롤 중 HTML 디버그 스냅샷(page0 / last / no_cards 등) 저장.
+
+  level
+    off     : 저장 안 함
+    error   : 카드/섹션을 못 찾은 경우 같은 오류 스냅샷만
+    sampled : 오류 + sample_every 개 타이틀 중 하나꼴로 page0/last (타이틀 키 해시로 고정)
+    all     : 전부 (기존 동작)
+
+page_source 는 저장할 때만 크롤 스레드에서 받고, 압축(zstd 또는 gzip)과
+디스크 쓰기는 백그라운드 스레드가 한다. 쓰고 나면 debug/ 전체 크기가
+max_bytes 를 넘지 않도록 오래된 파일부터 지운다.
+
+zstd 는 zstandard 패키지가 있을 때만. 없으면 gzip 으로 대신한다.
+저장된 스냅샷은 read_snapshot() 으로 확장자에 맞춰 풀어서 읽는다.
+"""
+
+import atexit
+import gzip
+import importlib.util
+import os
+import queue
+import threading
+import zlib
+from typing import Callable, Optional, Union
+
+
+SNAPSHOT_LEVELS = ["off", "error", "sampled", "all"]
+SNAPSHOT_COMPRESSIONS = ["gzip", "zstd", "none"]
+
+_EXTENSIONS = {"gzip": ".html.gz", "zstd": ".html.zst", "none": ".html"}
+
+
+def read_snapshot(path: str) -> str:
+    """.html / .html.gz / .html.zst 스냅샷을 문자열로."""
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+    if path.endswith(".zst"):
+        # zstandard 는 zstd 스냅샷을 읽을 때만 필요
+        import zstandard
+
+        with open(path, "rb") as f:
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(f.read())
+        return data.decode("utf-8")
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class DebugSnapshots:
+    """
+    사용 예:
+        snaps = DebugSnapshots(level="sampled", compression="zstd")
+        snaps.save(f"imdb_reviews_{ttid}_page0", lambda: driver.page_source, sample_key=ttid)
+        ...
+        snaps.flush()
+    """
+
+    def __init__(
+        self,
+        directory: str = "debug",
+        level: str = "all",
+        compression: str = "gzip",
+        sample_every: int = 10,
+        max_bytes: int = 200 * 1024 * 1024,
+    ) -> None:
+        if level not in SNAPSHOT_LEVELS:
+            raise ValueError(f"알 수 없는 스냅샷 level: {level}")
+        if compression not in SNAPSHOT_COMPRESSIONS:
+            raise ValueError(f"알 수 없는 스냅샷 압축: {compression}")
+        if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+            print("[DEBUG] zstandard 가 없어서 스냅샷을 gzip 으로 압축")
+            compression = "gzip"
+
+        self.directory = directory
+        self.level = level
+        self.compression = compression
+        self.sample_every = max(1, sample_every)
+        self.max_bytes = max_bytes
+
+        self._q: "queue.Queue" = queue.Queue(maxsize=8)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def wants(self, error: bool = False, sample_key: Optional[str] = None) -> bool:
+        """이 스냅샷을 저장할지 (page_source 를 받기 전에 판단)."""
+        if self.level == "off":
+            return False
+        if error or self.level == "all":
+            return True
+        if self.level == "sampled":
+            key = (sample_key or "").encode("utf-8")
+            return zlib.crc32(key) % self.sample_every == 0
+        return False
+
+    def save(
+        self,
+        name: str,
+        html: Union[str, Callable[[], str]],
+        error: bool = False,
+        sample_key: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        name(확장자 제외) 으로 저장을 예약하고 저장될 경로를 반환 (안 하면 None).
+        html 에 driver.page_source 를 돌려주는 함수를 넘기면 저장할 때만 호출한다.
+        """
+        if not self.wants(error, sample_key):
+            return None
+        try:
+            text = html() if callable(html) else html
+        except Exception as e:
+            print(f"[DEBUG] HTML 스냅샷 받기 실패 ({name}): {e}")
+            return None
+
+        path = os.path.join(self.directory, name + _EXTENSIONS[self.compression])
+        self._ensure_thread()
+        self._q.put((path, text))
+        return path
+
+    def flush(self) -> None:
+        """예약된 스냅샷을 전부 디스크에 쓸 때까지 대기."""
+        if self._thread is not None:
+            self._q.join()
+
+    # ---- 백그라운드 쓰기 ----
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="debug-snapshots", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            path, text = self._q.get()
+            try:
+                self._write(path, text)
+                self._evict()
+            except Exception as e:
+                print(f"[DEBUG] HTML 저장 실패 ({path}): {e}")
+            finally:
+                self._q.task_done()
+
+    def _write(self, path: str, text: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        data = text.encode("utf-8")
+        if self.compression == "gzip":
+            data = gzip.compress(data, compresslevel=6)
+        elif self.compression == "zstd":
+            import zstandard
+
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _evict(self) -> None:
+        """debug/ 전체가 max_bytes 를 넘으면 오래된(mtime) 파일부터 삭제."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            p = os.path.join(self.directory, name)
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            if not os.path.isfile(p):
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(p)
+                total -= size
+            except OSError:
+                pass
+
+
+# 크롤러들이 같이 쓰는 기본 인스턴스 (main 에서 configure_snapshots 로 설정)
+_snapshots = DebugSnapshots()
+
+
+def configure_snapshots(**kwargs) -> DebugSnapshots:
+    """기본 인스턴스를 새 설정으로 교체 (이전 인스턴스의 예약분은 먼저 기록)."""
+    global _snapshots
+    _snapshots.flush()
+    _snapshots = DebugSnapshots(**kwargs)
+    return _snapshots
+
+
+def save_snapshot(
+    name: str,
+    html: Union[str, Callable[[], str]],
+    error: bool = False,
+    sample_key: Optional[str] = None,
+) -> Optional[str]:
+    return _snapshots.save(name, html, error=error, sample_key=sample_key)
+
+
+def flush_snapshots() -> None:
+    _snapshots.flush()
+
+
+atexit.register(flush_snapshots)
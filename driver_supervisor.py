@@ -0,0 +1,254 @@
+"""
+크롬 드라이버 감시 / 주기적 교체.
+
+오래 도는 배치에서 워커 하나가 드라이버 하나를 계속 쓰면 크롬 메모리가 점점 불어나고,
+렌더러가 멈추면 WebDriver 호출이 돌아오지 않아 그 워커가 통째로 서 버린다.
+DriverSupervisor 는 워커의 드라이버를 대신 들고 있으면서
+
+  - 타이틀마다 벽시계 예산(title_timeout 초): 넘으면 watchdog 스레드가 chromedriver 와
+    크롬 프로세스 트리를 강제로 죽인다. 막혀 있던 WebDriver 호출이 예외로 풀리고
+    그 타이틀은 DriverKilledError(RetryableError) 로 끝나서 스케줄러가 바로 다시 넣는다
+  - 타이틀이 WebDriver / 연결 예외로 끝났는데 드라이버가 응답하지 않으면 (크롬 크래시,
+    InvalidSessionIdException, chrome not reachable 등) 역시 버리고 DriverKilledError
+  - 타이틀 도중 브라우저 RSS 가 max_rss_mb 의 HARD_RSS_FACTOR 배를 넘으면 같은 방식으로 끊는다
+  - 타이틀이 끝난 뒤 max_titles 개를 처리했거나 RSS 가 max_rss_mb 를 넘었으면
+    드라이버를 닫고 다음 타이틀에서 새로 띄운다
+
+끊긴 타이틀의 재시도는 체크포인트(seen / progress)에서 이어서 수집하고,
+그 전에 row_sink 로 넘긴 row 는 spool / DB 에 이미 남아 있어서 잃는 row 가 없다.
+RSS 측정은 psutil 이 있을 때만 (crawl_utils.browser_rss_bytes).
+pool(browser_pool.BrowserPool)을 주면 새 드라이버는 미리 띄워 둔 것을 받아 오고,
+교체할 드라이버의 종료와 다음 예비 드라이버 준비는 pool 이 백그라운드에서 한다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from browser_profile import release_driver_profile
+from crawl_scheduler import RetryableError
+from crawl_utils import browser_rss_bytes
+
+
+# 이 예외로 끝난 타이틀은 드라이버가 살아 있는지 확인한다 (urllib3: chromedriver 연결 끊김)
+_DRIVER_ERRORS = (WebDriverException, Urllib3HTTPError, ConnectionError)
+
+# 타이틀 도중에는 max_rss_mb 의 이 배수를 넘어야 끊는다 (그 아래는 타이틀이 끝난 뒤 교체)
+HARD_RSS_FACTOR = 1.5
+
+
+class DriverKilledError(RetryableError):
+    """watchdog 이 타이틀 도중 드라이버를 죽였다 (시간 예산 / 메모리 한도 초과)."""
+
+
+def kill_driver_tree(driver) -> None:
+    """
+    chromedriver 와 그 자식 크롬 프로세스를 모두 SIGKILL. driver.quit() 은 멈춘
+    브라우저에서 같이 멈출 수 있어서 쓰지 않는다.
+    """
+    proc = getattr(getattr(driver, "service", None), "process", None)
+    if proc is None:
+        return
+    try:
+        # psutil 이 있어야 자식 크롬 프로세스까지 찾을 수 있다
+        import psutil
+    except ImportError:
+        # chromedriver 만 죽이고, 자식 크롬은 연결이 끊기면서 정리되길 기대
+        try:
+            proc.kill()
+        except Exception:
+            pass
+        return
+    try:
+        root = psutil.Process(proc.pid)
+        procs = root.children(recursive=True) + [root]
+    except psutil.Error:
+        return
+    for p in procs:
+        try:
+            p.kill()
+        except psutil.Error:
+            continue
+
+
+def retire_driver(driver, clean: bool = True) -> None:
+    """
+    드라이버 종료 + 프로필 반납. clean=False (watchdog 이 죽인 드라이버 등)면 quit 없이
+    프로세스 트리를 죽이고, 프로필은 seed 로 올리지 않는다.
+    """
+    if clean:
+        try:
+            driver.quit()
+        except Exception:
+            # 이미 죽은 드라이버 등
+            clean = False
+    if not clean:
+        kill_driver_tree(driver)
+    release_driver_profile(driver, clean=clean)
+
+
+class DriverSupervisor:
+    """
+    create_driver_fn : 새 드라이버를 만드는 함수 (crawl_pool 의 create_driver_fn)
+    title_timeout    : 타이틀 하나의 벽시계 예산(초). None / 0 이면 무제한
+    max_titles       : 이만큼 타이틀을 처리하면 드라이버 교체. None / 0 이면 교체 안 함
+    max_rss_mb       : 타이틀이 끝난 뒤 브라우저 RSS 가 이 값(MB)을 넘으면 교체
+    poll_interval    : watchdog 이 시간 / RSS 를 확인하는 간격(초)
+    pool             : 있으면 create_driver_fn 대신 pool.acquire() 로 드라이버를 받는다
+
+    사용법 (워커 스레드 하나에서만):
+        sup = DriverSupervisor(create_driver, title_timeout=1800, max_titles=10)
+        sup.start()                       # 첫 드라이버 (실패하면 예외)
+        with sup.title(title_en) as driver:
+            rows = crawl_fn(driver, target)
+        sup.close()
+    """
+
+    def __init__(
+        self,
+        create_driver_fn: Callable[[], object],
+        title_timeout: Optional[float] = None,
+        max_titles: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        poll_interval: float = 5.0,
+        label: str = "DRIVER",
+        pool=None,
+    ) -> None:
+        self.create_driver_fn = create_driver_fn
+        self.pool = pool
+        self.title_timeout = title_timeout or None
+        self.max_titles = max_titles or None
+        self.max_rss_mb = max_rss_mb or None
+        self.poll_interval = poll_interval
+        self.label = label
+        self.driver = None
+        self.titles = 0  # 현재 드라이버로 처리한 타이틀 수
+        self.restarts = 0
+
+    def start(self) -> object:
+        """드라이버가 없으면 새로 만든다 (pool 이 있으면 준비된 것을 받는다)."""
+        if self.driver is None:
+            if self.pool is not None:
+                self.driver = self.pool.acquire()
+            else:
+                self.driver = self.create_driver_fn()
+            self.titles = 0
+        return self.driver
+
+    def close(self) -> None:
+        """워커가 끝날 때. pool 이 있으면 상태만 비우고 돌려준다."""
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        if self.pool is not None:
+            self.pool.release(driver)
+        else:
+            retire_driver(driver)
+
+    def _retire(self, clean: bool) -> None:
+        driver, self.driver = self.driver, None
+        if self.pool is not None:
+            self.pool.discard(driver, clean=clean)
+        else:
+            retire_driver(driver, clean=clean)
+
+    @staticmethod
+    def _alive(driver) -> bool:
+        """세션이 아직 명령에 응답하는지 (가벼운 명령 하나)."""
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _rss_mb(self, driver) -> Optional[float]:
+        rss = browser_rss_bytes(driver)
+        return None if rss is None else rss / 1e6
+
+    def _watch(self, driver, stop: threading.Event, killed: list) -> None:
+        deadline = (
+            time.monotonic() + self.title_timeout if self.title_timeout else None
+        )
+        hard_mb = self.max_rss_mb * HARD_RSS_FACTOR if self.max_rss_mb else None
+        while not stop.wait(self.poll_interval):
+            reason = None
+            if deadline is not None and time.monotonic() > deadline:
+                reason = f"시간 예산 {self.title_timeout:.0f}초 초과"
+            elif hard_mb is not None:
+                mb = self._rss_mb(driver)
+                if mb is not None and mb > hard_mb:
+                    reason = f"브라우저 메모리 {mb:.0f}MB > {hard_mb:.0f}MB"
+            if reason is not None:
+                # 이유를 먼저 남겨야 kill 로 풀린 크롤 함수 예외를 구분할 수 있다
+                killed.append(reason)
+                kill_driver_tree(driver)
+                return
+
+    @contextmanager
+    def title(self, name: str = "") -> Iterator[object]:
+        """
+        이 블록 동안 watchdog 이 driver 를 지켜본다. 도중에 죽였으면 블록이 정상으로
+        끝났더라도 DriverKilledError (그 타이틀의 결과는 믿을 수 없으니 재시도).
+        WebDriver 예외로 끝났고 드라이버가 더 이상 응답하지 않을 때도 DriverKilledError.
+        """
+        try:
+            driver = self.start()
+        except Exception as e:
+            # 교체 후 새 드라이버 생성 실패: 잠깐의 자원 부족일 수 있어 재시도로 넘긴다
+            raise DriverKilledError(f"드라이버 재생성 실패: {e}") from e
+
+        killed: list = []
+        stop = threading.Event()
+        watcher = None
+        if self.title_timeout or self.max_rss_mb:
+            watcher = threading.Thread(
+                target=self._watch,
+                args=(driver, stop, killed),
+                name=f"{self.label}-watchdog",
+                daemon=True,
+            )
+            watcher.start()
+        try:
+            try:
+                yield driver
+            finally:
+                stop.set()
+                if watcher is not None:
+                    watcher.join()
+        except Exception as e:
+            if killed:
+                self._discard(name, killed[0])
+                raise DriverKilledError(killed[0]) from e
+            if isinstance(e, _DRIVER_ERRORS) and not self._alive(driver):
+                reason = f"드라이버 응답 없음 ({type(e).__name__})"
+                self._discard(name, reason)
+                raise DriverKilledError(reason) from e
+            raise
+        if killed:
+            self._discard(name, killed[0])
+            raise DriverKilledError(killed[0])
+        self._after_title(name)
+
+    def _discard(self, name: str, reason: str) -> None:
+        print(f"[{self.label}] {name} – {reason}, 드라이버를 죽이고 새로 띄움")
+        self._retire(clean=False)
+        self.restarts += 1
+
+    def _after_title(self, name: str) -> None:
+        self.titles += 1
+        reason = None
+        if self.max_titles and self.titles >= self.max_titles:
+            reason = f"타이틀 {self.titles}개 처리"
+        elif self.max_rss_mb:
+            mb = self._rss_mb(self.driver)
+            if mb is not None and mb > self.max_rss_mb:
+                reason = f"브라우저 메모리 {mb:.0f}MB > {self.max_rss_mb:.0f}MB"
+        if reason is None:
+            return
+        print(f"[{self.label}] {name} 완료 후 드라이버 교체 ({reason})")
+        self._retire(clean=True)
+        self.restarts += 1
@@ -0,0 +1,353 @@
+"""
+브라우저 없이 IMDb 리뷰를 HTTP로 페이지네이션하는 수집기.
+
+리뷰 페이지의 "25 more" 버튼이 내부적으로 부르는 GraphQL 엔드포인트를
+requests.Session(커넥션 풀) 으로 직접 호출하고, pageInfo.endCursor 를 따라간다.
+row 형태는 parse_review_element 와 같다.
+
+응답 구조가 예상과 다르면 ImdbResponseShapeError 를 던지고,
+crawl_imdb_reviews_for_title(extraction="http") 가 Selenium 경로로 폴백한다.
+
+로컬 대역 서버:
+  fetch_imdb_reviews_http(..., record_dir="fixtures/imdb_http") 로 실제 응답을 저장해 두고
+  python imdb_http.py --replay fixtures/imdb_http --port 8765
+  로 띄운 뒤 graphql_url="http://127.0.0.1:8765/" 로 호출하면 같은 응답을 재생한다.
+  (imdb_reviews_selenium.py --extraction http --graphql-url http://127.0.0.1:8765/)
+  python imdb_http.py --replay fixtures/imdb_http --check tt10919420
+  는 재생 서버를 띄워 수집기를 한 번 돌리고, 녹화된 리뷰 id 를 순서대로 다 받는지 확인한다.
+  (tests/fixtures/imdb_http 에 작은 녹화 tt0000001 이 있다: tests/test_imdb_http.py)
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawl_metrics import LOG_DEBUG, count, log, stage
+from crawl_scheduler import ThrottledError, pace
+from review_record import ReviewRecord, imdb_review_url, title_meta
+
+
+IMDB_GRAPHQL_URL = "https://caching.graphql.imdb.com/"
+IMDB_PAGE_SIZE = 25
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+_REVIEWS_QUERY = """
+query TitleReviews($const: ID!, $first: Int!, $after: String) {
+  title(id: $const) {
+    reviews(first: $first, after: $after) {
+      edges {
+        node {
+          id
+          authorRating
+          text { originalText { plainText } }
+        }
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+
+class ImdbResponseShapeError(Exception):
+    """GraphQL 응답 구조가 예상과 다름 (→ Selenium 경로로 폴백)."""
+
+
+def create_session(pool_size: int = 4) -> requests.Session:
+    """keep-alive 커넥션을 재사용하는 세션."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": _USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Language": "en-US",
+            "Content-Type": "application/json",
+        }
+    )
+    return session
+
+
+def _parse_reviews_page(
+    payload: Dict, title_ko: str, title_en: str, year: int
+) -> Tuple[List[Tuple[str, Optional[Dict[str, str]]]], Optional[str], bool]:
+    """
+    GraphQL 응답 하나를 (rid, row) 목록 / 다음 커서 / 다음 페이지 여부로 변환.
+    구조가 다르면 ImdbResponseShapeError.
+    """
+    try:
+        if payload.get("errors"):
+            raise ImdbResponseShapeError(f"GraphQL errors: {payload['errors']}")
+        reviews = payload["data"]["title"]["reviews"]
+        edges = reviews["edges"]
+        page_info = reviews["pageInfo"]
+        if not isinstance(edges, list):
+            raise ImdbResponseShapeError("edges 가 리스트가 아님")
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ImdbResponseShapeError(f"예상과 다른 응답 구조: {e!r}")
+
+    meta = title_meta(None, title_ko, title_en, year)
+    out: List[Tuple[str, Optional[Dict[str, str]]]] = []
+    for edge in edges:
+        try:
+            node = edge["node"]
+            review_id = node["id"]
+            rating_val = node.get("authorRating")
+            text = ((node.get("text") or {}).get("originalText") or {}).get(
+                "plainText"
+            ) or ""
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ImdbResponseShapeError(f"예상과 다른 리뷰 노드: {e!r}")
+
+        rid = imdb_review_url(str(review_id))
+        if rid is None:
+            raise ImdbResponseShapeError(f"예상과 다른 리뷰 id: {review_id!r}")
+        review_text = text.strip().replace("\n", " ").strip()
+        if not review_text:
+            out.append((rid, None))
+            continue
+
+        # Selenium 경로와 동일하게 날짜는 비워 둔다
+        rating = "" if rating_val is None else str(rating_val)
+        out.append((rid, ReviewRecord(meta, rating, "", review_text)))
+
+    return out, page_info.get("endCursor"), bool(page_info.get("hasNextPage"))
+
+
+def fetch_imdb_reviews_http(
+    title_ko: str,
+    title_en: str,
+    year: int,
+    ttid: str,
+    max_reviews: int = 1000,
+    max_pages: int = 100,
+    session: Optional[requests.Session] = None,
+    graphql_url: str = IMDB_GRAPHQL_URL,
+    timeout: float = 10.0,
+    record_dir: Optional[str] = None,
+    start_after: Optional[str] = None,
+    seen_ids: Optional[Set[str]] = None,
+    on_page: Optional[
+        Callable[[List[Dict[str, str]], List[str], Optional[str]], None]
+    ] = None,
+) -> List[Dict[str, str]]:
+    """
+    GraphQL 커서를 따라가며 최대 max_reviews 개 수집.
+    record_dir 를 주면 응답을 {ttid}_{page}.json 으로 저장 (대역 서버 재생용).
+
+    start_after / seen_ids 로 이전 실행의 커서와 수집한 리뷰 id 를 넘기면 이어서 수집.
+    on_page(rows, rids, next_cursor) 를 주면 페이지마다 새 row 를 넘기고
+    반환 리스트에는 쌓지 않는다 (체크포인트 / 스트리밍 저장용).
+
+    요청마다 현재 스레드의 limiter 토큰을 받는다 (crawl_scheduler.pace, Selenium 경로와
+    같은 속도 제한). 429 / 503 은 ThrottledError 로 올려서 스케줄러가 늦추고
+    재시도하게 하고, 그 밖의 HTTP 오류는 requests.RequestException, 응답 구조 변화는
+    ImdbResponseShapeError 로 그대로 올라간다.
+    """
+    own_session = session is None
+    if session is None:
+        session = create_session()
+
+    collected: List[Dict[str, str]] = []
+    n_collected = 0
+    if seen_ids is None:
+        seen_ids = set()
+    after: Optional[str] = start_after
+
+    try:
+        for page in range(max_pages):
+            variables = {"const": ttid, "first": IMDB_PAGE_SIZE, "after": after}
+            pace()
+            with stage("http_fetch"):
+                resp = session.post(
+                    graphql_url,
+                    json={
+                        "operationName": "TitleReviews",
+                        "query": _REVIEWS_QUERY,
+                        "variables": variables,
+                    },
+                    timeout=timeout,
+                )
+            count("pages")
+            if resp.status_code in (429, 503):
+                raise ThrottledError(f"HTTP {resp.status_code}")
+            resp.raise_for_status()
+            try:
+                payload = resp.json()
+            except ValueError as e:
+                raise ImdbResponseShapeError(f"JSON 아님: {e}")
+
+            if record_dir:
+                os.makedirs(record_dir, exist_ok=True)
+                path = os.path.join(record_dir, f"{ttid}_{page}.json")
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {"variables": variables, "response": payload},
+                        f,
+                        ensure_ascii=False,
+                    )
+
+            items, after, has_next = _parse_reviews_page(
+                payload, title_ko, title_en, year
+            )
+            page_rows: List[Dict[str, str]] = []
+            page_rids: List[str] = []
+            for rid, parsed in items:
+                if rid in seen_ids or not parsed:
+                    continue
+                seen_ids.add(rid)
+                page_rows.append(parsed)
+                page_rids.append(rid)
+                if n_collected + len(page_rows) >= max_reviews:
+                    break
+
+            n_collected += len(page_rows)
+            if on_page is not None:
+                on_page(page_rows, page_rids, after)
+            else:
+                collected.extend(page_rows)
+
+            log(f"[IMDB-HTTP] {title_en} – page {page}: 누적 {n_collected}개", LOG_DEBUG)
+
+            if n_collected >= max_reviews:
+                print(f"[IMDB-HTTP] {title_en} – max_reviews({max_reviews}) 도달, 종료")
+                break
+            if not has_next or not after:
+                print(f"[IMDB-HTTP] {title_en} – 다음 페이지 없음, 종료")
+                break
+    finally:
+        if own_session:
+            session.close()
+
+    return collected
+
+
+# =========================================================
+# 녹화 응답 재생 서버 (로컬 대역)
+# =========================================================
+
+def make_replay_server(
+    record_dir: str, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """
+    record_dir 의 녹화 응답을 (ttid, after) 로 찾아 돌려주는 GraphQL 대역 서버.
+    port=0 이면 빈 포트를 잡는다 (server.server_address 로 확인).
+    """
+    responses: Dict[Tuple[str, Optional[str]], Dict] = {}
+    for name in os.listdir(record_dir):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(record_dir, name), "r", encoding="utf-8") as f:
+            rec = json.load(f)
+        v = rec.get("variables") or {}
+        responses[(v.get("const"), v.get("after"))] = rec.get("response")
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                body = {}
+            v = body.get("variables") or {}
+            payload = responses.get((v.get("const"), v.get("after")))
+            if payload is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args) -> None:
+            pass
+
+    return ThreadingHTTPServer((host, port), _Handler)
+
+
+def check_replay(record_dir: str, ttid: str) -> bool:
+    """
+    record_dir 재생 서버로 fetch_imdb_reviews_http 를 돌려서, 녹화된 페이지의
+    리뷰 id (본문 있는 것) 를 같은 순서로 모두 받는지 확인.
+    """
+    expected: List[str] = []
+    pages = glob.glob(os.path.join(record_dir, f"{ttid}_*.json"))
+    for path in sorted(pages, key=lambda p: int(p.rsplit("_", 1)[1][:-5])):
+        with open(path, "r", encoding="utf-8") as f:
+            items, _, _ = _parse_reviews_page(json.load(f)["response"], "", "", 0)
+        expected.extend(rid for rid, row in items if row is not None)
+    if not expected:
+        print(f"[IMDB-HTTP] {record_dir} 에 {ttid} 녹화 응답 없음")
+        return False
+
+    server = make_replay_server(record_dir)
+    th = threading.Thread(target=server.serve_forever, daemon=True)
+    th.start()
+    got: List[str] = []
+    try:
+        host, port = server.server_address[:2]
+        fetch_imdb_reviews_http(
+            "",
+            ttid,
+            0,
+            ttid,
+            max_reviews=len(expected) + IMDB_PAGE_SIZE,
+            max_pages=len(pages) + 1,
+            graphql_url=f"http://{host}:{port}/",
+            timeout=5.0,
+            on_page=lambda rows, rids, cursor: got.extend(rids),
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    ok = got == expected
+    print(
+        f"[IMDB-HTTP] 재생 확인 {ttid}: 녹화 {len(expected)}개 / 수집 {len(got)}개 "
+        f"→ {'OK' if ok else '불일치'}"
+    )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="IMDb GraphQL 녹화 응답 재생 서버")
+    parser.add_argument("--replay", required=True, help="녹화 응답 디렉토리")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--check", metavar="TTID", help="서버를 띄우는 대신 이 타이틀로 재생 확인만"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check_replay(args.replay, args.check) else 1)
+
+    server = make_replay_server(args.replay, port=args.port)
+    print(f"[IMDB-HTTP] 재생 서버 → http://127.0.0.1:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,77 @@
+import argparse
+import atexit
 import csv
 import os
-import time
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from browser_pool import BrowserPool
+from browser_profile import BrowserProfiles
+from crawl_checkpoint import CheckpointStore
+from crawl_metrics import (
+    LOG_DEBUG,
+    LOG_INFO,
+    close_metrics,
+    configure_metrics,
+    count,
+    log,
+    stage,
+    title_metrics,
+)
+from crawl_pool import crawl_targets_parallel
+from crawl_scheduler import ThrottledError, limiter_for, pace
+from crawl_utils import (
+    CommitPipeline,
+    RowCollector,
+    WaitClock,
+    SCRIPT_TIMEOUT,
+    detect_block_page,
+    find_optional,
+    load_known_review_keys,
+    prune_cards,
+    wait_for_card_count,
+)
+from debug_snapshots import (
+    SNAPSHOT_COMPRESSIONS,
+    SNAPSHOT_LEVELS,
+    configure_snapshots,
+    flush_snapshots,
+    save_snapshot,
+)
+from driver_supervisor import retire_driver
+from lean_browser import (
+    apply_lean_options,
+    enable_lean_blocking,
+    report_lean_savings,
+    reset_lean_stats,
+)
+from review_db import ReviewDB
+from review_dedup import DedupIndex
+from review_record import ReviewRecord, imdb_review_url, title_meta
+from row_sink import CsvSpoolWriter
+
 
 # =========================================================
 # 1. 크롬 드라이버 생성
 # =========================================================
 
-def create_driver(headless: bool = False) -> webdriver.Chrome:
+def create_driver(
+    headless: bool = False,
+    lean: bool = False,
+    lean_allow: Optional[List[str]] = None,
+    profiles: Optional[BrowserProfiles] = None,
+) -> webdriver.Chrome:
+    """
+    lean=True 면 이미지 / 폰트 / 동영상 / 광고·트래커 요청을 막는 가벼운 프로필.
+    lean_allow 로 막지 않을 범주("font") 나 URL 패턴을 지정.
+    profiles 를 주면 거기서 빌린 user-data-dir (디스크 캐시 / 쿠키가 실행 간에 남는다).
+    """
     chrome_options = Options()
 
     if headless:
@@ -32,8 +89,29 @@ def create_driver(headless: bool = False) -> webdriver.Chrome:
         "Chrome/120.0.0.0 Safari/537.36"
     )
 
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(3)
+    if lean:
+        apply_lean_options(chrome_options)
+
+    profile = profiles.acquire() if profiles is not None else None
+    if profile is not None:
+        for arg in profiles.chrome_args(profile):
+            chrome_options.add_argument(arg)
+
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+    except Exception:
+        if profile is not None:
+            profiles.release(profile, promote=False)
+        raise
+    if profile is not None:
+        profiles.attach(driver, profile)
+    # 암묵적 대기는 끈다: 없는 선택 필드(평점 등)를 조회할 때마다 3초씩 멈추기 때문.
+    # 페이지 준비 상태는 WebDriverWait 로 명시적으로 기다린다.
+    driver.implicitly_wait(0)
+    # MutationObserver 기반 대기(execute_async_script) 상한
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
+    if lean:
+        enable_lean_blocking(driver, allow=lean_allow)
     return driver
 
 
@@ -43,7 +121,7 @@ def create_driver(headless: bool = False) -> webdriver.Chrome:
 
 def parse_review_element(
     el, title_ko: str, title_en: str, year: int
-) -> Optional[Dict[str, str]]:
+) -> Optional[ReviewRecord]:
     """
     IMDb 리뷰 카드 하나에서 rating / date / review 텍스트를 추출.
     (새 DOM 기준)
@@ -51,31 +129,27 @@ def parse_review_element(
     try:
         # ---- rating ----
         rating = ""
-        try:
-            rating_el = el.find_element(
-                By.CSS_SELECTOR,
-                "span.ipc-rating-star--rating"
-            )
+        rating_el = find_optional(
+            el, By.CSS_SELECTOR, "span.ipc-rating-star--rating"
+        )
+        if rating_el is not None:
             txt = rating_el.text.strip()
             if txt:
                 # 예: "9" 또는 "9/10"
                 rating = txt.split("/")[0].strip()
-        except Exception:
-            pass
 
         # ---- review text ----
         review_text = ""
-        try:
-            text_el = el.find_element(
-                By.CSS_SELECTOR,
-                "div[data-testid='review-overflow'] "
-                "div.ipc-html-content-inner-div"
-            )
+        text_el = find_optional(
+            el,
+            By.CSS_SELECTOR,
+            "div[data-testid='review-overflow'] "
+            "div.ipc-html-content-inner-div"
+        )
+        if text_el is not None:
             txt = text_el.text.strip()
             if txt:
                 review_text = txt.replace("\n", " ").strip()
-        except Exception:
-            pass
 
         # ---- date ----
         # 최근 IMDb 레이아웃에서는 날짜가 별도 span으로 안 나와서 일단 빈 값
@@ -84,25 +158,164 @@ def parse_review_element(
         if not review_text:
             return None
 
-        return {
-            "title_ko": title_ko,
-            "title_en": title_en,
-            "year": str(year),
-            "rating": rating,
-            "date": date_text,
-            "review": review_text,
-        }
+        return ReviewRecord(
+            title_meta(None, title_ko, title_en, year),
+            rating,
+            date_text,
+            review_text,
+        )
 
     except Exception:
         return None
 
 
+# =========================================================
+# 2-1. 배치 카드 추출 (execute_script 1회 왕복)
+# =========================================================
+
+REVIEW_CARD_SELECTOR = "div[data-testid='review-card-parent']"
+
+# 리뷰 페이지 호스트 (bench_replay 는 로컬 재생 서버 주소로 바꿔서 호출)
+IMDB_BASE_URL = "https://www.imdb.com"
+
+# 델타 모드에서 리뷰 페이지를 최신순으로 여는 쿼리
+IMDB_NEWEST_FIRST_QUERY = "?sort=submissionDate&dir=desc"
+
+# review-card-parent[start:end] 구간을 한 번에 읽어서 JSON으로 돌려주는 스크립트.
+# 셀렉터는 parse_review_element / 카드별 href 조회와 동일하게 맞춘다.
+_EXTRACT_CARDS_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var start = arguments[1];
+var end = Math.min(arguments[2], cards.length);
+var out = [];
+for (var i = start; i < end; i++) {
+    var el = cards[i];
+    var link = el.querySelector("a[href*='/review/']");
+    var ratingEl = el.querySelector("span.ipc-rating-star--rating");
+    var textEl = el.querySelector(
+        "div[data-testid='review-overflow'] div.ipc-html-content-inner-div"
+    );
+    out.push({
+        href: link ? (link.href || "") : "",
+        rating: ratingEl ? ratingEl.innerText : "",
+        text: textEl ? textEl.innerText : ""
+    });
+}
+return out;
+"""
+
+
+def count_review_cards(driver: webdriver.Chrome) -> int:
+    """현재 DOM에 붙어 있는 review-card-parent 개수 (WebElement 목록 없이 JS로)."""
+    return int(
+        driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;",
+            REVIEW_CARD_SELECTOR,
+        )
+        or 0
+    )
+
+
+def extract_review_batch_js(
+    driver: webdriver.Chrome, start: int, end: int
+) -> Optional[List[Dict[str, str]]]:
+    """
+    review-card-parent[start:end] 카드들의 href / rating / text 를
+    execute_script 한 번으로 가져온다. 실패하면 None (→ 카드별 파싱으로 폴백).
+    """
+    try:
+        raw = driver.execute_script(
+            _EXTRACT_CARDS_JS, REVIEW_CARD_SELECTOR, start, end
+        )
+    except Exception as e:
+        print(f"[IMDB] JS 배치 추출 실패, 카드별 파싱으로 폴백: {e}")
+        return None
+
+    if not isinstance(raw, list):
+        return None
+    return raw
+
+
+def _row_from_raw_card(
+    raw: Dict[str, str], title_ko: str, title_en: str, year: int
+) -> Optional[ReviewRecord]:
+    """JS로 받은 카드 dict를 parse_review_element 와 같은 row 형태로 변환."""
+    rating = ""
+    txt = (raw.get("rating") or "").strip()
+    if txt:
+        rating = txt.split("/")[0].strip()
+
+    review_text = (raw.get("text") or "").strip().replace("\n", " ").strip()
+    if not review_text:
+        return None
+
+    return ReviewRecord(
+        title_meta(None, title_ko, title_en, year), rating, "", review_text
+    )
+
+
+def _with_review_id(row: Dict[str, str], rid: str) -> Dict[str, str]:
+    """
+    review_db 용 안정 id(/review/ href)를 row 에 붙인다. CSV 에는 안 쓰인다.
+    href 를 못 찾은 idx-* 카드는 비워 두고 DB 쪽에서 내용 해시로 대신한다.
+    """
+    if not rid.startswith("idx-"):
+        row["review_id"] = rid
+    return row
+
+
+def _extract_review_rows(
+    driver: webdriver.Chrome,
+    start: int,
+    end: int,
+    batch_no: int,
+    title_ko: str,
+    title_en: str,
+    year: int,
+    extraction: str = "js",
+) -> List[Tuple[str, Optional[Dict[str, str]]]]:
+    """
+    review-card-parent[start:end] 구간에서 (rid, row) 목록을 만든다.
+    row가 None이면 본문이 없는 카드. rid가 없으면 idx-{batch_no}-{i} 로 대체.
+
+    extraction="js"     : execute_script 1회로 구간 전체 추출 (실패 시 폴백)
+    extraction="element": 카드마다 find_element 로 조회 (기존 방식)
+    """
+    if extraction == "js":
+        raw_cards = extract_review_batch_js(driver, start, end)
+        if raw_cards is not None:
+            out = []
+            for idx, raw in enumerate(raw_cards):
+                rid = imdb_review_url(raw.get("href")) or f"idx-{batch_no}-{idx}"
+                out.append(
+                    (rid, _row_from_raw_card(raw, title_ko, title_en, year))
+                )
+            return out
+
+    # ---- 카드별 WebDriver 조회 (폴백) ----
+    review_elements = driver.find_elements(
+        By.CSS_SELECTOR, REVIEW_CARD_SELECTOR
+    )[start:end]
+
+    out = []
+    for idx, el in enumerate(review_elements):
+        rid = None
+        link = find_optional(el, By.CSS_SELECTOR, "a[href*='/review/']")
+        if link is not None:
+            rid = imdb_review_url(link.get_attribute("href"))
+        if not rid:
+            rid = f"idx-{batch_no}-{idx}"
+
+        out.append((rid, parse_review_element(el, title_ko, title_en, year)))
+    return out
+
+
 # =========================================================
 # 3. 특정 작품(ttid) 리뷰 크롤링 (25 more 버튼 + 증분 파싱)
 # =========================================================
 
 def crawl_imdb_reviews_for_title(
-    driver: webdriver.Chrome,
+    driver: Optional[webdriver.Chrome],
     title_ko: str,
     title_en: str,
     year: int,
@@ -110,226 +323,498 @@ def crawl_imdb_reviews_for_title(
     max_reviews: int = 1000,
     max_clicks: int = 100,
     click_timeout: float = 6.0,  # 호출부와 시그니처 맞추기용 (내부에선 안 씀)
+    extraction: str = "js",
+    row_sink: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+    known_reviews: Optional[Set[str]] = None,
+    bounded_dom: bool = False,
+    base_url: str = IMDB_BASE_URL,
+    pipelined: bool = True,
+    graphql_url: Optional[str] = None,
+    http_session=None,
+    driver_factory: Optional[Callable[[], webdriver.Chrome]] = None,
 ) -> List[Dict[str, str]]:
     """
-    /title/{ttid}/reviews 페이지에서:
+    {base_url}/title/{ttid}/reviews 페이지에서:
 
       1) 초기로 로드된 리뷰 25개 파싱
       2) 하단 "25 more" 버튼 반복 클릭
       3) 클릭될 때마다 새로 늘어난 카드만 파싱
 
     이런 식으로 최대 max_reviews까지 수집.
+    extraction="js" 이면 새 카드 구간을 execute_script 한 번으로 읽고,
+    "element" 이면 카드마다 WebDriver 조회 (JS 실패 시에도 이쪽으로 폴백).
+    "offline" 이면 클릭으로 페이지만 끝까지 펼치고, 마지막 page_source 를
+    offline_parser 로 한 번에 파싱.
+    "http" 이면 브라우저 없이 imdb_http 로 페이지네이션 엔드포인트를 직접 호출하고,
+    HTTP 오류나 응답 구조 변화가 있으면 "js" 경로로 폴백 (HTTP 로 모은 row / id 를
+    이어받아서 다시 모으지 않는다). http 모드는 driver=None 으로 부를 수 있고,
+    그때 폴백은 driver_factory() 로 드라이버를 하나 띄워서 쓰고 끝나면 끈다.
+
+    row_sink 를 주면 카드 배치를 파싱할 때마다 row_sink(rows) 로 바로 넘기고
+    메모리에 쌓지 않는다 (이 경우 반환값은 빈 리스트).
+
+    checkpoint 를 주면 배치마다 수집한 리뷰 id / 클릭 수를 기록하고, 이전 실행의
+    상태가 있으면 그 클릭 수까지 파싱 없이 빨리 감은 뒤 이어서 수집한다.
+
+    known_reviews(이미 저장된 리뷰 본문 집합)를 주면 델타 모드: 최신순으로 열고,
+    저장된 리뷰는 건너뛰며, 한 배치가 저장된 리뷰만 가져오면 거기서 멈춘다.
+
+    bounded_dom=True 면 파싱해서 seen 에 기록한 카드는 라이브 DOM 에서 비운다.
+    리뷰가 수천 개인 타이틀에서도 클릭당 비용과 크롬 메모리가 늘지 않는다.
+    (offline 모드는 마지막 page_source 가 전부 필요해서 무시)
+
+    base_url 은 리뷰 페이지 호스트 (bench_replay 의 로컬 재생 서버 등).
+    graphql_url / http_session 은 http 모드에서 fetch_imdb_reviews_http 로 그대로 넘긴다
+    (graphql_url 로 imdb_http.make_replay_server 재생 서버를 가리킬 수 있다).
+
+    pipelined=True 면 (row_sink 가 있을 때) 배치의 sink 쓰기 / 체크포인트 기록을
+    백그라운드 스레드(CommitPipeline)에 맡기고 바로 다음 '25 more' 를 누른다.
+
+    끝나면 이 타이틀에서 명시적 대기/sleep 에 쓴 시간을 출력.
     """
-    url = f"https://www.imdb.com/title/{ttid}/reviews"
-    print(f"[IMDB] '{title_en}' 리뷰 수집 시작 (ttid={ttid})")
-    driver.get(url)
+    with title_metrics("IMDB", title_en) as tm:
+        http_rows: Optional[RowCollector] = None
+        http_seen: Optional[Set[str]] = None
+        if extraction == "http":
+            # requests 는 http 모드에서만 필요
+            import requests
+            from imdb_http import (
+                IMDB_GRAPHQL_URL,
+                ImdbResponseShapeError,
+                fetch_imdb_reviews_http,
+            )
 
-    wait = WebDriverWait(driver, 10)
+            print(f"[IMDB] '{title_en}' HTTP 페이지네이션으로 수집 시작 (ttid={ttid})")
+            state = checkpoint.get(ttid) if checkpoint is not None else {}
+            # fetch 가 받은 id 를 여기에 더한다 (폴백할 때 Selenium 경로로 넘김)
+            http_seen = set(state.get("seen", []))
+            collected = RowCollector(row_sink, initial_count=len(http_seen))
+
+            def _on_page(rows, rids, cursor) -> None:
+                # 델타 모드: GraphQL 응답은 날짜순이 아니라서 조기 종료 없이 걸러내기만
+                for r, rid in zip(rows, rids):
+                    if known_reviews is not None and r["review"] in known_reviews:
+                        continue
+                    collected.append(_with_review_id(r, rid))
+                collected.flush()
+                if checkpoint is not None:
+                    checkpoint.update(ttid, rids, cursor=cursor)
 
-    # ---- 0) 초기 리뷰 카드 DOM 등장까지 대기 ----
-    try:
-        wait.until(
-            lambda d: len(
-                d.find_elements(
-                    By.CSS_SELECTOR,
-                    "div[data-testid='review-card-parent']"
+            try:
+                fetch_imdb_reviews_http(
+                    title_ko,
+                    title_en,
+                    year,
+                    ttid,
+                    max_reviews=max_reviews - len(collected),
+                    max_pages=max_clicks + 1,
+                    start_after=state.get("cursor"),
+                    seen_ids=http_seen,
+                    on_page=_on_page,
+                    session=http_session,
+                    graphql_url=graphql_url or IMDB_GRAPHQL_URL,
+                )
+                if checkpoint is not None:
+                    checkpoint.mark_done(ttid)
+                return collected.result()
+            except (ImdbResponseShapeError, requests.RequestException) as e:
+                if driver is None and driver_factory is None:
+                    raise
+                # HTTP 로 모은 id / row 를 넘겨서 Selenium 경로는 첫 페이지부터
+                # 파싱하면서 그 리뷰를 건너뛴다 (progress 0 은 빨리 감기 없음)
+                print(
+                    f"[IMDB] {title_en} – HTTP 수집 실패, Selenium 경로로 폴백: {e}"
                 )
-            ) > 0
+                extraction = "js"
+                http_rows = collected
+
+        # 브라우저 없이 돌던 http 워커의 폴백: 이 타이틀에만 드라이버를 띄운다
+        own_driver = driver is None
+        if own_driver:
+            driver = driver_factory()
+
+        reset_lean_stats(driver)
+        clock = WaitClock()
+        pipeline = (
+            CommitPipeline(name=f"IMDB-commit-{ttid}")
+            if pipelined and row_sink is not None
+            else None
         )
-    except TimeoutException:
+        try:
+            return _crawl_imdb_reviews(
+                driver,
+                title_ko,
+                title_en,
+                year,
+                ttid,
+                max_reviews=max_reviews,
+                max_clicks=max_clicks,
+                click_timeout=click_timeout,
+                extraction=extraction,
+                row_sink=row_sink,
+                checkpoint=checkpoint,
+                known_reviews=known_reviews,
+                bounded_dom=bounded_dom,
+                base_url=base_url,
+                clock=clock,
+                pipeline=pipeline,
+                seen_ids=http_seen,
+                carry=http_rows,
+            )
+        finally:
+            if pipeline is not None:
+                # 예외로 끝나도 이미 넘긴 배치는 저장하고 체크포인트까지 기록
+                pipeline.close()
+            print(f"[IMDB] {title_en} – 대기 시간 합계 {clock.summary()}")
+            tm.add_waits(clock)
+            report_lean_savings(driver, f"[IMDB] {title_en}")
+            if own_driver:
+                retire_driver(driver)
+
+
+def _crawl_imdb_reviews(
+    driver: webdriver.Chrome,
+    title_ko: str,
+    title_en: str,
+    year: int,
+    ttid: str,
+    max_reviews: int = 1000,
+    max_clicks: int = 100,
+    click_timeout: float = 6.0,  # 호출부와 시그니처 맞추기용 (내부에선 안 씀)
+    extraction: str = "js",
+    row_sink: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+    known_reviews: Optional[Set[str]] = None,
+    bounded_dom: bool = False,
+    base_url: str = IMDB_BASE_URL,
+    clock: Optional[WaitClock] = None,
+    pipeline: Optional[CommitPipeline] = None,
+    seen_ids: Optional[Set[str]] = None,
+    carry: Optional[RowCollector] = None,
+) -> List[Dict[str, str]]:
+    """
+    crawl_imdb_reviews_for_title 본체. 대기 시간은 clock 에 누적.
+    seen_ids / carry 는 HTTP 폴백에서 넘어온 수집한 id 와 누적기
+    (sink 가 없으면 carry.rows 에 아직 row 가 남아 있다).
+    """
+    if clock is None:
+        clock = WaitClock()
+    offline = extraction == "offline"
+    if offline and bounded_dom:
+        print(f"[IMDB] {title_en} – offline 모드는 전체 page_source 가 필요해서 bounded DOM 끔")
+        bounded_dom = False
+
+    url = f"{base_url}/title/{ttid}/reviews"
+    if known_reviews is not None:
+        # 델타 모드는 최신 리뷰부터 봐야 '이미 아는 리뷰'에서 멈출 수 있다
+        url += IMDB_NEWEST_FIRST_QUERY
+    print(f"[IMDB] '{title_en}' 리뷰 수집 시작 (ttid={ttid})")
+    pace()
+    with stage("navigate"):
+        driver.get(url)
+    count("pages")
+
+    # ---- 0) 초기 리뷰 카드 DOM 등장까지 대기 (붙는 즉시 반환, 10초 상한) ----
+    if wait_for_card_count(driver, REVIEW_CARD_SELECTOR, 1, 10, clock) == 0:
         # 이 타이틀은 새 리뷰 카드 DOM이 없을 수 있음 (리뷰 없음 / 다른 레이아웃 등)
-        os.makedirs("debug", exist_ok=True)
-        debug_path = os.path.join(
-            "debug", f"imdb_reviews_{ttid}_no_review_cards.html"
+        debug_path = save_snapshot(
+            f"imdb_reviews_{ttid}_no_review_cards",
+            lambda: driver.page_source,
+            error=True,
         )
-        with open(debug_path, "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
+        block = detect_block_page(driver)
         print(
-            f"[IMDB] {title_en} – 리뷰 카드 DOM을 찾지 못함. "
-            f"HTML 저장 → {debug_path}. 이 타이틀은 스킵합니다."
+            f"[IMDB] {title_en} – 리뷰 카드 DOM을 찾지 못함"
+            + (f" (차단 표식: {block})" if block else "")
         )
-        return []
+        if debug_path:
+            print(f"[DEBUG] HTML 저장 → {debug_path}")
+        # 스케줄러가 늦춰서 다시 시도. 차단 표식이 없으면 리뷰가 정말 없을 수도 있어서 soft
+        raise ThrottledError(block or "리뷰 카드 없음", soft=not block)
+
+    # ---- 디버그용 초기 HTML 저장 (level 에 따라, 쓰기는 백그라운드) ----
+    debug_path = save_snapshot(
+        f"imdb_reviews_{ttid}_page0", lambda: driver.page_source, sample_key=ttid
+    )
+    if debug_path:
+        print(f"[DEBUG] 초기 HTML 저장 → {debug_path}")
+
+    seen_ids = set(seen_ids or ())
+    # 이전 실행 체크포인트: 이 클릭 수까지는 파싱 없이 클릭만 (빨리 감기)
+    resume_clicks = -1
+    if checkpoint is not None:
+        state = checkpoint.get(ttid)
+        seen_ids.update(state["seen"])
+        if state["progress"]:
+            resume_clicks = state["progress"]
+            print(
+                f"[IMDB] {title_en} – 체크포인트: {len(seen_ids)}개 수집됨, "
+                f"클릭 {resume_clicks}회까지 빨리 감기"
+            )
+        elif seen_ids:
+            # 첫 페이지만 기록됐거나 HTTP 모드가 모은 id: 첫 페이지부터 파싱하며 건너뛴다
+            print(f"[IMDB] {title_en} – 체크포인트: {len(seen_ids)}개 수집됨")
+
+    # row_sink 가 있으면 배치마다 넘기고 비우는 누적기
+    collected = RowCollector(
+        row_sink, initial_count=len(seen_ids), pipeline=pipeline
+    )
+    if carry is not None:
+        # HTTP 폴백: 이번 실행에서 모은 row 와 개수를 이어받는다
+        collected.rows.extend(carry.rows)
+        collected.initial_count = carry.initial_count
+    batch_rids: List[str] = []
+    known_hits = [0]  # 이번 배치에서 이미 저장된 리뷰를 만난 수 (델타 모드)
+
+    def _already_stored(parsed: Dict[str, str]) -> bool:
+        if known_reviews is not None and parsed["review"] in known_reviews:
+            known_hits[0] += 1
+            return True
+        return False
+
+    def _only_known_in_batch() -> bool:
+        """델타 모드 종료 조건: 이번 배치가 저장된 리뷰만 가져왔는지."""
+        return known_reviews is not None and known_hits[0] > 0 and not batch_rids
+
+    def _commit_batch(progress: int) -> None:
+        # row 를 sink 로 먼저 넘기고 나서 체크포인트에 기록 (pipeline 이면 백그라운드에서)
+        rids = list(batch_rids)
+        collected.flush(
+            after=(
+                (lambda: checkpoint.update(ttid, rids, progress=progress))
+                if checkpoint is not None
+                else None
+            )
+        )
+        batch_rids.clear()
+        known_hits[0] = 0
+
+    def _finish() -> List[Dict[str, str]]:
+        # 남은 쓰기가 모두 끝난 뒤에 완료 표시
+        rows = collected.result()
+        if checkpoint is not None:
+            checkpoint.mark_done(ttid)
+        return rows
 
-    # ---- 디버그용 초기 HTML 저장 ----
-    os.makedirs("debug", exist_ok=True)
-    debug_path = os.path.join("debug", f"imdb_reviews_{ttid}_page0.html")
-    with open(debug_path, "w", encoding="utf-8") as f:
-        f.write(driver.page_source)
-    print(f"[DEBUG] 초기 HTML 저장됨 → {debug_path}")
+    pruned_upto = [0]
 
-    collected: List[Dict[str, str]] = []
-    seen_ids = set()
+    def _prune_parsed() -> None:
+        """bounded DOM: 파싱·기록이 끝난 카드[:prev_count] 비우기."""
+        if bounded_dom and prev_count > pruned_upto[0]:
+            with stage("prune"):
+                prune_cards(driver, REVIEW_CARD_SELECTOR, pruned_upto[0], prev_count)
+            pruned_upto[0] = prev_count
 
     # ---- 1) 처음 로드된 리뷰들 파싱 ----
-    review_elements = driver.find_elements(
-        By.CSS_SELECTOR,
-        "div[data-testid='review-card-parent']"
-    )
-    prev_count = len(review_elements)
+    prev_count = count_review_cards(driver)
     print(f"[IMDB] {title_en} – 초기 리뷰 카드 수: {prev_count}")
 
-    for idx, el in enumerate(review_elements):
-        rid = None
-        try:
-            link = el.find_element(
-                By.CSS_SELECTOR,
-                "a[href*='/review/']"
+    delta_done = False
+    if not offline and resume_clicks < 0:
+        with stage("extract"):
+            first_rows = _extract_review_rows(
+                driver, 0, prev_count, 0, title_ko, title_en, year, extraction
             )
-            href = link.get_attribute("href") or ""
-            if href:
-                rid = href
-        except Exception:
-            pass
-        if not rid:
-            rid = f"idx-0-{idx}"
-
-        if rid in seen_ids:
-            continue
-
-        parsed = parse_review_element(el, title_ko, title_en, year)
-        if not parsed:
-            continue
+        for rid, parsed in first_rows:
+            if rid in seen_ids:
+                continue
+            if not parsed:
+                continue
+            if _already_stored(parsed):
+                continue
 
-        seen_ids.add(rid)
-        collected.append(parsed)
+            seen_ids.add(rid)
+            batch_rids.append(rid)
+            collected.append(_with_review_id(parsed, rid))
 
-    print(f"[IMDB] {title_en} – 초기 수집: {len(collected)}개")
+        delta_done = _only_known_in_batch()
+        _commit_batch(0)
+        _prune_parsed()
+        print(f"[IMDB] {title_en} – 초기 수집: {len(collected)}개")
+        if delta_done:
+            print(f"[IMDB] {title_en} – 첫 페이지가 전부 저장된 리뷰, 새 리뷰 없음")
 
     if len(collected) >= max_reviews:
         print(f"[IMDB] {title_en} – max_reviews({max_reviews}) 도달, 종료")
-        return collected
+        return _finish()
 
     # ---- 2) '25 more' 버튼 클릭 반복 ----
     click_count = 0
 
-    while click_count < max_clicks and len(collected) < max_reviews:
-        # 맨 아래로 스크롤해서 버튼 보이게
+    while (
+        not delta_done
+        and click_count < max_clicks
+        and len(collected) < max_reviews
+    ):
+        # offline 모드는 파싱 없이 카드 수만 보고 펼친다
+        if offline and prev_count >= max_reviews:
+            break
+
+        # 맨 아래로 스크롤 (버튼은 JS 클릭이라 스크롤 완료를 기다릴 필요 없음)
         driver.execute_script(
             "window.scrollTo(0, document.body.scrollHeight);"
         )
-        time.sleep(0.5)
 
         # "25 more" 버튼 찾기
         try:
-            more_btn = driver.find_element(
-                By.XPATH,
-                "//button[.//span[contains(@class,'ipc-see-more__text') and "
-                "contains(normalize-space(.), '25 more')]]"
+            more_btn = clock.until(
+                WebDriverWait(driver, 3),
+                EC.presence_of_element_located(
+                    (
+                        By.XPATH,
+                        "//button[.//span[contains(@class,'ipc-see-more__text') and "
+                        "contains(normalize-space(.), '25 more')]]",
+                    )
+                ),
+                "more_button",
             )
-        except Exception:
+        except TimeoutException:
+            block = detect_block_page(driver)
+            if block:
+                raise ThrottledError(block)
             print(
                 f"[IMDB] {title_en} – '25 more' 버튼 없음, 추가 리뷰 없음, 종료"
             )
             break
 
         # 클릭
+        pace()
         try:
-            driver.execute_script("arguments[0].click();", more_btn)
+            with stage("click"):
+                driver.execute_script("arguments[0].click();", more_btn)
             click_count += 1
-            print(
-                f"[IMDB] {title_en} – '25 more' 버튼 클릭 {click_count}회"
-            )
+            count("clicks")
+            log(f"[IMDB] {title_en} – '25 more' 버튼 클릭 {click_count}회", LOG_DEBUG)
         except Exception as e:
             print(
                 f"[IMDB] {title_en} – '25 more' 클릭 중 예외 발생, 종료: {e}"
             )
             break
 
-        # 새 리뷰 카드가 로드될 때까지 개수 증가 기준으로 대기
-        def _new_reviews_loaded(d):
-            elems = d.find_elements(
-                By.CSS_SELECTOR,
-                "div[data-testid='review-card-parent']"
-            )
-            return len(elems) > prev_count
-
-        try:
-            wait.until(_new_reviews_loaded)
-        except TimeoutException:
+        # 새 리뷰 카드가 DOM에 붙는 순간까지 대기 (MutationObserver, 10초 상한)
+        new_count = wait_for_card_count(
+            driver, REVIEW_CARD_SELECTOR, prev_count + 1, 10, clock, "new_cards"
+        )
+        if new_count <= prev_count:
+            block = detect_block_page(driver)
+            if block:
+                raise ThrottledError(block)
             print(
                 f"[IMDB] {title_en} – 클릭 후 새 리뷰 카드가 안 늘어남, 종료"
             )
             break
 
         # 늘어난 만큼만 새로 파싱
-        review_elements = driver.find_elements(
-            By.CSS_SELECTOR,
-            "div[data-testid='review-card-parent']"
-        )
-        new_count = len(review_elements)
-        print(
-            f"[IMDB] {title_en} – 클릭 후 리뷰 카드 수: {new_count}"
-        )
+        count("pages")
+        log(f"[IMDB] {title_en} – 클릭 후 리뷰 카드 수: {new_count}", LOG_DEBUG)
 
-        new_elems = review_elements[prev_count:new_count]
-        prev_count = new_count
+        if offline or click_count <= resume_clicks:
+            prev_count = new_count
+            _prune_parsed()
+            continue
 
-        for idx, el in enumerate(new_elems):
-            rid = None
-            try:
-                link = el.find_element(
-                    By.CSS_SELECTOR,
-                    "a[href*='/review/']"
-                )
-                href = link.get_attribute("href") or ""
-                if href:
-                    rid = href
-            except Exception:
-                pass
-            if not rid:
-                rid = f"idx-{click_count}-{idx}"
+        with stage("extract"):
+            new_rows = _extract_review_rows(
+                driver, prev_count, new_count, click_count,
+                title_ko, title_en, year, extraction,
+            )
+        prev_count = new_count
 
+        for rid, parsed in new_rows:
             if rid in seen_ids:
                 continue
-
-            parsed = parse_review_element(el, title_ko, title_en, year)
             if not parsed:
                 continue
+            if _already_stored(parsed):
+                continue
 
             seen_ids.add(rid)
-            collected.append(parsed)
+            batch_rids.append(rid)
+            collected.append(_with_review_id(parsed, rid))
 
             if len(collected) % 50 == 0:
-                print(
-                    f"[IMDB] {title_en} – 현재까지 {len(collected)}개 수집"
-                )
+                log(f"[IMDB] {title_en} – 현재까지 {len(collected)}개 수집", LOG_DEBUG)
 
             if len(collected) >= max_reviews:
                 print(
                     f"[IMDB] {title_en} – max_reviews({max_reviews}) 도달, 종료"
                 )
-                debug_path_last = os.path.join(
-                    "debug", f"imdb_reviews_{ttid}_last.html"
+                debug_path_last = save_snapshot(
+                    f"imdb_reviews_{ttid}_last",
+                    lambda: driver.page_source,
+                    sample_key=ttid,
                 )
-                with open(debug_path_last, "w", encoding="utf-8") as f:
-                    f.write(driver.page_source)
-                print(f"[DEBUG] 마지막 HTML 저장됨 → {debug_path_last}")
-                return collected
+                if debug_path_last:
+                    print(f"[DEBUG] 마지막 HTML 저장 → {debug_path_last}")
+                _commit_batch(click_count)
+                return _finish()
+
+        delta_done = _only_known_in_batch()
+        _commit_batch(click_count)
+        _prune_parsed()
+        if delta_done:
+            print(f"[IMDB] {title_en} – 이번 배치가 전부 저장된 리뷰, 델타 수집 종료")
+
+    # 마지막 page_source 는 offline 파싱이나 스냅샷 저장에 필요할 때만 받는다
+    html: Optional[str] = None
+
+    if offline:
+        # lxml 은 offline 모드에서만 필요
+        from offline_parser import parse_imdb_html
+
+        with stage("page_source"):
+            html = driver.page_source
+        with stage("offline_parse"):
+            offline_rows = parse_imdb_html(html, title_ko, title_en, year)
+        for rid, parsed in offline_rows:
+            if rid in seen_ids or not parsed or _already_stored(parsed):
+                continue
+            seen_ids.add(rid)
+            batch_rids.append(rid)
+            collected.append(_with_review_id(parsed, rid))
+            if len(collected) >= max_reviews:
+                break
+        _commit_batch(click_count)
 
     print(
         f"[IMDB] {title_en} – 총 {len(collected)}개 수집 후 종료"
     )
+    if bounded_dom:
+        print(f"[IMDB] {title_en} – bounded DOM: 카드 {pruned_upto[0]}개 비움")
 
-    debug_path_last = os.path.join("debug", f"imdb_reviews_{ttid}_last.html")
-    with open(debug_path_last, "w", encoding="utf-8") as f:
-        f.write(driver.page_source)
-    print(f"[DEBUG] 마지막 HTML 저장됨 → {debug_path_last}")
+    debug_path_last = save_snapshot(
+        f"imdb_reviews_{ttid}_last",
+        html if html is not None else (lambda: driver.page_source),
+        sample_key=ttid,
+    )
+    if debug_path_last:
+        print(f"[DEBUG] 마지막 HTML 저장 → {debug_path_last}")
 
-    return collected
+    return _finish()
 
 
 # =========================================================
 # 4. CSV 저장
 # =========================================================
 
+IMDB_FIELDNAMES = ["title_ko", "title_en", "year", "rating", "date", "review"]
+
+
+def imdb_review_key(row: Dict[str, str]) -> str:
+    """델타 모드에서 '이미 저장된 리뷰'를 판별하는 키 (CSV 에는 href 가 없어서 본문)."""
+    return row["review"]
+
+
 def save_to_csv(rows: List[Dict[str, str]], path: str) -> None:
     if not rows:
         print("[WARN] 저장할 데이터가 없습니다.")
         return
 
-    fieldnames = ["title_ko", "title_en", "year", "rating", "date", "review"]
     with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(
+            f, fieldnames=IMDB_FIELDNAMES, extrasaction="ignore"
+        )
         writer.writeheader()
         for row in rows:
             writer.writerow(row)
@@ -408,32 +893,398 @@ IMDB_TARGETS = [
 # 6. 메인
 # =========================================================
 
+# 사이트별 동시 드라이버 수 상한 (--workers 는 이 값을 넘지 못함)
+IMDB_MAX_WORKERS = 4
+
+# 스케줄러가 요청 속도를 조절하는 단위 (워커 전체가 같은 limiter 를 쓴다)
+IMDB_DOMAIN = "www.imdb.com"
+
+IMDB_CHECKPOINT_PATH = "imdb_reviews.checkpoint.jsonl"
+IMDB_OUTPUT_CSV = "imdb_reviews.csv"
+IMDB_PARQUET_DIR = "imdb_reviews.parquet"
+IMDB_DUP_REPORT = "imdb_dup_clusters.csv"
+IMDB_PROFILE_DIR = os.path.join("chrome_profile", "imdb")
+
+
+def _crawl_target(
+    driver: Optional[webdriver.Chrome],
+    t: Dict,
+    extraction: str = "js",
+    row_sink: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+    known_reviews: Optional[Set[str]] = None,
+    bounded_dom: bool = False,
+    pipelined: bool = True,
+    graphql_url: Optional[str] = None,
+    driver_factory: Optional[Callable[[], webdriver.Chrome]] = None,
+) -> List[Dict[str, str]]:
+    print(
+        f"[IMDB-CRAWL] {t['title_ko']} / {t['title_en']} "
+        f"({t['year']}) [{t['ttid']}]"
+    )
+    rows = crawl_imdb_reviews_for_title(
+        driver,
+        title_ko=t["title_ko"],
+        title_en=t["title_en"],
+        year=t["year"],
+        ttid=t["ttid"],
+        max_reviews=1000,
+        max_clicks=100,
+        click_timeout=6.0,
+        extraction=extraction,
+        row_sink=row_sink,
+        checkpoint=checkpoint,
+        known_reviews=known_reviews,
+        bounded_dom=bounded_dom,
+        pipelined=pipelined,
+        graphql_url=graphql_url,
+        driver_factory=driver_factory,
+    )
+    return rows
+
+
 def main():
-    driver = create_driver(headless=False)
+    parser = argparse.ArgumentParser(description="IMDb 리뷰 크롤러")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"동시에 띄울 크롬 드라이버 수 (최대 {IMDB_MAX_WORKERS})",
+    )
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="이미지/폰트/동영상/광고·트래커 요청을 막는 가벼운 브라우저 프로필",
+    )
+    parser.add_argument(
+        "--lean-allow",
+        action="append",
+        default=[],
+        metavar="GROUP_OR_PATTERN",
+        help="--lean 에서 막지 않을 범주(image/font/media/tracker) 또는 URL 패턴 (반복 가능)",
+    )
+    parser.add_argument(
+        "--extraction",
+        choices=["js", "element", "offline", "http"],
+        default="js",
+        help=(
+            "카드 추출 방식 (offline: 끝까지 펼친 뒤 page_source 를 lxml 로 파싱, "
+            "http: 브라우저 없이 페이지네이션 엔드포인트 직접 호출)"
+        ),
+    )
+    parser.add_argument(
+        "--graphql-url",
+        help="http 모드 GraphQL 주소 (기본: IMDb, python imdb_http.py --replay 재생 서버 등)",
+    )
+    parser.add_argument(
+        "--flush-every", type=int, default=25, help="이 개수만큼 row 가 쌓이면 flush"
+    )
+    parser.add_argument(
+        "--fsync-interval", type=float, default=5.0, help="fsync 최소 간격(초)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="이전 실행의 체크포인트에서 이어서 (완료 타이틀 스킵, 나머지는 빨리 감기)",
+    )
+    parser.add_argument(
+        "--db",
+        help="리뷰를 이 SQLite DB 에도 upsert (review_id 기준, 재실행해도 중복 없음)",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=["off", "report", "drop"],
+        default="off",
+        help=(
+            "본문 해시 / MinHash 로 완전·유사 중복 판정 "
+            "(report: imdb_dup_clusters.csv 에 묶음만 기록, drop: 중복 row 는 저장 안 함)"
+        ),
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help=(
+            "imdb_reviews.csv 와 함께 site/title 파티션 Parquet 데이터셋"
+            "(imdb_reviews.parquet/)도 씀 (pyarrow 필요)"
+        ),
+    )
+    parser.add_argument(
+        "--debug-snapshots",
+        choices=SNAPSHOT_LEVELS,
+        default="all",
+        help="debug/ HTML 스냅샷 저장 수준 (error: 오류만, sampled: 일부 타이틀만)",
+    )
+    parser.add_argument(
+        "--snapshot-compression", choices=SNAPSHOT_COMPRESSIONS, default="gzip"
+    )
+    parser.add_argument(
+        "--debug-max-mb", type=int, default=200, help="debug/ 전체 크기 상한(MB)"
+    )
+    parser.add_argument(
+        "--bounded-dom",
+        action="store_true",
+        help="파싱이 끝난 리뷰 카드를 페이지에서 비워 DOM/메모리 크기를 일정하게 유지",
+    )
+    parser.add_argument(
+        "--no-pipeline",
+        action="store_true",
+        help="배치 저장(spool / DB / 중복 판정 / 체크포인트)을 크롤 스레드에서 바로 (비교·디버깅용)",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help=(
+            "imdb_reviews.csv 에 이미 있는 리뷰에서 멈추고 새 리뷰만 뒤에 추가 "
+            "(정기 갱신용)"
+        ),
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help=(
+            "시작 요청 속도 (초당 페이지 로드 + 클릭, 워커 합산). "
+            "스로틀 신호에 따라 자동으로 내리고 올린다"
+        ),
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=2,
+        help="캡차 / 타임아웃 / 빈 카드 목록으로 실패한 타이틀을 늦춰서 다시 시도할 횟수",
+    )
+    parser.add_argument(
+        "--title-timeout",
+        type=float,
+        default=1800.0,
+        help=(
+            "타이틀 하나의 시간 예산(초). 넘으면 브라우저를 죽이고 새 드라이버로 "
+            "체크포인트에서 이어서 재시도 (0 = 무제한)"
+        ),
+    )
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        default=10,
+        help="워커마다 이 개수의 타이틀을 처리하면 드라이버를 새로 띄움 (0 = 안 함)",
+    )
+    parser.add_argument(
+        "--max-browser-mb",
+        type=float,
+        default=2048.0,
+        help=(
+            "브라우저 RSS 가 이 값(MB)을 넘으면 타이틀 뒤에 드라이버 교체, "
+            "1.5배를 넘으면 타이틀 도중에도 끊고 재시도 (psutil 필요, 0 = 안 봄)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=IMDB_PROFILE_DIR,
+        help=(
+            "실행 간에 재사용하는 크롬 프로필 위치 (워커마다 worker-N 복사본, "
+            "디스크 캐시 / 쿠키 유지)"
+        ),
+    )
+    parser.add_argument(
+        "--warm-spares",
+        type=int,
+        default=0,
+        help=(
+            "워커 수 외에 미리 띄워 둘 예비 드라이버 수 (기본 0). "
+            "watchdog 재시작 / --recycle-after 교체가 잦은 긴 실행에서만 "
+            "1 정도로 (이번 실행 안에서만 쓰고, 실행이 끝나면 모두 종료)"
+        ),
+    )
+    parser.add_argument(
+        "--fresh-profile",
+        action="store_true",
+        help="프로필을 재사용하지 않고 매번 새 임시 프로필로 띄움",
+    )
+    parser.add_argument(
+        "--disk-cache-mb",
+        type=int,
+        default=256,
+        help="프로필마다 HTTP 디스크 캐시 상한(MB)",
+    )
+    parser.add_argument(
+        "--metrics-events",
+        help="단계별 시간 / 타이틀 요약을 이 파일에 JSON-lines 로 추가",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        help="타이틀이 끝날 때마다 이 경로에 Prometheus textfile 요약 (예: imdb.prom)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="클릭 / 페이지마다 진행 로그 출력",
+    )
+    args = parser.parse_args()
+
+    workers = max(1, min(args.workers, IMDB_MAX_WORKERS))
+    configure_metrics(
+        events_path=args.metrics_events,
+        prom_path=args.metrics_prom,
+        verbosity=LOG_DEBUG if args.verbose else LOG_INFO,
+    )
+    configure_snapshots(
+        level=args.debug_snapshots,
+        compression=args.snapshot_compression,
+        max_bytes=args.debug_max_mb * 1024 * 1024,
+    )
+    # 여러 개를 띄울 때는 항상 headless
+    headless = args.headless or workers > 1
+    # 워커마다 profile_dir/worker-N 을 빌려 쓴다 (디스크 캐시 / 쿠키가 다음 실행에도 남음)
+    profiles = (
+        None
+        if args.fresh_profile
+        else BrowserProfiles(args.profile_dir, cache_mb=args.disk_cache_mb)
+    )
+    limiter = limiter_for(IMDB_DOMAIN, rate=args.rate)
+
+    def _new_driver() -> webdriver.Chrome:
+        return create_driver(
+            headless=headless,
+            lean=args.lean,
+            lean_allow=args.lean_allow,
+            profiles=profiles,
+        )
+
+    # http 모드는 브라우저 없이 돈다 (드라이버는 폴백하는 타이틀에서만 띄움)
+    browserless = args.extraction == "http"
+    browser_pool = None
+    if not browserless:
+        # 크롬은 아래 CSV / 체크포인트 / DB 준비와 겹쳐서 백그라운드로 띄운다.
+        # 띄우기만 하고 사이트 요청은 하지 않는다 (첫 요청은 타이틀에서, limiter 안에서)
+        browser_pool = BrowserPool(
+            _new_driver,
+            warm=min(workers, len(IMDB_TARGETS)),
+            spares=args.warm_spares,
+            label="IMDB-POOL",
+        ).start()
+        atexit.register(browser_pool.close)
+
+    # row 는 수집되는 대로 타이틀별 spool 에 쓰고, 끝나면(또는 예외로 중단돼도)
+    # IMDB_TARGETS 순서대로 합쳐서 imdb_reviews.csv 로 원자적으로 교체
+    # (--delta 면 기존 CSV 뒤에 새 리뷰만 추가)
+    known_index = (
+        load_known_review_keys(IMDB_OUTPUT_CSV, imdb_review_key)
+        if args.delta
+        else None
+    )
+
+    spool = CsvSpoolWriter(
+        IMDB_OUTPUT_CSV,
+        IMDB_FIELDNAMES,
+        flush_every=args.flush_every,
+        fsync_interval=args.fsync_interval,
+        resume=args.resume,
+    )
+
+    # 체크포인트 줄을 쓰기 전에 해당 타이틀 spool 을 flush, fsync 는 spool 과 같은 간격
+    if not args.resume and os.path.exists(IMDB_CHECKPOINT_PATH):
+        os.remove(IMDB_CHECKPOINT_PATH)
+    checkpoint = CheckpointStore(
+        IMDB_CHECKPOINT_PATH,
+        before_save=spool.sync,
+        sync_interval=args.fsync_interval,
+    )
+    db = ReviewDB(args.db) if args.db else None
+    dedup = DedupIndex() if args.dedup != "off" else None
+
+    def _sink_for(key: str) -> Callable[[List[Dict[str, str]]], None]:
+        # spool ← (DB) ← (중복 판정) 순서로 감싼다
+        sink = spool.writer_for(key)
+        if db is not None:
+            sink = db.sink_for("IMDB", sink)
+        if dedup is not None:
+            sink = dedup.filter_sink(sink, "IMDB", drop=args.dedup == "drop")
+        return sink
+
+    keys = [t["ttid"] for t in IMDB_TARGETS]
+    pending = [t for t in IMDB_TARGETS if not checkpoint.is_done(t["ttid"])]
+    if len(pending) < len(IMDB_TARGETS):
+        print(
+            f"[IMDB-CRAWL] 체크포인트: {len(IMDB_TARGETS) - len(pending)}개 타이틀 완료됨, 스킵"
+        )
+
+    def _on_done(idx: int, t: Dict, rows: List[Dict[str, str]]) -> None:
+        n = spool.finish(t["ttid"])
+        print(f"[IMDB-CRAWL]   → {t['title_en']} {n}개 수집\n")
+
+    def _on_failed(idx: int, t: Dict, error: Exception) -> None:
+        # 재시도해도 카드가 비어 있던(차단 표식 없는) 타이틀은 리뷰 0개로 완료 처리.
+        # 완료로 남기지 않으면 --resume 마다 같은 타이틀을 다시 시도한다
+        if isinstance(error, ThrottledError) and error.soft:
+            print(f"[IMDB-CRAWL] {t['title_en']} – {error.reason}, 0개로 완료 처리")
+            checkpoint.mark_done(t["ttid"])
 
-    all_rows: List[Dict[str, str]] = []
     try:
-        for t in IMDB_TARGETS:
+        crawl_targets_parallel(
+            pending,
+            create_driver_fn=None if browserless else _new_driver,
+            crawl_fn=lambda d, t: _crawl_target(
+                d,
+                t,
+                extraction=args.extraction,
+                row_sink=_sink_for(t["ttid"]),
+                checkpoint=checkpoint,
+                known_reviews=(
+                    known_index.get(t["title_en"], set())
+                    if known_index is not None
+                    else None
+                ),
+                bounded_dom=args.bounded_dom,
+                pipelined=not args.no_pipeline,
+                graphql_url=args.graphql_url,
+                driver_factory=_new_driver,
+            ),
+            workers=workers,
+            on_result=_on_done,
+            on_failed=_on_failed,
+            label="IMDB-CRAWL",
+            limiter=limiter,
+            max_retries=args.max_retries,
+            title_timeout=args.title_timeout,
+            recycle_after=args.recycle_after,
+            max_rss_mb=args.max_browser_mb,
+            browser_pool=browser_pool,
+        )
+    finally:
+        if browser_pool is not None:
+            browser_pool.close()
+        # 전부 끝났을 때만 CSV 를 바꾼다. 아니면 기존 CSV 는 그대로 두고
+        # spool / 체크포인트를 --resume 용으로 남김
+        all_done = checkpoint.all_done(keys)
+        if args.delta:
+            # 델타 모드는 끝난 타이틀의 새 리뷰만 기존 CSV 뒤에 붙인다
+            spool.commit([k for k in keys if checkpoint.is_done(k)], append=True)
+        elif all_done:
+            spool.commit(keys)
+        else:
+            spool.close()
             print(
-                f"[IMDB-CRAWL] {t['title_ko']} / {t['title_en']} "
-                f"({t['year']}) [{t['ttid']}]"
-            )
-            rows = crawl_imdb_reviews_for_title(
-                driver,
-                title_ko=t["title_ko"],
-                title_en=t["title_en"],
-                year=t["year"],
-                ttid=t["ttid"],
-                max_reviews=1000,
-                max_clicks=100,
-                click_timeout=6.0,
+                f"[SAVE] 끝나지 않은 타이틀이 있어 {IMDB_OUTPUT_CSV} 는 그대로 둠 "
+                f"(--resume 으로 이어서 수집)"
             )
-            print(f"[IMDB-CRAWL]   → {len(rows)}개 수집\n")
-            all_rows.extend(rows)
-    finally:
-        driver.quit()
-
-    save_to_csv(all_rows, "imdb_reviews.csv")
+        if all_done:
+            checkpoint.clear()
+        else:
+            checkpoint.close()
+        if db is not None:
+            db.close()
+        if dedup is not None:
+            dedup.write_report(IMDB_DUP_REPORT)
+            dedup.close()
+        if args.parquet:
+            # pyarrow 는 --parquet 에서만 필요
+            from review_storage import export_csv_to_parquet
+
+            export_csv_to_parquet(IMDB_OUTPUT_CSV, IMDB_PARQUET_DIR, site="IMDB")
+        flush_snapshots()
+        close_metrics()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+"""
+리뷰 텍스트만 필요한 크롤러용 '가벼운' 크롬 프로필.
+
+이미지 / 폰트 / 동영상 / 광고·트래커 요청을 CDP Network.setBlockedURLs 로 막는다.
+막을 범주는 LEAN_BLOCK_GROUPS 에 있고, allow 로 범주 이름("font") 이나 개별 패턴("*googletagmanager.com*")을 빼낼 수 있다.
+
+차단된 요청과 실제로 받은 바이트는 performance 로그에서 세어서
+report_lean_savings() 가 타이틀이 끝날 때 페이지(문서 URL)마다 출력한다.
+타이틀을 시작할 때 reset_lean_stats() 로 그 전에 쌓인 로그(풀 워밍업, 이전 타이틀)를 버린다.
+막힌 요청은 크기를 알 수 없으므로 출력하는 바이트는 받은 바이트뿐이고,
+절약한 바이트는 lean 없이 돌린 실행의 '받은 바이트' 와 비교해서 본다.
+
+사용 예:
+    options = Options()
+    apply_lean_options(options)
+    driver = webdriver.Chrome(options=options)
+    enable_lean_blocking(driver, allow=["font"])
+    reset_lean_stats(driver)
+    ...
+    report_lean_savings(driver, "[IMDB] Parasite")
+"""
+
+import weakref
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from network_capture import read_performance_log, subscribe_performance_log
+
+
+# 범주별 차단 URL 패턴 (Network.setBlockedURLs 와일드카드 문법)
+LEAN_BLOCK_GROUPS: Dict[str, List[str]] = {
+    "image": [
+        "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.ico*",
+    ],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"],
+    "tracker": [
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*googletagservices.com*",
+        "*amazon-adsystem.com*",
+        "*scorecardresearch.com*",
+        "*facebook.net*",
+        "*adsafeprotected.com*",
+        "*moatads.com*",
+        "*quantserve.com*",
+        "*taboola.com*",
+        "*outbrain.com*",
+        "*criteo.com*",
+        "*chartbeat.com*",
+        "*hotjar.com*",
+        "*adnxs.com*",
+        "*pubmatic.com*",
+        "*rubiconproject.com*",
+        "*casalemedia.com*",
+        "*permutive.com*",
+    ],
+    # 레이아웃이 깨지면 Load More 가시성 체크가 흔들려서 기본값에선 빼 둔다
+    "stylesheet": ["*.css*"],
+}
+LEAN_DEFAULT_GROUPS = ["image", "font", "media", "tracker"]
+
+# driver → 적용된 차단 패턴 (lean 이 아닌 드라이버는 없음)
+_lean_drivers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def lean_block_patterns(
+    allow: Optional[Iterable[str]] = None,
+    groups: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """groups 범주의 패턴에서 allow 에 든 범주 이름 / 패턴을 뺀 목록."""
+    allow_set = set(allow or [])
+    patterns: List[str] = []
+    for group in groups or LEAN_DEFAULT_GROUPS:
+        if group in allow_set:
+            continue
+        patterns.extend(p for p in LEAN_BLOCK_GROUPS[group] if p not in allow_set)
+    return patterns
+
+
+def apply_lean_options(chrome_options) -> None:
+    """
+    webdriver.Chrome 생성 전에 옵션에 적용.
+    performance 로그는 report_lean_savings 의 요청/바이트 집계용.
+
+    이미지는 prefs(imagesEnabled) 대신 URL 패턴으로 막는다: prefs 로 막으면
+    요청 자체가 안 나가서 차단 건수에 잡히지 않고 allow 로 풀 수도 없다.
+    """
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.notifications": 2,
+            "profile.managed_default_content_settings.geolocation": 2,
+        },
+    )
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def enable_lean_blocking(
+    driver, allow: Optional[Iterable[str]] = None
+) -> List[str]:
+    """드라이버 생성 직후 호출. 적용한 차단 패턴 목록을 반환."""
+    patterns = lean_block_patterns(allow)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    _lean_drivers[driver] = patterns
+    subscribe_performance_log(driver, "lean")
+    return patterns
+
+
+def is_lean(driver) -> bool:
+    return driver in _lean_drivers
+
+
+_NETWORK_EVENTS = (
+    "Network.requestWillBeSent",
+    "Network.loadingFinished",
+    "Network.loadingFailed",
+)
+
+
+def _empty_stats() -> Dict:
+    return {"requests": 0, "blocked": 0, "bytes": 0, "blocked_by_type": Counter()}
+
+
+def drain_network_stats(driver) -> Dict:
+    """
+    지난 호출 이후 쌓인 performance 로그를 비우면서 집계.
+      requests : 보낸 요청 수
+      blocked  : 차단된 요청 수 (resource type 별 Counter 는 blocked_by_type)
+      bytes    : 실제로 받은 바이트 (encodedDataLength 합, 차단으로 아낀 양이 아님)
+      pages    : 같은 집계를 요청의 문서 URL(documentURL) 별로, 처음 본 순서대로
+    지난 호출 전에 나간 요청의 뒤늦은 완료 / 실패는 세지 않는다.
+    """
+    stats = _empty_stats()
+    stats["pages"] = pages = {}
+    page_of: Dict[str, str] = {}  # requestId → documentURL
+    for msg in read_performance_log(driver, "lean"):
+        method = msg.get("method")
+        if method not in _NETWORK_EVENTS:
+            continue
+        params = msg.get("params") or {}
+        rid = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            page_of[rid] = params.get("documentURL") or ""
+        elif rid not in page_of:
+            continue
+        page = pages.setdefault(page_of[rid], _empty_stats())
+        for st in (stats, page):
+            if method == "Network.requestWillBeSent":
+                st["requests"] += 1
+            elif method == "Network.loadingFinished":
+                st["bytes"] += int(params.get("encodedDataLength") or 0)
+            elif params.get("blockedReason"):
+                st["blocked"] += 1
+                st["blocked_by_type"][params.get("type") or "Other"] += 1
+    return stats
+
+
+def reset_lean_stats(driver) -> None:
+    """타이틀 시작 전에 호출: 그 전에 쌓인 로그(풀 워밍업, 이전 타이틀)를 버린다."""
+    if is_lean(driver):
+        drain_network_stats(driver)
+
+
+def _format_stats(st: Dict) -> str:
+    by_type = ", ".join(f"{t} {n}" for t, n in st["blocked_by_type"].most_common())
+    return (
+        f"요청 {st['requests']}건 중 {st['blocked']}건 차단"
+        f"{f' ({by_type})' if by_type else ''}, "
+        f"받은 바이트 {st['bytes'] / 1024:.0f} KB"
+    )
+
+
+def report_lean_savings(driver, label: str) -> Optional[Dict]:
+    """
+    lean 드라이버면 reset_lean_stats 이후의 차단 / 수신 집계를 페이지마다 (여러
+    페이지면 합계도) 출력하고 반환. 바이트는 받은 양이다: 아낀 양은 lean 없이 돌린
+    실행과 비교해서 본다.
+    """
+    if not is_lean(driver):
+        return None
+    stats = drain_network_stats(driver)
+    for url, st in stats["pages"].items():
+        print(f"{label} – lean {url or '(문서 없음)'}: {_format_stats(st)}")
+    if len(stats["pages"]) > 1:
+        print(f"{label} – lean 합계: {_format_stats(stats)}")
+    return stats
@@ -0,0 +1,111 @@
+"""
+크롬 performance 로그로 XHR 응답 본문(JSON)을 가로채기.
+
+페이지가 API 로 받아 온 데이터를 렌더링된 DOM 에서 다시 읽는 대신, 같은 응답을
+Network.getResponseBody 로 받아서 바로 쓴다 (RT Load More 의 리뷰 JSON 등).
+
+  - apply_capture_options(options) : webdriver.Chrome 생성 전에 (performance 로그 켜기)
+  - enable_network_capture(driver) : 생성 직후
+  - take_json_responses(driver, url_filter) : 지난 호출 이후 끝난 응답 중 url_filter 에
+    맞는 것의 (url, JSON) 목록
+
+performance 로그는 get_log() 로 한 번 읽으면 비워지므로, lean_browser 의 요청/바이트
+집계와 같이 켜져 있어도 서로 항목을 빼앗지 않도록 read_performance_log() 가
+구독자(consumer)마다 따로 쌓아 둔다.
+"""
+
+import base64
+import json
+import weakref
+from typing import Callable, Dict, List, Tuple
+
+
+# driver → {consumer: 아직 안 읽은 CDP 메시지 목록}
+_subscribers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# driver → {requestId: url} (응답 헤더는 왔고 본문이 아직 안 끝난 요청)
+_in_flight: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def subscribe_performance_log(driver, consumer: str) -> None:
+    _subscribers.setdefault(driver, {}).setdefault(consumer, [])
+
+
+def read_performance_log(driver, consumer: str) -> List[Dict]:
+    """
+    consumer 가 지난번 이후 못 본 CDP 메시지({"method", "params"}) 목록.
+    subscribe_performance_log 하지 않은 consumer 는 이번에 읽은 것만 받는다.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        entries = []
+
+    messages: List[Dict] = []
+    for entry in entries:
+        try:
+            messages.append(json.loads(entry["message"])["message"])
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    subs = _subscribers.get(driver)
+    if not subs or consumer not in subs:
+        return messages
+    for buf in subs.values():
+        buf.extend(messages)
+    out, subs[consumer] = subs[consumer], []
+    return out
+
+
+def apply_capture_options(chrome_options) -> None:
+    """webdriver.Chrome 생성 전에 옵션에 적용 (lean 과 같은 capability)."""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def enable_network_capture(driver) -> None:
+    """드라이버 생성 직후 호출."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    subscribe_performance_log(driver, "capture")
+    _in_flight[driver] = {}
+
+
+def is_capturing(driver) -> bool:
+    return driver in _in_flight
+
+
+def take_json_responses(
+    driver, url_filter: Callable[[str], bool]
+) -> List[Tuple[str, object]]:
+    """
+    지난 호출 이후 로딩이 끝난 응답 중 url_filter(url) 이 참인 것의 (url, JSON).
+    헤더만 오고 아직 안 끝난 요청은 기억해 뒀다가 다음 호출에서 돌려준다.
+    본문을 못 받거나 JSON 이 아니면 건너뛴다.
+    """
+    pending = _in_flight.get(driver)
+    if pending is None:
+        return []
+
+    out: List[Tuple[str, object]] = []
+    for msg in read_performance_log(driver, "capture"):
+        method = msg.get("method")
+        params = msg.get("params") or {}
+        rid = params.get("requestId")
+        if method == "Network.responseReceived":
+            url = (params.get("response") or {}).get("url") or ""
+            if url_filter(url):
+                pending[rid] = url
+        elif method == "Network.loadingFailed":
+            pending.pop(rid, None)
+        elif method == "Network.loadingFinished" and rid in pending:
+            url = pending.pop(rid)
+            try:
+                res = driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": rid}
+                )
+                body = res.get("body") or ""
+                if res.get("base64Encoded"):
+                    body = base64.b64decode(body).decode("utf-8", "replace")
+                out.append((url, json.loads(body)))
+            except Exception as e:
+                # 버퍼에서 밀려난 본문 / JSON 이 아닌 응답
+                print(f"[NET] 응답 본문을 읽지 못함 ({url}): {e}")
+    return out
@@ -0,0 +1,249 @@
+"""
+driver.page_source 스냅샷(HTML)에서 WebDriver 호출 없이 리뷰 row를 뽑는 오프라인 파서.
+
+  - parse_imdb_html : parse_review_element 와 같은 row (카드 href 를 rid 로 같이 반환)
+  - parse_rt_html   : crawl_rt_audience_reviews_for_target 와 같은 row
+
+크롤러의 extraction="offline" 모드는 페이지를 끝까지 펼친 뒤 page_source 를
+한 번만 받아서 여기로 넘긴다. debug/ 에 남은 예전 스냅샷을 다시 뽑을 때는
+CLI 로 실행:
+
+  python offline_parser.py debug/imdb_reviews_*_last.html* debug/rt_*_last.html*
+    → imdb_reviews_offline.csv / rt_reviews_offline.csv
+"""
+
+import argparse
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+import lxml.html
+
+from debug_snapshots import read_snapshot
+from review_dedup import content_hash
+from review_record import ReviewRecord, imdb_review_url, title_meta
+
+
+def _has_class(name: str) -> str:
+    """XPath 조건: class 속성에 name 이 토큰으로 들어 있음."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(node, xpath: str):
+    found = node.xpath(xpath)
+    return found[0] if found else None
+
+
+def _inner_text(node) -> str:
+    """
+    WebElement.text(innerText) 와 비슷하게: <br> 는 줄바꿈, 나머지는 텍스트만.
+    원본 트리를 건드리지 않도록 br 꼬리 텍스트 대신 조각을 직접 이어 붙인다.
+    """
+    parts: List[str] = []
+
+    def _walk(el) -> None:
+        if el.tag == "br":
+            parts.append("\n")
+        elif el.text:
+            parts.append(el.text)
+        for child in el:
+            if isinstance(child.tag, str):
+                _walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    _walk(node)
+    return "".join(parts)
+
+
+def load_html(path: str) -> str:
+    """.html 및 압축 스냅샷(.html.gz / .html.zst) 모두."""
+    return read_snapshot(path)
+
+
+# =========================================================
+# 1. IMDb
+# =========================================================
+
+def parse_imdb_html(
+    html: str, title_ko: str, title_en: str, year: int
+) -> List[Tuple[str, Optional[Dict[str, str]]]]:
+    """
+    IMDb 리뷰 페이지 HTML에서 (rid, row) 목록을 카드 순서대로 반환.
+    row가 None이면 본문이 없는 카드. rid가 없으면 idx-offline-{i}.
+    """
+    doc = lxml.html.fromstring(html)
+    cards = doc.xpath("//div[@data-testid='review-card-parent']")
+    meta = title_meta(None, title_ko, title_en, year)
+
+    out: List[Tuple[str, Optional[Dict[str, str]]]] = []
+    for idx, card in enumerate(cards):
+        link = _first(card, ".//a[contains(@href, '/review/')]")
+        href = link.get("href", "") if link is not None else ""
+        rid = imdb_review_url(href) or f"idx-offline-{idx}"
+
+        rating = ""
+        rating_el = _first(
+            card, f".//span[{_has_class('ipc-rating-star--rating')}]"
+        )
+        if rating_el is not None:
+            txt = _inner_text(rating_el).strip()
+            if txt:
+                rating = txt.split("/")[0].strip()
+
+        review_text = ""
+        text_el = _first(
+            card,
+            ".//div[@data-testid='review-overflow']"
+            f"//div[{_has_class('ipc-html-content-inner-div')}]",
+        )
+        if text_el is not None:
+            review_text = _inner_text(text_el).strip().replace("\n", " ").strip()
+
+        if not review_text:
+            out.append((rid, None))
+            continue
+
+        out.append((rid, ReviewRecord(meta, rating, "", review_text)))
+    return out
+
+
+# =========================================================
+# 2. Rotten Tomatoes
+# =========================================================
+
+def _parse_rt_card_node(card) -> Dict[str, str]:
+    """_parse_rt_review_card 의 lxml 버전."""
+    date_el = _first(card, ".//span[@slot='timestamp']")
+    date_text = _inner_text(date_el).strip() if date_el is not None else ""
+
+    review_el = _first(
+        card, ".//drawer-more[@slot='review']//span[@slot='content']"
+    )
+    review_text = _inner_text(review_el).strip() if review_el is not None else ""
+
+    rating = ""
+    score_el = _first(card, ".//*[@slot='rating']//score-icon-audience")
+    if score_el is None:
+        score_el = _first(card, ".//*[@slot='rating']//score-icon-critics")
+    if score_el is not None:
+        rating = (
+            (score_el.get("percentage") or "")
+            or (score_el.get("score") or "")
+            or (score_el.get("sentiment") or "")
+        ).strip()
+
+    return {"rating": rating, "date": date_text, "review": review_text}
+
+
+def parse_rt_html(
+    html: str, title_ko: str, title_en: str, year: int
+) -> List[Dict[str, str]]:
+    """RT 리뷰 페이지 HTML에서 rt_review_key (date, 본문 해시) 기준 중복 제거된 row 목록."""
+    doc = lxml.html.fromstring(html)
+    cards = doc.xpath(
+        f"//div[{_has_class('reviews-cards')} and "
+        "@data-pagemediareviewsmanager='cards']//review-card"
+    )
+
+    meta = title_meta("RT", title_ko, title_en, year)
+    rows: List[Dict[str, str]] = []
+    seen_keys = set()
+    for card in cards:
+        parsed = _parse_rt_card_node(card)
+        if not parsed["review"]:
+            continue
+
+        key = (parsed["date"], content_hash(parsed["review"]))
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+
+        rows.append(
+            ReviewRecord(meta, parsed["rating"], parsed["date"], parsed["review"])
+        )
+    return rows
+
+
+# =========================================================
+# 3. 스냅샷 재추출 CLI
+# =========================================================
+
+_IMDB_SNAPSHOT_RE = re.compile(r"imdb_reviews_(tt\d+)_")
+_RT_SNAPSHOT_RE = re.compile(r"rt_(.+?)_(?:page0|last|no_cards|no_section)\.")
+
+
+def reextract_snapshot(path: str) -> Tuple[str, List[Dict[str, str]]]:
+    """
+    debug/ 스냅샷 파일명에서 타이틀을 찾아 (IMDB_TARGETS / RT_TARGETS) 다시 파싱.
+    반환값: (site, rows). 알 수 없는 파일이면 ("", []).
+    """
+    name = os.path.basename(path)
+
+    m = _IMDB_SNAPSHOT_RE.search(name)
+    if m:
+        from imdb_reviews_selenium import IMDB_TARGETS
+
+        t = next((t for t in IMDB_TARGETS if t["ttid"] == m.group(1)), None)
+        if t is None:
+            print(f"[OFFLINE] {name}: IMDB_TARGETS 에 없는 ttid ({m.group(1)})")
+            return "", []
+        rows = []
+        seen_ids = set()
+        for rid, parsed in parse_imdb_html(
+            load_html(path), t["title_ko"], t["title_en"], t["year"]
+        ):
+            if rid in seen_ids or not parsed:
+                continue
+            seen_ids.add(rid)
+            rows.append(parsed)
+        return "IMDB", rows
+
+    m = _RT_SNAPSHOT_RE.search(name)
+    if m:
+        from rt_reviews_selenium import RT_TARGETS, _slugify
+
+        t = next(
+            (t for t in RT_TARGETS if _slugify(t["title_en"]) == m.group(1)),
+            None,
+        )
+        if t is None:
+            print(f"[OFFLINE] {name}: RT_TARGETS 에 없는 타이틀 ({m.group(1)})")
+            return "", []
+        return "RT", parse_rt_html(
+            load_html(path), t["title_ko"], t["title_en"], t["year"]
+        )
+
+    print(f"[OFFLINE] {name}: IMDb/RT 스냅샷 파일명이 아님, 스킵")
+    return "", []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="저장된 HTML 스냅샷에서 리뷰 재추출")
+    parser.add_argument("snapshots", nargs="+")
+    parser.add_argument("--imdb-output", default="imdb_reviews_offline.csv")
+    parser.add_argument("--rt-output", default="rt_reviews_offline.csv")
+    args = parser.parse_args()
+
+    imdb_rows: List[Dict[str, str]] = []
+    rt_rows: List[Dict[str, str]] = []
+    for path in args.snapshots:
+        site, rows = reextract_snapshot(path)
+        print(f"[OFFLINE] {path} → {len(rows)}개")
+        if site == "IMDB":
+            imdb_rows.extend(rows)
+        elif site == "RT":
+            rt_rows.extend(rows)
+
+    if imdb_rows:
+        from imdb_reviews_selenium import save_to_csv as save_imdb_csv
+
+        save_imdb_csv(imdb_rows, args.imdb_output)
+    if rt_rows:
+        from rt_reviews_selenium import save_to_csv as save_rt_csv
+
+        save_rt_csv(args.rt_output, rt_rows)
+
+
+if __name__ == "__main__":
+    main()
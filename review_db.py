@@ -0,0 +1,256 @@
+"""
+리뷰를 SQLite 에 저장하는 백엔드.
+
+  - 키: 안정적인 review_id (IMDb 는 /review/rwNNN/ URL, RT 는 타이틀 + 날짜 + 본문 해시)
+    CSV 에서 가져온 IMDb row 는 URL 이 없어 해시 id 로 들어가고, 같은 리뷰를 크롤링하면
+    그때 URL id 로 바꾼다
+    같은 리뷰를 다시 수집하면 새 row 가 생기지 않고 rating / date / 본문만 갱신(upsert)
+  - WAL 모드 + busy_timeout 이라 IMDb / RT 크롤러가 같은 DB 파일에 동시에 써도 된다
+  - row_sink 배치 하나 = 트랜잭션 하나
+  - (site, title_en, date) 인덱스로 한 타이틀 조회가 전체 스캔 없이 끝난다
+  - export_csv() 로 지금의 imdb_reviews.csv / rt_reviews.csv 형식으로 되돌릴 수 있다
+
+사용 예:
+  python review_db.py reviews.db --import-imdb imdb_reviews.csv --import-rt rt_reviews.csv
+  python review_db.py reviews.db --export-imdb imdb_reviews.csv --export-rt rt_reviews.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from review_dedup import content_hash
+from review_record import normalize_review_date
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    review_id  TEXT PRIMARY KEY,
+    site       TEXT NOT NULL,
+    title_ko   TEXT,
+    title_en   TEXT NOT NULL,
+    year       INTEGER,
+    rating     TEXT,
+    date       TEXT,
+    review     TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_site_title_date
+    ON reviews (site, title_en, date);
+"""
+
+_UPSERT = """
+INSERT INTO reviews
+    (review_id, site, title_ko, title_en, year, rating, date, review,
+     first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(review_id) DO UPDATE SET
+    rating    = excluded.rating,
+    date      = CASE WHEN excluded.date != '' THEN excluded.date ELSE date END,
+    review    = excluded.review,
+    last_seen = excluded.last_seen
+"""
+
+
+def review_id_for(row: Dict[str, str], site: str) -> str:
+    """
+    row 의 안정 id. 크롤러가 넣어 준 review_id(IMDb 리뷰 URL)가 있으면 그대로,
+    없으면 hashed_review_id.
+    """
+    return row.get("review_id") or hashed_review_id(row, site)
+
+
+def hashed_review_id(row: Dict[str, str], site: str) -> str:
+    """
+    review_id 가 없는 row 의 id: site / 타이틀 / 날짜 / 본문 해시의 해시.
+    (크롤러의 rt_review_key 와 같은 기준이라 크롤러가 따로 저장한 리뷰는 DB 에서도 따로)
+    날짜는 normalize_review_date 로 맞춘다: RT 는 올해 리뷰를 "Aug 15" 로 보여 주다가
+    해가 바뀌면 "Aug 15, 2024" 로 보여 준다.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    parts = (
+        site,
+        row.get("title_en", ""),
+        normalize_review_date(row.get("date", "")),
+        content_hash(row.get("review", "")),
+    )
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    return f"{site.lower()}:{h.hexdigest()}"
+
+
+class ReviewDB:
+    """
+    스레드 여러 개(크롤 워커)가 한 인스턴스를 같이 써도 되도록 쓰기는 lock 으로 직렬화.
+    다른 프로세스와의 동시 쓰기는 SQLite WAL + busy_timeout 이 처리한다.
+    """
+
+    def __init__(self, path: str, busy_timeout_ms: int = 30000) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # CSV 에서 가져온 (URL 없는) IMDb row 가 있으면 upsert 때 URL id 로 옮긴다
+        self._imdb_hashed = (
+            self._conn.execute(
+                "SELECT 1 FROM reviews WHERE review_id LIKE 'imdb:%' LIMIT 1"
+            ).fetchone()
+            is not None
+        )
+
+    def _adopt_hashed_ids(self, rows: List[Dict[str, str]], site: str) -> None:
+        """
+        URL id 로 들어오는 row 와 같은 리뷰가 해시 id 로 있으면 그 row 를 URL id 로 바꾼다
+        (이미 URL id row 가 있으면 해시 id 쪽을 지운다). 트랜잭션 안에서 호출.
+        """
+        for r in rows:
+            rid = r.get("review_id")
+            if not rid:
+                continue
+            old = hashed_review_id(r, site)
+            self._conn.execute(
+                "UPDATE OR IGNORE reviews SET review_id = ? WHERE review_id = ?",
+                (rid, old),
+            )
+            self._conn.execute("DELETE FROM reviews WHERE review_id = ?", (old,))
+
+    def upsert_rows(self, rows: List[Dict[str, str]], site: str) -> int:
+        """rows 를 트랜잭션 하나로 upsert. 반환값: 처리한 row 수."""
+        if not rows:
+            return 0
+        now = time.time()
+        params = [
+            (
+                review_id_for(r, site),
+                r.get("site") or site,
+                r.get("title_ko", ""),
+                r.get("title_en", ""),
+                int(r["year"]) if r.get("year") else None,
+                r.get("rating", ""),
+                r.get("date", ""),
+                r.get("review", ""),
+                now,
+                now,
+            )
+            for r in rows
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if site == "IMDB" and self._imdb_hashed:
+                    self._adopt_hashed_ids(rows, site)
+                self._conn.executemany(_UPSERT, params)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(params)
+
+    def sink_for(
+        self,
+        site: str,
+        inner: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+    ) -> Callable[[List[Dict[str, str]]], None]:
+        """crawl_*(row_sink=...) 용. inner(예: spool 쓰기)에 넘긴 뒤 DB 에도 upsert."""
+
+        def _sink(rows: List[Dict[str, str]]) -> None:
+            if inner is not None:
+                inner(rows)
+            self.upsert_rows(rows, site)
+
+        return _sink
+
+    def count(
+        self, site: Optional[str] = None, title_en: Optional[str] = None
+    ) -> int:
+        sql = "SELECT COUNT(*) FROM reviews WHERE 1=1"
+        args: List[str] = []
+        if site is not None:
+            sql += " AND site = ?"
+            args.append(site)
+        if title_en is not None:
+            sql += " AND title_en = ?"
+            args.append(title_en)
+        with self._lock:
+            return int(self._conn.execute(sql, args).fetchone()[0])
+
+    def import_csv(self, path: str, site: str, batch_size: int = 1000) -> int:
+        """기존 CSV(imdb_reviews.csv / rt_reviews.csv)를 DB 로 옮긴다. 중복은 upsert."""
+        n = 0
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            batch: List[Dict[str, str]] = []
+            for row in csv.DictReader(f):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    n += self.upsert_rows(batch, site)
+                    batch = []
+            n += self.upsert_rows(batch, site)
+        if site == "IMDB" and n:
+            self._imdb_hashed = True
+        print(f"[DB] {path} → {self.path} ({n} rows, {site})")
+        return n
+
+    def export_csv(self, path: str, site: str, fieldnames: List[str]) -> int:
+        """
+        site 의 리뷰를 fieldnames 형식 CSV(utf-8-sig)로. 처음 수집된 순서(rowid) 그대로.
+        """
+        cols = ", ".join(fieldnames)
+        with self._lock:
+            cur = self._conn.execute(
+                f"SELECT {cols} FROM reviews WHERE site = ? ORDER BY rowid", (site,)
+            )
+            n = 0
+            with open(path, "w", encoding="utf-8-sig", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                for rec in cur:
+                    writer.writerow("" if v is None else v for v in rec)
+                    n += 1
+        print(f"[DB] {self.path} → {path} ({n} rows, {site})")
+        return n
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리뷰 SQLite DB 가져오기/내보내기")
+    parser.add_argument("db")
+    parser.add_argument("--import-imdb")
+    parser.add_argument("--import-rt")
+    parser.add_argument("--export-imdb")
+    parser.add_argument("--export-rt")
+    args = parser.parse_args()
+
+    # 필드 목록은 각 크롤러의 CSV 형식을 그대로 따른다
+    from imdb_reviews_selenium import IMDB_FIELDNAMES
+    from rt_reviews_selenium import RT_FIELDNAMES
+
+    db = ReviewDB(args.db)
+    try:
+        if args.import_imdb:
+            db.import_csv(args.import_imdb, "IMDB")
+        if args.import_rt:
+            db.import_csv(args.import_rt, "RT")
+        if args.export_imdb:
+            db.export_csv(args.export_imdb, "IMDB", IMDB_FIELDNAMES)
+        if args.export_rt:
+            db.export_csv(args.export_rt, "RT", RT_FIELDNAMES)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+리뷰 중복 탐지: 본문 전체 해시(완전 중복) + MinHash/LSH(유사 중복).
+
+  content_hash(text) : 공백/대소문자 정규화 후 본문 전체의 blake2b.
+                       RT 의 rt_review_key, offline 파서, review_db 의 RT id 가 이걸 쓴다.
+                       (예전 review[:80] 키는 앞부분이 같은 다른 리뷰를 합쳐 버렸다)
+
+  DedupIndex         : 리뷰를 하나씩 add() 하면
+                       "unique" / "exact"(본문 해시 일치) / "near"(MinHash 추정 Jaccard ≥ threshold)
+                       중 하나와 대표 리뷰 id 를 돌려준다. 색인은 SQLite 에 두므로
+                       path 를 파일로 주면 수백만 건도 메모리 일정하게 처리한다.
+                       (기본 ":memory:" 는 크롤 중 스트리밍용)
+
+  - 크롤 중: filter_sink() 로 row_sink 를 감싸서 중복을 보고하거나 버린다
+  - 일괄:   python review_dedup.py imdb_reviews.csv rt_reviews.csv --index dedup.sqlite
+            → dup_clusters.csv (대표 리뷰별 중복 묶음)
+
+단어 수가 min_words 보다 적은 짧은 리뷰("Great movie!")는 서로 다른 사람이
+같은 말을 쓴 경우가 많아서 판정하지 않고 항상 unique 로 둔다.
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from review_record import normalize_review_date
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def content_hash(text: str) -> str:
+    """정규화한 본문 전체의 128bit blake2b (hex)."""
+    return hashlib.blake2b(
+        normalize_text(text).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _shingles(norm: str, k: int) -> List[int]:
+    """단어 k-gram 을 64bit 해시로."""
+    words = norm.split()
+    grams = {" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))}
+    return [
+        int.from_bytes(
+            hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        for g in grams
+    ]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id  TEXT PRIMARY KEY,
+    label   TEXT,
+    snippet TEXT
+);
+CREATE TABLE IF NOT EXISTS exact (
+    hash   TEXT PRIMARY KEY,
+    doc_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sigs (
+    doc_id TEXT PRIMARY KEY,
+    sig    BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lsh (
+    band   INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    doc_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lsh_band_bucket ON lsh (band, bucket);
+CREATE TABLE IF NOT EXISTS dups (
+    doc_id     TEXT PRIMARY KEY,
+    canonical  TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    similarity REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dups_canonical ON dups (canonical);
+"""
+
+
+class DedupIndex:
+    """
+    num_perm 개 MinHash 를 bands 개 밴드로 나눠 LSH. 기본(64, 16)이면
+    Jaccard 0.5 근처부터 후보로 잡히고, 후보는 서명으로 추정한 Jaccard 가
+    threshold 이상일 때만 유사 중복으로 본다.
+
+    MinHash 는 순수 파이썬으로 돌리기 위해 one-permutation 방식 (signature 참고).
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.8,
+        shingle_words: int = 3,
+        min_words: int = 8,
+        max_candidates: int = 50,
+        commit_every: int = 1000,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm 은 bands 의 배수여야 함")
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+        self.shingle_words = shingle_words
+        self.min_words = min_words
+        self.max_candidates = max_candidates
+        self.commit_every = commit_every
+
+        self._sig_fmt = f"<{num_perm}I"
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.executescript(_SCHEMA)
+        self._pending = 0
+        self.stats = {"unique": 0, "exact": 0, "near": 0, "short": 0}
+
+    # ---- MinHash ----
+
+    def signature(self, norm: str) -> List[int]:
+        """
+        one-permutation MinHash: 해시 하나를 num_perm 개 구간으로 나눠 구간별 최솟값.
+        (순열 num_perm 개를 도는 것보다 num_perm 배 빠르다)
+        빈 구간은 오른쪽으로 가장 가까운 구간 값을 거리만큼 밀어서 채운다 (rotation).
+        """
+        k = self.num_perm
+        empty = 1 << 64
+        bins = [empty] * k
+        for h in _shingles(norm, self.shingle_words):
+            i = h % k
+            v = h // k
+            if v < bins[i]:
+                bins[i] = v
+        if all(v == empty for v in bins):
+            return [0] * k
+        sig = []
+        for i in range(k):
+            j, dist = i, 0
+            while bins[j] == empty:
+                j = (j + 1) % k
+                dist += 1
+            # 비교/저장은 하위 32bit 만
+            sig.append((bins[j] + dist * 0x9E3779B97F4A7C15) & 0xFFFFFFFF)
+        return sig
+
+    def _band_buckets(self, sig: List[int]) -> List[Tuple[int, int]]:
+        r = self.rows_per_band
+        out = []
+        for b in range(self.bands):
+            band = struct.pack(f"<{r}I", *sig[b * r:(b + 1) * r])
+            bucket = int.from_bytes(
+                hashlib.blake2b(band, digest_size=8).digest(), "little", signed=True
+            )
+            out.append((b, bucket))
+        return out
+
+    # ---- 색인 ----
+
+    def _canonical_of(self, doc_id: str) -> str:
+        row = self._conn.execute(
+            "SELECT canonical FROM dups WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        return row[0] if row else doc_id
+
+    def add(
+        self, doc_id: str, text: str, label: str = ""
+    ) -> Tuple[str, Optional[str], float]:
+        """
+        리뷰 하나를 색인에 넣고 (kind, 대표 doc_id, 유사도) 반환.
+        kind: "unique" / "exact" / "near" (unique 면 대표는 None)
+        같은 doc_id 를 다시 넣으면 (재시도 / resume 으로 같은 리뷰를 또 받은 경우)
+        자기 자신과는 중복으로 묶지 않는다. 그래서 doc_id 는 리뷰마다 달라야 한다
+        (filter_sink 참고).
+        """
+        norm = normalize_text(text)
+        with self._lock:
+            if len(norm.split()) < self.min_words:
+                self.stats["short"] += 1
+                return "unique", None, 0.0
+
+            self._conn.execute(
+                "INSERT OR IGNORE INTO docs VALUES (?, ?, ?)",
+                (doc_id, label, norm[:80]),
+            )
+            h = hashlib.blake2b(norm.encode("utf-8"), digest_size=16).hexdigest()
+            hit = self._conn.execute(
+                "SELECT doc_id FROM exact WHERE hash = ?", (h,)
+            ).fetchone()
+            if hit is not None and hit[0] == doc_id:
+                # 이미 대표로 색인된 같은 리뷰
+                return "unique", None, 0.0
+            if hit is not None:
+                return self._record(doc_id, self._canonical_of(hit[0]), "exact", 1.0)
+            self._conn.execute("INSERT INTO exact VALUES (?, ?)", (h, doc_id))
+
+            sig = self.signature(norm)
+            buckets = self._band_buckets(sig)
+            best_id, best_sim = None, 0.0
+            for cand_id, cand_sig in self._candidates(buckets):
+                if cand_id == doc_id:
+                    continue  # 본문이 바뀐 채로 다시 들어온 같은 리뷰
+                other = struct.unpack(self._sig_fmt, cand_sig)
+                sim = sum(1 for a, b in zip(sig, other) if a == b) / self.num_perm
+                if sim > best_sim:
+                    best_id, best_sim = cand_id, sim
+            if best_id is not None and best_sim >= self.threshold:
+                return self._record(
+                    doc_id, self._canonical_of(best_id), "near", best_sim
+                )
+
+            # 대표가 될 수 있는 리뷰만 LSH 에 넣는다 (중복은 대표에 묶인다)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sigs VALUES (?, ?)",
+                (doc_id, struct.pack(self._sig_fmt, *sig)),
+            )
+            self._conn.executemany(
+                "INSERT INTO lsh VALUES (?, ?, ?)",
+                [(b, bucket, doc_id) for b, bucket in buckets],
+            )
+            self.stats["unique"] += 1
+            self._tick()
+            return "unique", None, 0.0
+
+    def _candidates(
+        self, buckets: List[Tuple[int, int]]
+    ) -> List[Tuple[str, bytes]]:
+        """같은 밴드 버킷에 든 대표 리뷰들의 (doc_id, 서명). 밴드별로 인덱스 조회."""
+        cand_ids: List[str] = []
+        seen = set()
+        for band, bucket in buckets:
+            for (cid,) in self._conn.execute(
+                "SELECT doc_id FROM lsh WHERE band = ? AND bucket = ?",
+                (band, bucket),
+            ):
+                if cid not in seen:
+                    seen.add(cid)
+                    cand_ids.append(cid)
+            if len(cand_ids) >= self.max_candidates:
+                break
+        if not cand_ids:
+            return []
+        cand_ids = cand_ids[: self.max_candidates]
+        return self._conn.execute(
+            f"SELECT doc_id, sig FROM sigs WHERE doc_id IN "
+            f"({','.join('?' * len(cand_ids))})",
+            cand_ids,
+        ).fetchall()
+
+    def _record(
+        self, doc_id: str, canonical: str, kind: str, sim: float
+    ) -> Tuple[str, Optional[str], float]:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO dups VALUES (?, ?, ?, ?)",
+            (doc_id, canonical, kind, sim),
+        )
+        self.stats[kind] += 1
+        self._tick()
+        return kind, canonical, sim
+
+    def _tick(self) -> None:
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self._conn.commit()
+            self._pending = 0
+
+    # ---- 크롤 중 스트리밍 ----
+
+    def filter_sink(
+        self,
+        inner: Callable[[List[Dict[str, str]]], None],
+        site: str,
+        drop: bool = False,
+    ) -> Callable[[List[Dict[str, str]]], None]:
+        """
+        row_sink 를 감싸서 배치마다 중복 판정. drop=True 면 중복 row 는 inner 로 안 넘긴다.
+        doc_id 는 row 의 review_id(IMDb 리뷰 URL), 없으면 site / 타이틀 / 날짜 / 본문 해시
+        뒤에 이 sink 에서 같은 값이 몇 번째인지(#n)를 붙인다. 같은 본문이 두 번 오면
+        #0 / #1 로 서로 다른 리뷰가 되어 exact 로 잡히고, 재시도로 새 sink 에 다시 보낸
+        row 는 같은 #n 이라 자기 자신과 묶이지 않는다.
+        """
+        ordinals: Dict[str, int] = {}
+
+        def _sink(rows: List[Dict[str, str]]) -> None:
+            keep = []
+            for r in rows:
+                doc_id = r.get("review_id")
+                if not doc_id:
+                    base = (
+                        f"{site.lower()}:{r.get('title_en', '')}:"
+                        f"{normalize_review_date(r.get('date', ''))}:"
+                        f"{content_hash(r.get('review', ''))}"
+                    )
+                    n = ordinals.get(base, 0)
+                    ordinals[base] = n + 1
+                    doc_id = f"{base}#{n}"
+                kind, _, _ = self.add(
+                    doc_id, r.get("review", ""), f"{site}|{r.get('title_en', '')}"
+                )
+                if drop and kind != "unique":
+                    continue
+                keep.append(r)
+            inner(keep)
+
+        return _sink
+
+    # ---- 보고 ----
+
+    def clusters(self) -> Iterator[Tuple[str, List[Tuple[str, str, float]]]]:
+        """(대표 doc_id, [(doc_id, kind, 유사도), ...]) 를 대표별로."""
+        with self._lock:
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT canonical, doc_id, kind, similarity FROM dups "
+                "ORDER BY canonical, similarity DESC"
+            ).fetchall()
+        cur: Optional[str] = None
+        members: List[Tuple[str, str, float]] = []
+        for canonical, doc_id, kind, sim in rows:
+            if canonical != cur and cur is not None:
+                yield cur, members
+                members = []
+            cur = canonical
+            members.append((doc_id, kind, sim))
+        if cur is not None:
+            yield cur, members
+
+    def write_report(self, path: str) -> int:
+        """중복 묶음을 CSV 로. 반환값: 묶음 수."""
+        n_clusters = 0
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["cluster", "doc_id", "kind", "similarity", "label", "snippet"]
+            )
+            for canonical, members in self.clusters():
+                n_clusters += 1
+                for doc_id, kind, sim in [(canonical, "canonical", 1.0)] + members:
+                    label, snippet = self._doc_info(doc_id)
+                    writer.writerow(
+                        [canonical, doc_id, kind, f"{sim:.2f}", label, snippet]
+                    )
+        print(
+            f"[DEDUP] 중복 묶음 {n_clusters}개 "
+            f"(완전 중복 {self.stats['exact']}, 유사 중복 {self.stats['near']}) → {path}"
+        )
+        return n_clusters
+
+    def _doc_info(self, doc_id: str) -> Tuple[str, str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT label, snippet FROM docs WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+        return (row[0], row[1]) if row else ("", "")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+# =========================================================
+# 일괄 모드 CLI
+# =========================================================
+
+def dedup_csvs(paths: List[str], index: DedupIndex) -> None:
+    """CSV 들을 한 줄씩 흘려 보내며 색인 (파일 전체를 메모리에 안 올림)."""
+    for path in paths:
+        name = os.path.basename(path)
+        n = 0
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                site = row.get("site") or name.split("_")[0].upper()
+                index.add(
+                    f"{name}:{line_no}",
+                    row.get("review", ""),
+                    f"{site}|{row.get('title_en', '')}",
+                )
+                n += 1
+                if n % 100_000 == 0:
+                    print(f"[DEDUP] {name}: {n}개 처리")
+        print(f"[DEDUP] {name}: {n}개 처리 완료")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리뷰 CSV 완전/유사 중복 탐지")
+    parser.add_argument("csvs", nargs="+")
+    parser.add_argument(
+        "--index",
+        default=":memory:",
+        help="색인 SQLite 파일 (수백만 건이면 파일로 줘야 메모리가 일정)",
+    )
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--report", default="dup_clusters.csv")
+    args = parser.parse_args()
+
+    if args.index != ":memory:" and os.path.exists(args.index):
+        os.remove(args.index)
+    index = DedupIndex(args.index, threshold=args.threshold)
+    try:
+        dedup_csvs(args.csvs, index)
+        print(f"[DEDUP] {index.stats}")
+        index.write_report(args.report)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
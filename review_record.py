@@ -0,0 +1,140 @@
+"""
+메모리를 적게 쓰는 리뷰 row 표현.
+
+기존 row 는 리뷰마다 dict 하나에 site / title_ko / title_en / year(str(year))를
+반복해서 들고 있었다. ReviewRecord 는 __slots__ 객체 하나에
+  meta   : 타겟마다 하나만 만들어 공유하는 TitleMeta (title_meta() 로 intern)
+  rating / date : sys.intern (값 종류가 적다)
+  review : 본문 문자열 (한 번만 보관)
+  review_id
+만 둔다.
+
+Mapping 이라서 row["review"], row.get("site"), csv.DictWriter, review_db 등
+dict row 를 쓰던 코드는 그대로 동작한다. CSV 에 없는 review_id 만 나중에 채울 수 있다.
+
+메모리 비교: python bench_row_memory.py
+"""
+
+import re
+import sys
+import threading
+from collections.abc import Mapping
+from datetime import date as _date, datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class TitleMeta:
+    """타겟(작품) 하나의 공통 필드. year 는 CSV 와 같은 문자열로 한 번만 만든다."""
+
+    __slots__ = ("site", "title_ko", "title_en", "year")
+
+    def __init__(
+        self, site: Optional[str], title_ko: str, title_en: str, year: str
+    ) -> None:
+        self.site = site
+        self.title_ko = title_ko
+        self.title_en = title_en
+        self.year = year
+
+
+_meta_cache: Dict[Tuple, TitleMeta] = {}
+_meta_lock = threading.Lock()
+
+
+def title_meta(
+    site: Optional[str], title_ko: str, title_en: str, year
+) -> TitleMeta:
+    """(site, title_ko, title_en, year) 마다 TitleMeta 하나만 만들어 돌려준다."""
+    key = (site, title_ko, title_en, year)
+    meta = _meta_cache.get(key)
+    if meta is None:
+        with _meta_lock:
+            meta = _meta_cache.setdefault(
+                key, TitleMeta(site, title_ko, title_en, str(year))
+            )
+    return meta
+
+
+# IMDb 리뷰 고유 번호. 절대/상대 href, ?ref_= 쿼리, GraphQL node id 어디에나 들어 있다
+_IMDB_REVIEW_NO_RE = re.compile(r"rw\d+")
+
+
+def imdb_review_url(href: str) -> Optional[str]:
+    """
+    IMDb 리뷰 href / id 를 https://www.imdb.com/review/rwNNN/ 하나로 맞춘다.
+    (Selenium / 오프라인 / HTTP 경로의 review_id 와 체크포인트 seen 이 같은 값이 되게)
+    rw 번호가 없으면 None.
+    """
+    m = _IMDB_REVIEW_NO_RE.search(href or "")
+    return f"https://www.imdb.com/review/{m.group(0)}/" if m else None
+
+
+def normalize_review_date(text: str, today: Optional[_date] = None) -> str:
+    """
+    카드에 보이는 날짜를 YYYY-MM-DD 로. RT 는 올해 리뷰를 "Aug 15", 지난 리뷰를
+    "Aug 15, 2024" 로 보여 줘서, 해가 바뀌어도 같은 리뷰가 같은 값이 되게 한다
+    (연도가 없으면 today 의 연도). 모르는 형식 / 빈 값은 그대로.
+    """
+    text = (text or "").strip()
+    year = (today or _date.today()).year
+    # 연도 없는 형식은 연도를 붙여서 파싱 (Feb 29 때문에 1900 년으로 읽으면 안 된다)
+    for candidate in (text, f"{text}, {year}"):
+        try:
+            return f"{datetime.strptime(candidate, '%b %d, %Y'):%Y-%m-%d}"
+        except ValueError:
+            continue
+    return text
+
+
+# site 가 있는 row(RT)와 없는 row(IMDb)의 키 순서. 기존 dict row 와 같다.
+_KEYS_WITH_SITE = ("site", "title_ko", "title_en", "year", "rating", "date", "review")
+_KEYS_NO_SITE = _KEYS_WITH_SITE[1:]
+
+
+class ReviewRecord(Mapping):
+    __slots__ = ("meta", "rating", "date", "review", "review_id")
+
+    def __init__(
+        self,
+        meta: TitleMeta,
+        rating: str,
+        date: str,
+        review: str,
+        review_id: Optional[str] = None,
+    ) -> None:
+        self.meta = meta
+        self.rating = sys.intern(rating)
+        self.date = sys.intern(date)
+        self.review = review
+        self.review_id = review_id
+
+    def _keys(self) -> Tuple[str, ...]:
+        keys = _KEYS_WITH_SITE if self.meta.site is not None else _KEYS_NO_SITE
+        if self.review_id is not None:
+            keys = keys + ("review_id",)
+        return keys
+
+    def __getitem__(self, key: str) -> str:
+        if key in ("rating", "date", "review"):
+            return getattr(self, key)
+        if key in ("title_ko", "title_en", "year"):
+            return getattr(self.meta, key)
+        if key == "site" and self.meta.site is not None:
+            return self.meta.site
+        if key == "review_id" and self.review_id is not None:
+            return self.review_id
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if key != "review_id":
+            raise KeyError(f"ReviewRecord 는 review_id 만 바꿀 수 있음: {key}")
+        self.review_id = value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"ReviewRecord({dict(self)!r})"
@@ -0,0 +1,127 @@
+"""
+리뷰 CSV 를 열 기반(Parquet) 데이터셋으로 내보내고 읽는 백엔드.
+
+  imdb_reviews.parquet/
+    site=IMDB/title_en=Parasite/part-0.parquet
+    ...
+
+site / title_en 은 hive 파티션 디렉토리로 빠지고, 파일 안에서 반복되는
+title_ko / year / rating 은 dictionary 인코딩된다. 한 타이틀의 평점만 읽을 때는
+해당 파티션의 rating 열만 스캔한다:
+
+    read_reviews("imdb_reviews.parquet", title_en="Parasite", columns=["rating"])
+
+CSV 는 그대로 원본으로 남는다 (델타 / resume 은 CSV 기준).
+pyarrow 는 이 모듈을 쓸 때만 필요하다.
+"""
+
+import csv
+import os
+from typing import Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+PARQUET_PARTITION_COLUMNS = ["site", "title_en"]
+PARQUET_BATCH_ROWS = 50_000
+
+# 파티션 열을 뺀 파일 안 스키마. 반복 값이 많은 열은 dictionary 로.
+_DICT_STR = pa.dictionary(pa.int32(), pa.string())
+REVIEW_SCHEMA = pa.schema(
+    [
+        ("site", _DICT_STR),
+        ("title_ko", _DICT_STR),
+        ("title_en", _DICT_STR),
+        ("year", pa.int16()),
+        ("rating", _DICT_STR),
+        ("date", pa.string()),
+        ("review", pa.string()),
+    ]
+)
+
+
+def _to_batch(rows: List[Dict[str, str]], site: str) -> pa.RecordBatch:
+    columns = {
+        "site": [r.get("site") or site for r in rows],
+        "title_ko": [r.get("title_ko", "") for r in rows],
+        "title_en": [r.get("title_en", "") for r in rows],
+        "year": [int(r["year"]) if r.get("year") else None for r in rows],
+        "rating": [r.get("rating", "") for r in rows],
+        "date": [r.get("date", "") for r in rows],
+        "review": [r.get("review", "") for r in rows],
+    }
+    arrays = [
+        pa.array(columns[f.name]).cast(f.type)
+        if pa.types.is_dictionary(f.type)
+        else pa.array(columns[f.name], type=f.type)
+        for f in REVIEW_SCHEMA
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=REVIEW_SCHEMA)
+
+
+def _csv_batches(csv_path: str, site: str) -> Iterator[pa.RecordBatch]:
+    """CSV 를 PARQUET_BATCH_ROWS 행씩 RecordBatch 로 (파일 전체를 메모리에 안 올림)."""
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        buf: List[Dict[str, str]] = []
+        for row in csv.DictReader(f):
+            buf.append(row)
+            if len(buf) >= PARQUET_BATCH_ROWS:
+                yield _to_batch(buf, site)
+                buf = []
+        if buf:
+            yield _to_batch(buf, site)
+
+
+def export_csv_to_parquet(csv_path: str, root: str, site: str) -> int:
+    """
+    리뷰 CSV 를 root 아래 site / title_en 파티션 Parquet 데이터셋으로 내보낸다.
+    이번에 쓰는 파티션(타이틀)만 교체하고 다른 타이틀 파티션은 건드리지 않는다.
+    반환값: 내보낸 row 수.
+    """
+    if not os.path.exists(csv_path):
+        print(f"[PARQUET] {csv_path} 없음, 스킵")
+        return 0
+
+    n_rows = [0]
+
+    def _counted() -> Iterator[pa.RecordBatch]:
+        for batch in _csv_batches(csv_path, site):
+            n_rows[0] += batch.num_rows
+            yield batch
+
+    ds.write_dataset(
+        _counted(),
+        root,
+        schema=REVIEW_SCHEMA,
+        format="parquet",
+        partitioning=PARQUET_PARTITION_COLUMNS,
+        partitioning_flavor="hive",
+        existing_data_behavior="delete_matching",
+        basename_template="part-{i}.parquet",
+        file_options=ds.ParquetFileFormat().make_write_options(
+            use_dictionary=["title_ko", "rating"], compression="zstd"
+        ),
+    )
+    print(f"[PARQUET] {root} ({n_rows[0]} rows, {site})")
+    return n_rows[0]
+
+
+def read_reviews(
+    root: str,
+    title_en: Optional[str] = None,
+    site: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> pa.Table:
+    """
+    export_csv_to_parquet 로 만든 데이터셋 읽기.
+    title_en / site 를 주면 해당 파티션 디렉토리만, columns 를 주면 그 열만 읽는다.
+    """
+    dataset = ds.dataset(root, format="parquet", partitioning="hive")
+    flt = None
+    if title_en is not None:
+        flt = ds.field("title_en") == title_en
+    if site is not None:
+        cond = ds.field("site") == site
+        flt = cond if flt is None else flt & cond
+    return dataset.to_table(columns=columns, filter=flt)
@@ -0,0 +1,235 @@
+"""
+크롤 중간에 죽어도 row 를 잃지 않는 스트리밍 CSV 출력.
+
+row 는 수집되는 즉시 타이틀별 spool 파일(<path>.parts/<key>.csv)에 append 되고,
+일정 간격으로 flush / fsync 된다. commit() 때 타겟 순서대로 spool 을 이어 붙여
+임시 파일에 쓰고 os.replace 로 path 에 원자적으로 반영한다.
+(병렬 워커가 동시에 써도 최종 CSV 의 row 순서는 타겟 순서 그대로)
+
+메모리에는 크롤 함수의 배치 하나만 머문다.
+"""
+
+import csv
+import os
+import shutil
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import crawl_metrics
+
+
+class _ByteCounter:
+    """csv 가 쓰는 문자열을 파일로 넘기면서 utf-8 바이트 수를 센다."""
+
+    def __init__(self, f) -> None:
+        self.f = f
+        self.nbytes = 0
+
+    def write(self, s: str) -> int:
+        self.nbytes += len(s.encode("utf-8"))
+        return self.f.write(s)
+
+
+class _Spool:
+    """타이틀 하나의 spool 파일 (헤더 없이 row 만)."""
+
+    def __init__(
+        self,
+        path: str,
+        fieldnames: List[str],
+        flush_every: int,
+        fsync_interval: float,
+    ) -> None:
+        self.path = path
+        self.f = open(path, "a", encoding="utf-8", newline="")
+        self.out = _ByteCounter(self.f)
+        self.writer = csv.DictWriter(
+            self.out, fieldnames=fieldnames, extrasaction="ignore"
+        )
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self.unflushed = 0
+        self.last_fsync = time.monotonic()
+
+    def write_rows(self, rows: List[Dict[str, str]]) -> None:
+        nbytes = self.out.nbytes
+        for r in rows:
+            self.writer.writerow(r)
+        self.count += len(rows)
+        # 크롤 스레드에서 불리므로 현재 타이틀의 메트릭에 들어간다
+        crawl_metrics.count("rows_written", len(rows))
+        crawl_metrics.count("bytes_written", self.out.nbytes - nbytes)
+        self.unflushed += len(rows)
+
+        if self.unflushed >= self.flush_every:
+            self.f.flush()
+            self.unflushed = 0
+            if time.monotonic() - self.last_fsync >= self.fsync_interval:
+                os.fsync(self.f.fileno())
+                self.last_fsync = time.monotonic()
+
+    def sync(self) -> None:
+        if self.f.closed:
+            return
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        self.unflushed = 0
+        self.last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        if self.f.closed:
+            return
+        self.sync()
+        self.f.close()
+
+
+class CsvSpoolWriter:
+    """
+    사용 예:
+        spool = CsvSpoolWriter("imdb_reviews.csv", IMDB_FIELDNAMES)
+        sink = spool.writer_for("tt10919420")   # crawl_*(row_sink=sink)
+        ...
+        spool.finish("tt10919420")
+        spool.commit([t["ttid"] for t in IMDB_TARGETS])
+
+    flush_every    : 이 개수만큼 row 가 쌓이면 파일 버퍼를 flush
+    fsync_interval : flush 할 때 마지막 fsync 후 이 시간(초)이 지났으면 fsync
+    resume         : 이전 실행의 spool 을 지우지 않고 이어서 append
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fieldnames: List[str],
+        flush_every: int = 25,
+        fsync_interval: float = 5.0,
+        resume: bool = False,
+    ) -> None:
+        self.path = path
+        self.fieldnames = fieldnames
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self.parts_dir = path + ".parts"
+        self._spools: Dict[str, _Spool] = {}
+        self._lock = threading.Lock()
+
+        if not resume and os.path.isdir(self.parts_dir):
+            shutil.rmtree(self.parts_dir)
+        os.makedirs(self.parts_dir, exist_ok=True)
+
+    def _spool_path(self, key: str) -> str:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+        return os.path.join(self.parts_dir, f"{safe}.csv")
+
+    def _get(self, key: str) -> _Spool:
+        with self._lock:
+            sp = self._spools.get(key)
+            if sp is None:
+                sp = _Spool(
+                    self._spool_path(key),
+                    self.fieldnames,
+                    self.flush_every,
+                    self.fsync_interval,
+                )
+                self._spools[key] = sp
+            return sp
+
+    def writer_for(self, key: str) -> Callable[[List[Dict[str, str]]], None]:
+        """key(타이틀) 전용 sink 함수. 한 key 는 한 워커만 쓴다고 가정."""
+        return self._get(key).write_rows
+
+    def sync(self, key: str, durable: bool = True) -> None:
+        """
+        key 의 spool 을 즉시 flush (체크포인트 기록 직전에 호출).
+        durable=True 면 fsync 까지, False 면 OS 버퍼까지만.
+        """
+        with self._lock:
+            sp = self._spools.get(key)
+        if sp is None:
+            return
+        if durable:
+            sp.sync()
+        elif not sp.f.closed:
+            sp.f.flush()
+            sp.unflushed = 0
+
+    def finish(self, key: str) -> int:
+        """key 의 spool 을 fsync 후 닫고, 이번 실행에서 쓴 row 수를 반환."""
+        with self._lock:
+            sp = self._spools.get(key)
+        if sp is None:
+            return 0
+        sp.close()
+        return sp.count
+
+    def commit(
+        self, keys: List[str], append: bool = False, keep_parts: bool = False
+    ) -> int:
+        """
+        keys 순서대로 spool 을 이어 붙여 path 에 반영.
+
+        append=False : 임시 파일에 새로 쓰고 os.replace 로 path 를 원자적으로 교체
+        append=True  : 기존 path 뒤에 이어 붙임 (없으면 헤더부터). 이미 옮긴 row 가
+                       다시 붙지 않도록 keys 의 spool 은 항상 지운다 (나머지 key 는 남김).
+        keep_parts   : (append=False 일 때) spool 을 지우지 않고 남김.
+                       중단된 실행을 resume 으로 이어갈 때 필요.
+
+        반환값: 이번에 반영한 row 수 (헤더 제외).
+        """
+        self.close()
+
+        if append:
+            write_header = not os.path.exists(self.path)
+            out_path, mode = self.path, "a"
+        else:
+            write_header = True
+            out_path, mode = self.path + ".tmp", "w"
+
+        n_rows = 0
+        with open(out_path, mode, encoding="utf-8-sig", newline="") as out:
+            if write_header:
+                csv.DictWriter(out, fieldnames=self.fieldnames).writeheader()
+            for key in keys:
+                part = self._spool_path(key)
+                if not os.path.exists(part):
+                    continue
+                with open(part, "r", encoding="utf-8", newline="") as f:
+                    for row in csv.reader(f):
+                        n_rows += 1
+                    f.seek(0)
+                    shutil.copyfileobj(f, out)
+            out.flush()
+            os.fsync(out.fileno())
+
+        if not append:
+            os.replace(out_path, self.path)
+        if append:
+            for key in keys:
+                part = self._spool_path(key)
+                if os.path.exists(part):
+                    os.remove(part)
+            if not os.listdir(self.parts_dir):
+                os.rmdir(self.parts_dir)
+        elif not keep_parts:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+        if append:
+            print(f"[SAVE] {self.path} (이번에 {n_rows}개 추가)")
+        else:
+            print(f"[SAVE] {self.path} ({n_rows} rows)")
+        return n_rows
+
+    def close(self) -> None:
+        """열린 spool 을 모두 fsync 후 닫는다 (path 는 건드리지 않음, spool 은 남김)."""
+        with self._lock:
+            spools = list(self._spools.values())
+            self._spools = {}
+        for sp in spools:
+            sp.close()
+
+    def spooled_count(self, key: str) -> int:
+        """이번 실행에서 key 로 쓴 row 수."""
+        with self._lock:
+            sp: Optional[_Spool] = self._spools.get(key)
+        return sp.count if sp is not None else 0
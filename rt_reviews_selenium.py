@@ -1,7 +1,11 @@
+import argparse
+import atexit
 import csv
+import html as html_lib
 import os
-import time
-from typing import List, Dict
+from datetime import date, datetime
+from urllib.parse import parse_qs, urlsplit
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,11 +13,60 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     ElementClickInterceptedException,
     WebDriverException,
 )
 
+from browser_pool import BrowserPool
+from browser_profile import BrowserProfiles, has_consent, mark_consent
+from crawl_checkpoint import CheckpointStore
+from crawl_metrics import (
+    LOG_DEBUG,
+    LOG_INFO,
+    close_metrics,
+    configure_metrics,
+    count,
+    log,
+    stage,
+    title_metrics,
+)
+from crawl_pool import crawl_targets_parallel
+from crawl_scheduler import ThrottledError, limiter_for, pace
+from crawl_utils import (
+    CommitPipeline,
+    RowCollector,
+    WaitClock,
+    SCRIPT_TIMEOUT,
+    detect_block_page,
+    find_optional,
+    load_known_review_keys,
+    prune_cards,
+    wait_for_card_count,
+    wait_for_dom_change,
+)
+from debug_snapshots import (
+    SNAPSHOT_COMPRESSIONS,
+    SNAPSHOT_LEVELS,
+    configure_snapshots,
+    flush_snapshots,
+    save_snapshot,
+)
+from lean_browser import (
+    apply_lean_options,
+    enable_lean_blocking,
+    report_lean_savings,
+    reset_lean_stats,
+)
+from network_capture import (
+    apply_capture_options,
+    enable_network_capture,
+    take_json_responses,
+)
+from review_db import ReviewDB
+from review_dedup import DedupIndex, content_hash
+from review_record import ReviewRecord, title_meta
+from row_sink import CsvSpoolWriter
+
 
 # =========================
 # Rotten Tomatoes TARGETS
@@ -90,7 +143,21 @@ OUTPUT_CSV = "rt_reviews.csv"
 # 2. 드라이버 생성
 # =========================================================
 
-def create_driver(headless: bool = False) -> webdriver.Chrome:
+def create_driver(
+    headless: bool = False,
+    lean: bool = False,
+    lean_allow: Optional[List[str]] = None,
+    capture: bool = False,
+    profiles: Optional[BrowserProfiles] = None,
+) -> webdriver.Chrome:
+    """
+    lean=True 면 이미지 / 폰트 / 동영상 / 광고·트래커 요청을 막는 가벼운 프로필.
+    lean_allow 로 막지 않을 범주("font") 나 URL 패턴을 지정.
+    capture=True 면 XHR 응답 본문을 읽을 수 있게 performance 로그를 켠다
+    (extraction="network").
+    profiles 를 주면 거기서 빌린 user-data-dir (디스크 캐시 / 쿠키 / 배너 동의가
+    실행 간에 남는다).
+    """
     chrome_options = webdriver.ChromeOptions()
 
     chrome_options.add_argument("--disable-gpu")
@@ -108,9 +175,34 @@ def create_driver(headless: bool = False) -> webdriver.Chrome:
     if headless:
         chrome_options.add_argument("--headless=new")
 
-    driver = webdriver.Chrome(options=chrome_options)
+    if lean:
+        apply_lean_options(chrome_options)
+    if capture:
+        apply_capture_options(chrome_options)
+
+    profile = profiles.acquire() if profiles is not None else None
+    if profile is not None:
+        for arg in profiles.chrome_args(profile):
+            chrome_options.add_argument(arg)
+
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+    except Exception:
+        if profile is not None:
+            profiles.release(profile, promote=False)
+        raise
+    if profile is not None:
+        profiles.attach(driver, profile)
     driver.set_window_size(1280, 900)
-    driver.implicitly_wait(3)
+    # 암묵적 대기는 끈다: 카드 파싱의 audience → critics 폴백처럼
+    # 없는 요소를 조회할 때마다 3초씩 멈추기 때문. 페이지 준비는 WebDriverWait 로.
+    driver.implicitly_wait(0)
+    # MutationObserver 기반 대기(execute_async_script) 상한
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
+    if lean:
+        enable_lean_blocking(driver, allow=lean_allow)
+    if capture:
+        enable_network_capture(driver)
     return driver
 
 
@@ -126,35 +218,54 @@ def _slugify(text: str) -> str:
     )
 
 
-def _save_debug_html(html: str, path: str) -> None:
-    try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(html)
-    except Exception as e:
-        print(f"[DEBUG] HTML 저장 실패 ({path}): {e}")
+_RT_CONSENT_BUTTON_XPATH = "//button[contains(normalize-space(.), 'Continue')]"
 
 
-def close_rt_cookie_banner(driver, wait_seconds: int = 5) -> None:
+def close_rt_cookie_banner(
+    driver, wait_seconds: int = 5, clock: Optional[WaitClock] = None
+) -> None:
     """
     하단 쿠키/약관 배너의 'Continue' 버튼을 눌러서 없앤다.
     없으면 그냥 패스.
+
+    프로필에 동의가 기록돼 있으면(browser_profile.has_consent) 기다리지 않고,
+    그래도 배너가 이미 떠 있으면 누르기만 한다. 처리한 뒤에는 동의를 기록.
     """
+    if clock is None:
+        clock = WaitClock()
+    if has_consent(driver, "rt"):
+        btn = find_optional(driver, By.XPATH, _RT_CONSENT_BUTTON_XPATH)
+        if btn is None:
+            log("[RT] 쿠키/약관 동의가 프로필에 저장됨, 배너 대기 생략", LOG_DEBUG)
+            return
+        try:
+            driver.execute_script("arguments[0].click();", btn)
+        except WebDriverException:
+            pass
+        return
     try:
         wait = WebDriverWait(driver, wait_seconds)
-        btn = wait.until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    "//button[contains(normalize-space(.), 'Continue')]",
-                )
-            )
+        btn = clock.until(
+            wait,
+            EC.element_to_be_clickable((By.XPATH, _RT_CONSENT_BUTTON_XPATH)),
+            "cookie_banner",
         )
         driver.execute_script("arguments[0].click();", btn)
-        time.sleep(1.0)
+        # 배너가 사라지는 즉시 진행 (1초 상한)
+        try:
+            clock.until(
+                WebDriverWait(driver, 1.0, poll_frequency=0.1),
+                EC.invisibility_of_element(btn),
+                "cookie_banner",
+            )
+        except TimeoutException:
+            pass
         print("[RT] 쿠키/약관 배너 'Continue' 클릭 완료")
+        mark_consent(driver, "rt")
     except TimeoutException:
+        # 프로필 쿠키로 이미 동의된 상태 (또는 배너가 없는 지역): 다음부터는 안 기다린다
         print("[RT] 쿠키/약관 배너 없음 (또는 이미 처리됨)")
+        mark_consent(driver, "rt")
     except Exception as e:
         print(f"[RT] 쿠키/약관 배너 클릭 중 예외 발생: {e}")
 
@@ -165,37 +276,28 @@ def close_rt_cookie_banner(driver, wait_seconds: int = 5) -> None:
 
 def _parse_rt_review_card(card) -> Dict[str, str]:
     """단일 review-card에서 rating/date/review 텍스트 추출."""
+    # 선택 필드는 모두 대기 없이 조회 (없으면 None)
     # 날짜
-    try:
-        date_text = card.find_element(
-            By.CSS_SELECTOR, "span[slot='timestamp']"
-        ).text.strip()
-    except NoSuchElementException:
-        date_text = ""
+    date_el = find_optional(card, By.CSS_SELECTOR, "span[slot='timestamp']")
+    date_text = date_el.text.strip() if date_el is not None else ""
 
     # 리뷰 본문
-    try:
-        review_text = card.find_element(
-            By.CSS_SELECTOR,
-            "drawer-more[slot='review'] span[slot='content']",
-        ).text.strip()
-    except NoSuchElementException:
-        review_text = ""
+    review_el = find_optional(
+        card,
+        By.CSS_SELECTOR,
+        "drawer-more[slot='review'] span[slot='content']",
+    )
+    review_text = review_el.text.strip() if review_el is not None else ""
 
     # 평점 (percentage/score/sentiment)
     rating = ""
-    score_el = None
-    try:
-        score_el = card.find_element(
-            By.CSS_SELECTOR, "[slot='rating'] score-icon-audience"
+    score_el = find_optional(
+        card, By.CSS_SELECTOR, "[slot='rating'] score-icon-audience"
+    )
+    if score_el is None:
+        score_el = find_optional(
+            card, By.CSS_SELECTOR, "[slot='rating'] score-icon-critics"
         )
-    except NoSuchElementException:
-        try:
-            score_el = card.find_element(
-                By.CSS_SELECTOR, "[slot='rating'] score-icon-critics"
-            )
-        except NoSuchElementException:
-            score_el = None
 
     if score_el is not None:
         rating = (
@@ -211,6 +313,230 @@ def _parse_rt_review_card(card) -> Dict[str, str]:
     }
 
 
+RT_CARDS_CONTAINER_SELECTOR = (
+    "div.reviews-cards[data-pagemediareviewsmanager='cards']"
+)
+RT_CARD_SELECTOR = RT_CARDS_CONTAINER_SELECTOR + " review-card"
+
+# 아직 처리하지 않은 review-card만 골라서 data-miner-seen 표시를 붙이고 반환.
+# (라운드마다 DOM 전체 카드를 다시 파싱하지 않기 위한 커서 역할)
+_TAKE_NEW_CARDS_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var fresh = [];
+for (var i = 0; i < cards.length; i++) {
+    if (!cards[i].hasAttribute("data-miner-seen")) {
+        cards[i].setAttribute("data-miner-seen", "1");
+        fresh.push(cards[i]);
+    }
+}
+return {total: cards.length, cards: fresh};
+"""
+
+
+def count_rt_cards(driver) -> int:
+    """현재 DOM에 붙어 있는 review-card 개수 (WebElement 목록 없이 JS로)."""
+    return int(
+        driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;",
+            RT_CARD_SELECTOR,
+        )
+        or 0
+    )
+
+
+def rt_review_key(row: Dict[str, str]) -> Tuple[str, str]:
+    """중복 제거 / 델타 모드에서 쓰는 리뷰 키 (날짜 + 본문 전체 해시)."""
+    return (row["date"], content_hash(row["review"]))
+
+
+def take_new_rt_cards(driver) -> Tuple[int, List]:
+    """
+    지난 라운드 이후 새로 붙은 review-card만 반환.
+    반환값: (DOM 상 전체 카드 수, 새 카드 WebElement 목록)
+    """
+    res = driver.execute_script(_TAKE_NEW_CARDS_JS, RT_CARD_SELECTOR) or {}
+    return int(res.get("total") or 0), list(res.get("cards") or [])
+
+
+def _untag_rt_card(driver, card) -> None:
+    """본문이 아직 렌더링 안 된 카드는 다음 라운드에 다시 보도록 표시 해제."""
+    try:
+        driver.execute_script(
+            "arguments[0].removeAttribute('data-miner-seen');", card
+        )
+    except WebDriverException:
+        pass
+
+
+# extraction="network" 에서 API 응답과 DOM 파싱을 대조할 라운드 수 (타이틀마다).
+# 한 번이라도 어긋나면 그 타이틀은 끝까지 DOM 파싱 (rt_review_key 가 날짜를 쓰므로)
+RT_NETWORK_CROSSCHECK_ROUNDS = 2
+
+
+def _is_rt_review_api(url: str) -> bool:
+    """
+    Load More 가 부르는 관객 리뷰 API (rottentomatoes.com/napi/.../reviews[/...]) 인지.
+    평론가 리뷰(critic / top_critic)는 같은 경로라도 제외한다.
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if host != "rottentomatoes.com" and not host.endswith(".rottentomatoes.com"):
+        return False
+    segments = parts.path.lower().split("/")
+    if len(segments) < 2 or segments[1] != "napi" or "reviews" not in segments:
+        return False
+    if any("critic" in seg for seg in segments):
+        return False
+    kind = (parse_qs(parts.query).get("type") or [""])[0].lower()
+    return "critic" not in kind
+
+
+# 리뷰 한 건을 나타내는 JSON 객체에서 본문이 들어 있는 키 (앞에 있는 것부터)
+_RT_JSON_TEXT_KEYS = ("quote", "reviewQuote", "review", "text")
+
+
+def _iter_rt_review_items(obj, depth: int = 0) -> Iterator[Dict]:
+    """응답 JSON 안의 리뷰 객체들 (본문 키가 있는 dict). 응답 형태가 바뀌어도 찾도록 재귀."""
+    if depth > 6:
+        return
+    if isinstance(obj, dict):
+        if any(isinstance(obj.get(k), str) for k in _RT_JSON_TEXT_KEYS):
+            yield obj
+            return
+        for v in obj.values():
+            yield from _iter_rt_review_items(v, depth + 1)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from _iter_rt_review_items(v, depth + 1)
+
+
+def _rt_display_date(value) -> str:
+    """
+    JSON 날짜(ISO 또는 'Aug 15, 2024')를 카드에 보이는 형식으로:
+    올해면 'Aug 15', 아니면 'Aug 15, 2024'. 모르는 형식은 그대로.
+    """
+    text = str(value or "").strip()
+    try:
+        d = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            d = datetime.strptime(text, "%b %d, %Y")
+        except ValueError:
+            return text
+    if d.year == date.today().year:
+        return f"{d:%b} {d.day}"
+    return f"{d:%b} {d.day}, {d.year}"
+
+
+def _parse_rt_review_json(item: Dict) -> Dict[str, str]:
+    """_parse_rt_review_card 의 리뷰 API JSON 버전 (같은 rating/date/review)."""
+    review = next(
+        (item[k] for k in _RT_JSON_TEXT_KEYS if isinstance(item.get(k), str)), ""
+    )
+
+    # 평점: 카드의 percentage → score → sentiment 순서를 따른다
+    rating = ""
+    for k in ("percentage", "score"):
+        v = item.get(k)
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            rating = f"{v:g}"
+        elif isinstance(v, str):
+            rating = v.strip()
+        if rating:
+            break
+    if not rating:
+        sentiment = item.get("scoreSentiment") or item.get("sentiment") or ""
+        rating = str(sentiment).strip().lower()
+
+    return {
+        "rating": rating,
+        "date": _rt_display_date(
+            item.get("creationDate") or item.get("createDate") or item.get("date")
+        ),
+        "review": html_lib.unescape(review).strip(),
+    }
+
+
+def take_rt_network_rows(driver) -> List[Dict[str, str]]:
+    """지난 호출 이후 끝난 리뷰 API 응답의 리뷰들 (capture 드라이버가 아니면 빈 목록)."""
+    parsed: List[Dict[str, str]] = []
+    for _url, payload in take_json_responses(driver, _is_rt_review_api):
+        parsed.extend(
+            _parse_rt_review_json(it) for it in _iter_rt_review_items(payload)
+        )
+    return parsed
+
+
+# 새 카드들의 본문 텍스트만 한 번에 (_parse_rt_review_card 의 본문 셀렉터와 같다)
+_CARD_TEXTS_JS = """
+return arguments[0].map(function (card) {
+    var el = card.querySelector("drawer-more[slot='review'] span[slot='content']");
+    return el ? el.innerText : "";
+});
+"""
+
+
+def match_rt_network_rows(
+    driver, cards: List, net_rows: List[Dict[str, str]]
+) -> Tuple[List[Tuple[object, Dict[str, str]]], int]:
+    """
+    이번 라운드에 새로 붙은 카드를 본문 해시로 API row 와 맞춘다.
+    맞는 카드는 API row 의 평점 / 날짜, 못 맞춘 카드는 DOM 파싱 결과. 카드에 없는
+    API row 는 버린다.
+    반환값: ([(card, row)], API row 로 채운 카드 수)
+    """
+    net_by_hash = {content_hash(r["review"]): r for r in net_rows if r["review"]}
+    try:
+        texts = driver.execute_script(_CARD_TEXTS_JS, cards) or []
+    except WebDriverException:
+        texts = []
+    if len(texts) != len(cards):
+        texts = [""] * len(cards)
+
+    out: List[Tuple[object, Dict[str, str]]] = []
+    matched = 0
+    for card, text in zip(cards, texts):
+        text = (text or "").strip()
+        row = net_by_hash.get(content_hash(text)) if text else None
+        if row is None:
+            row = _parse_rt_review_card(card)
+        else:
+            # 평점 / 날짜는 API, 본문은 element 모드와 같게 카드에 보이는 텍스트
+            row = {**row, "review": text}
+            matched += 1
+        out.append((card, row))
+    return out, matched
+
+
+def crosscheck_rt_rows(
+    net_rows: List[Dict[str, str]], dom_rows: List[Dict[str, str]]
+) -> Dict[str, int]:
+    """
+    같은 라운드의 API 응답 row 와 DOM 카드 row 를 본문 해시로 맞춰 보고 필드별 불일치 수.
+    dom_only : DOM 에만 있는 리뷰 (API 응답에서 놓친 것)
+    """
+    net_by_hash = {content_hash(r["review"]): r for r in net_rows if r["review"]}
+    result = {"dom": 0, "matched": 0, "dom_only": 0, "date": 0, "rating": 0}
+    for d in dom_rows:
+        if not d["review"]:
+            continue
+        result["dom"] += 1
+        n = net_by_hash.get(content_hash(d["review"]))
+        if n is None:
+            result["dom_only"] += 1
+            continue
+        result["matched"] += 1
+        for field in ("date", "rating"):
+            if n[field] != d[field]:
+                result[field] += 1
+                if result[field] == 1:
+                    print(
+                        f"[RT] 네트워크/DOM {field} 불일치 예: "
+                        f"API {n[field]!r} / DOM {d[field]!r}"
+                    )
+    return result
+
+
 # =========================================================
 # 5. 한 타이틀 크롤링
 # =========================================================
@@ -220,121 +546,303 @@ def crawl_rt_audience_reviews_for_target(
     target: Dict,
     max_pages: int = 30,
     wait_seconds: int = 10,
+    extraction: str = "element",
+    row_sink: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+    known_keys: Optional[Set[Tuple[str, str]]] = None,
+    bounded_dom: bool = False,
+    pipelined: bool = True,
 ) -> List[Dict[str, str]]:
     """
     한 타이틀에 대해 Rotten Tomatoes Audience Reviews를 가능한 많이 수집.
+    extraction="offline" 이면 Load More 로 페이지만 끝까지 펼치고,
+    마지막 page_source 를 offline_parser 로 한 번에 파싱.
+    extraction="network" 면 Load More 가 받아 온 리뷰 API JSON 에서 row 를 만든다
+    (create_driver(capture=True) 필요). 새 카드를 본문 해시로 API row 와 맞추고,
+    못 맞춘 카드(첫 페이지 포함)는 DOM 파싱. 처음 RT_NETWORK_CROSSCHECK_ROUNDS 라운드는
+    DOM 파싱 결과와 대조해서, 하나라도 어긋나면 그 타이틀은 끝까지 DOM 파싱.
+
+    row_sink 를 주면 라운드마다 새 row 를 row_sink(rows) 로 넘기고 쌓지 않는다
+    (이 경우 반환값은 빈 리스트). checkpoint 를 주면 라운드마다 seen_keys /
+    Load More 횟수를 기록하고, 이전 상태가 있으면 그 횟수까지 파싱 없이 빨리 감는다.
+
+    known_keys(이미 저장된 리뷰 키 집합)를 주면 델타 모드: 저장된 리뷰는 건너뛰고,
+    한 라운드가 저장된 리뷰만 가져오면 더 페이지를 넘기지 않고 멈춘다.
+
+    bounded_dom=True 면 라운드가 끝날 때 처리한(data-miner-seen) 카드를 비운다.
+    (offline 모드는 마지막 page_source 가 전부 필요해서 무시)
+
+    pipelined=True 면 (row_sink 가 있을 때) 라운드의 sink 쓰기 / 체크포인트 기록을
+    백그라운드 스레드(CommitPipeline)에 맡기고 바로 다음 Load More 를 누른다.
+
+    끝나면 이 타이틀에서 명시적 대기/sleep 에 쓴 시간을 출력.
     """
+    clock = WaitClock()
+    with title_metrics("RT", target["title_en"]) as tm:
+        reset_lean_stats(driver)
+        pipeline = (
+            CommitPipeline(name=f"RT-commit-{_slugify(target['title_en'])}")
+            if pipelined and row_sink is not None
+            else None
+        )
+        try:
+            return _crawl_rt_audience_reviews(
+                driver,
+                target,
+                max_pages=max_pages,
+                wait_seconds=wait_seconds,
+                extraction=extraction,
+                row_sink=row_sink,
+                checkpoint=checkpoint,
+                known_keys=known_keys,
+                bounded_dom=bounded_dom,
+                clock=clock,
+                pipeline=pipeline,
+            )
+        finally:
+            if pipeline is not None:
+                # 예외로 끝나도 이미 넘긴 라운드는 저장하고 체크포인트까지 기록
+                pipeline.close()
+            print(f"[RT] {target['title_en']} – 대기 시간 합계 {clock.summary()}")
+            tm.add_waits(clock)
+            report_lean_savings(driver, f"[RT] {target['title_en']}")
+
+
+def _crawl_rt_audience_reviews(
+    driver: webdriver.Chrome,
+    target: Dict,
+    max_pages: int = 30,
+    wait_seconds: int = 10,
+    extraction: str = "element",
+    row_sink: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+    known_keys: Optional[Set[Tuple[str, str]]] = None,
+    bounded_dom: bool = False,
+    clock: Optional[WaitClock] = None,
+    pipeline: Optional[CommitPipeline] = None,
+) -> List[Dict[str, str]]:
+    """crawl_rt_audience_reviews_for_target 본체. 대기 시간은 clock 에 누적."""
+    if clock is None:
+        clock = WaitClock()
+    offline = extraction == "offline"
+    network = extraction == "network"
+    bounded_dom = bounded_dom and not offline
+
     title_ko = target["title_ko"]
     title_en = target["title_en"]
     year = target["year"]
     rt_url = target["rt_url"]
+    # 이 타겟의 row 가 공유하는 title_ko / title_en / year
+    meta = title_meta("RT", title_ko, title_en, year)
 
     print(f"[RT] '{title_en}' Audience Reviews 수집 시작 → {rt_url}")
-    os.makedirs("debug", exist_ok=True)
     safe_key = _slugify(title_en)
 
-    rows: List[Dict[str, str]] = []
-    seen_keys = set()  # (date, review[:80]) 기준 중복 제거
+    seen_keys = set()  # rt_review_key (date, 본문 해시) 기준 중복 제거
+    # 이전 실행 체크포인트: 이 Load More 횟수까지는 파싱 없이 클릭만 (빨리 감기)
+    resume_pages = 0
+    if checkpoint is not None:
+        state = checkpoint.get(rt_url)
+        if state["seen"] or state["progress"]:
+            seen_keys.update(tuple(k) for k in state["seen"])
+            resume_pages = state["progress"]
+            print(
+                f"[RT] {title_en} – 체크포인트: {len(seen_keys)}개 수집됨, "
+                f"page {resume_pages}까지 빨리 감기"
+            )
+
+    # row_sink 가 있으면 라운드마다 넘기고 비우는 누적기
+    rows = RowCollector(row_sink, initial_count=len(seen_keys), pipeline=pipeline)
+    round_keys: List[Tuple[str, str]] = []
+
+    def _commit_round(progress: int) -> None:
+        # row 를 sink 로 먼저 넘기고 나서 체크포인트에 기록 (pipeline 이면 백그라운드에서)
+        keys = list(round_keys)
+        rows.flush(
+            after=(
+                (lambda: checkpoint.update(rt_url, keys, progress=progress))
+                if checkpoint is not None
+                else None
+            )
+        )
+        round_keys.clear()
 
-    driver.get(rt_url)
-    close_rt_cookie_banner(driver, wait_seconds=5)
+    pace()
+    with stage("navigate"):
+        driver.get(rt_url)
+    count("pages")
+    close_rt_cookie_banner(driver, wait_seconds=5, clock=clock)
 
     wait = WebDriverWait(driver, wait_seconds)
 
     # 리뷰 섹션 대기
     try:
-        wait.until(
+        clock.until(
+            wait,
             EC.presence_of_element_located(
                 (By.CSS_SELECTOR, "section[data-qa='section:reviews']")
-            )
+            ),
+            "section",
         )
     except TimeoutException:
-        print(f"[RT] {title_en} – 리뷰 섹션을 찾지 못함.")
-        _save_debug_html(
-            driver.page_source,
-            os.path.join("debug", f"rt_{safe_key}_no_section.html"),
+        block = detect_block_page(driver)
+        print(
+            f"[RT] {title_en} – 리뷰 섹션을 찾지 못함."
+            + (f" (차단 표식: {block})" if block else "")
+        )
+        save_snapshot(
+            f"rt_{safe_key}_no_section", lambda: driver.page_source, error=True
         )
-        return rows
+        # 스케줄러가 늦춰서 다시 시도. 차단 표식이 없으면 다른 레이아웃일 수도 있어서 soft
+        raise ThrottledError(block or "리뷰 섹션 없음", soft=not block)
 
     # All Audience 탭 클릭 (있으면)
-    try:
-        all_aud_btn = driver.find_element(
-            By.CSS_SELECTOR, "rt-button[data-qa='all-audience']"
-        )
-        driver.execute_script("arguments[0].click();", all_aud_btn)
-        time.sleep(1.5)
-    except NoSuchElementException:
-        pass
-    except WebDriverException:
-        pass
+    all_aud_btn = find_optional(
+        driver, By.CSS_SELECTOR, "rt-button[data-qa='all-audience']"
+    )
+    if all_aud_btn is not None:
+        try:
+            # 클릭 후 카드 목록이 다시 그려지는 순간까지 대기 (1.5초 상한)
+            wait_for_dom_change(
+                driver,
+                RT_CARDS_CONTAINER_SELECTOR,
+                1.5,
+                clock,
+                "audience_tab",
+                click_element=all_aud_btn,
+            )
+        except WebDriverException:
+            pass
 
     # 카드 컨테이너 대기
     try:
-        wait.until(
+        clock.until(
+            wait,
             EC.presence_of_element_located(
-                (
-                    By.CSS_SELECTOR,
-                    "div.reviews-cards[data-pagemediareviewsmanager='cards']",
-                )
-            )
+                (By.CSS_SELECTOR, RT_CARDS_CONTAINER_SELECTOR)
+            ),
+            "cards",
         )
     except TimeoutException:
-        print(f"[RT] {title_en} – 리뷰 카드 컨테이너를 찾지 못함.")
-        _save_debug_html(
-            driver.page_source,
-            os.path.join("debug", f"rt_{safe_key}_no_cards.html"),
+        block = detect_block_page(driver)
+        print(
+            f"[RT] {title_en} – 리뷰 카드 컨테이너를 찾지 못함."
+            + (f" (차단 표식: {block})" if block else "")
         )
-        return rows
+        save_snapshot(
+            f"rt_{safe_key}_no_cards", lambda: driver.page_source, error=True
+        )
+        raise ThrottledError(block or "리뷰 카드 없음", soft=not block)
 
-    _save_debug_html(
-        driver.page_source,
-        os.path.join("debug", f"rt_{safe_key}_page0.html"),
+    debug_path = save_snapshot(
+        f"rt_{safe_key}_page0", lambda: driver.page_source, sample_key=rt_url
     )
-    print(f"[DEBUG] 초기 HTML 저장됨 → debug/rt_{safe_key}_page0.html")
+    if debug_path:
+        print(f"[DEBUG] 초기 HTML 저장 → {debug_path}")
 
     page_idx = 1
     last_dom_count = 0
     stagnant_rounds = 0
+    pruned_total = 0
+    api_rows_total = 0
+    crosschecks_left = RT_NETWORK_CROSSCHECK_ROUNDS
+    use_api = network
 
-    while True:
-        time.sleep(1.0)
+    # 첫 카드가 붙을 때까지 (5초 상한)
+    wait_for_card_count(driver, RT_CARD_SELECTOR, 1, 5, clock, "cards")
 
-        cards = driver.find_elements(
-            By.CSS_SELECTOR,
-            "div.reviews-cards[data-pagemediareviewsmanager='cards'] review-card",
-        )
-        cur_dom_count = len(cards)
-        print(
-            f"[RT] {title_en} – page {page_idx}: DOM 상 리뷰 카드 수: {cur_dom_count}"
+    while True:
+        if offline:
+            # 파싱은 마지막에 page_source 로 한 번만
+            cur_dom_count, cards = count_rt_cards(driver), []
+        else:
+            with stage("take_cards"):
+                cur_dom_count, cards = take_new_rt_cards(driver)
+            if page_idx <= resume_pages:
+                # 빨리 감기: 이미 수집한 구간은 표시만 하고 파싱하지 않음
+                cards = []
+        net_rows: List[Dict[str, str]] = []
+        if network:
+            # 지난 라운드 이후 끝난 리뷰 API 응답 (빨리 감기 구간 / DOM 전환 뒤에는 버린다.
+            # 안 읽으면 performance 로그 버퍼가 계속 쌓인다)
+            with stage("capture"):
+                net_rows = take_rt_network_rows(driver)
+            if page_idx <= resume_pages or not use_api:
+                net_rows = []
+        log(
+            f"[RT] {title_en} – page {page_idx}: DOM 상 리뷰 카드 수: {cur_dom_count} "
+            f"(새 카드 {len(cards)})",
+            LOG_DEBUG,
         )
 
         new_rows_this_round = 0
-        for card in cards:
-            parsed = _parse_rt_review_card(card)
+        known_this_round = 0
+        dom_rows: Optional[List[Dict[str, str]]] = None
+        if net_rows and cards and crosschecks_left > 0:
+            crosschecks_left -= 1
+            with stage("crosscheck"):
+                dom_rows = [_parse_rt_review_card(card) for card in cards]
+                cc = crosscheck_rt_rows(net_rows, dom_rows)
+            print(
+                f"[RT] {title_en} – 네트워크/DOM 대조 (page {page_idx}): "
+                f"DOM 카드 {cc['dom']}개 중 본문 일치 {cc['matched']}, "
+                f"DOM 에만 {cc['dom_only']}, 날짜 불일치 {cc['date']}, "
+                f"평점 불일치 {cc['rating']}"
+            )
+            mismatches = cc["dom_only"] + cc["date"] + cc["rating"]
+            count("crosscheck_mismatch", mismatches)
+            if mismatches:
+                # API row 로 만든 키가 DOM 과 달라지면 델타 / 중복 판정이 깨진다
+                use_api = False
+                print(f"[RT] {title_en} – API 응답이 DOM 과 달라서 이 타이틀은 DOM 파싱")
+        with stage("extract"):
+            if dom_rows is not None:
+                parsed_cards = list(zip(cards, dom_rows))
+            elif net_rows and use_api:
+                # 새 카드를 API row 와 맞추고, 못 맞춘 카드만 DOM 파싱
+                parsed_cards, matched = match_rt_network_rows(driver, cards, net_rows)
+                api_rows_total += matched
+            else:
+                parsed_cards = [(card, _parse_rt_review_card(card)) for card in cards]
+        for card, parsed in parsed_cards:
             if not parsed["review"]:
+                _untag_rt_card(driver, card)
                 continue
 
-            key = (parsed["date"], parsed["review"][:80])
+            key = rt_review_key(parsed)
             if key in seen_keys:
                 continue
+            if known_keys is not None and key in known_keys:
+                known_this_round += 1
+                continue
             seen_keys.add(key)
+            round_keys.append(key)
 
             rows.append(
-                {
-                    "site": "RT",
-                    "title_ko": title_ko,
-                    "title_en": title_en,
-                    "year": str(year),
-                    "rating": parsed["rating"],
-                    "date": parsed["date"],
-                    "review": parsed["review"],
-                }
+                ReviewRecord(
+                    meta, parsed["rating"], parsed["date"], parsed["review"]
+                )
             )
             new_rows_this_round += 1
 
-        print(
-            f"[RT] {title_en} – 이번 라운드 신규 {new_rows_this_round}개, 누적 {len(rows)}개"
-        )
+        _commit_round(page_idx)
+        if bounded_dom:
+            # 본문이 아직 없어 표시를 해제한 카드는 남겨 두고 다음 라운드에 다시 본다
+            with stage("prune"):
+                pruned_total += prune_cards(
+                    driver, RT_CARD_SELECTOR, require_attr="data-miner-seen"
+                )
+
+        if not offline:
+            log(
+                f"[RT] {title_en} – 이번 라운드 신규 {new_rows_this_round}개, "
+                f"누적 {len(rows)}개",
+                LOG_DEBUG,
+            )
+
+        if known_this_round and not new_rows_this_round:
+            print(f"[RT] {title_en} – 이번 라운드가 전부 저장된 리뷰, 델타 수집 종료.")
+            break
 
         # DOM 변화 체크
         if cur_dom_count == last_dom_count:
@@ -344,6 +852,9 @@ def crawl_rt_audience_reviews_for_target(
         last_dom_count = cur_dom_count
 
         if stagnant_rounds >= 2:
+            block = detect_block_page(driver)
+            if block:
+                raise ThrottledError(block)
             print(f"[RT] {title_en} – 2 라운드 연속 새 카드 없음, 종료.")
             break
 
@@ -353,50 +864,101 @@ def crawl_rt_audience_reviews_for_target(
 
         # Load More 버튼 클릭
         try:
-            load_more_btn = driver.find_element(
-                By.CSS_SELECTOR,
-                "rt-button[data-pagemediareviewsmanager='loadMoreBtn']",
+            load_more_btn = clock.until(
+                WebDriverWait(driver, 3),
+                EC.presence_of_element_located(
+                    (
+                        By.CSS_SELECTOR,
+                        "rt-button[data-pagemediareviewsmanager='loadMoreBtn']",
+                    )
+                ),
+                "load_more_button",
             )
             is_hidden = load_more_btn.get_attribute("hidden") is not None
             if is_hidden:
                 print(f"[RT] {title_en} – Load More 버튼 hidden, 종료.")
                 break
 
-            driver.execute_script("arguments[0].click();", load_more_btn)
-            print(f"[RT] {title_en} – Load More 클릭 {page_idx}회")
+            pace()
+            with stage("click"):
+                driver.execute_script("arguments[0].click();", load_more_btn)
+            count("clicks")
+            log(f"[RT] {title_en} – Load More 클릭 {page_idx}회", LOG_DEBUG)
             page_idx += 1
-            time.sleep(2.0)
-        except NoSuchElementException:
+            # 새 review-card 가 붙는 즉시 다음 라운드로 (6초 상한).
+            # 안 늘면 다음 라운드의 DOM 변화 체크가 stagnant 로 센다.
+            if wait_for_card_count(
+                driver, RT_CARD_SELECTOR, cur_dom_count + 1, 6, clock, "load_more"
+            ) > cur_dom_count:
+                count("pages")
+        except TimeoutException:
+            block = detect_block_page(driver)
+            if block:
+                raise ThrottledError(block)
             print(f"[RT] {title_en} – Load More 버튼 없음, 종료.")
             break
         except ElementClickInterceptedException:
             print(f"[RT] {title_en} – Load More 클릭 실패, 종료.")
             break
 
-    _save_debug_html(
-        driver.page_source,
-        os.path.join("debug", f"rt_{safe_key}_last.html"),
+    # 마지막 page_source 는 offline 파싱이나 스냅샷 저장에 필요할 때만 받는다
+    html: Optional[str] = None
+
+    if offline:
+        # lxml 은 offline 모드에서만 필요
+        from offline_parser import parse_rt_html
+
+        with stage("page_source"):
+            html = driver.page_source
+        with stage("offline_parse"):
+            offline_rows = parse_rt_html(html, title_ko, title_en, year)
+        for r in offline_rows:
+            key = rt_review_key(r)
+            if key in seen_keys:
+                continue
+            if known_keys is not None and key in known_keys:
+                continue
+            seen_keys.add(key)
+            round_keys.append(key)
+            rows.append(r)
+        _commit_round(page_idx)
+
+    debug_path = save_snapshot(
+        f"rt_{safe_key}_last",
+        html if html is not None else (lambda: driver.page_source),
+        sample_key=rt_url,
     )
-    print(f"[DEBUG] 마지막 HTML 저장됨 → debug/rt_{safe_key}_last.html")
+    if debug_path:
+        print(f"[DEBUG] 마지막 HTML 저장 → {debug_path}")
     print(f"[RT] {title_en} – 최종 {len(rows)}개 수집 후 종료")
+    if bounded_dom:
+        print(f"[RT] {title_en} – bounded DOM: 카드 {pruned_total}개 비움")
+    if network:
+        print(f"[RT] {title_en} – 네트워크 모드: API 응답에서 읽은 리뷰 {api_rows_total}개")
 
-    return rows
+    # 남은 쓰기가 모두 끝난 뒤에 완료 표시
+    result = rows.result()
+    if checkpoint is not None:
+        checkpoint.mark_done(rt_url)
+    return result
 
 
 # =========================================================
 # 6. CSV 저장
 # =========================================================
 
+RT_FIELDNAMES = ["site", "title_ko", "title_en", "year", "rating", "date", "review"]
+
+
 def save_to_csv(path: str, rows: List[Dict[str, str]]) -> None:
     if not rows:
         print("[WARN] 저장할 데이터가 없습니다.")
         return
 
-    fieldnames = ["site", "title_ko", "title_en", "year", "rating", "date", "review"]
     file_exists = os.path.exists(path)
 
     with open(path, "a", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=RT_FIELDNAMES, extrasaction="ignore")
         if not file_exists:
             writer.writeheader()
         for r in rows:
@@ -409,28 +971,332 @@ def save_to_csv(path: str, rows: List[Dict[str, str]]) -> None:
 # 7. 엔트리 포인트
 # =========================================================
 
+# 사이트별 동시 드라이버 수 상한 (--workers 는 이 값을 넘지 못함)
+RT_MAX_WORKERS = 3
+
+# 스케줄러가 요청 속도를 조절하는 단위 (워커 전체가 같은 limiter 를 쓴다)
+RT_DOMAIN = "www.rottentomatoes.com"
+
+RT_CHECKPOINT_PATH = "rt_reviews.checkpoint.jsonl"
+RT_PARQUET_DIR = "rt_reviews.parquet"
+RT_DUP_REPORT = "rt_dup_clusters.csv"
+RT_PROFILE_DIR = os.path.join("chrome_profile", "rt")
+
+
 def main() -> None:
     MAX_PAGES_PER_TITLE = 50
 
-    driver = create_driver(headless=False)
+    parser = argparse.ArgumentParser(description="Rotten Tomatoes 리뷰 크롤러")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"동시에 띄울 크롬 드라이버 수 (최대 {RT_MAX_WORKERS})",
+    )
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="이미지/폰트/동영상/광고·트래커 요청을 막는 가벼운 브라우저 프로필",
+    )
+    parser.add_argument(
+        "--lean-allow",
+        action="append",
+        default=[],
+        metavar="GROUP_OR_PATTERN",
+        help="--lean 에서 막지 않을 범주(image/font/media/tracker) 또는 URL 패턴 (반복 가능)",
+    )
+    parser.add_argument(
+        "--extraction",
+        choices=["element", "offline", "network"],
+        default="element",
+        help=(
+            "카드 추출 방식 (offline: 끝까지 펼친 뒤 page_source 를 lxml 로 파싱, "
+            "network: Load More 의 리뷰 API JSON 에서 바로 읽고 처음 몇 라운드는 DOM 과 대조)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="이전 실행의 체크포인트에서 이어서 (완료 타이틀 스킵, 나머지는 빨리 감기)",
+    )
+    parser.add_argument(
+        "--db",
+        help="리뷰를 이 SQLite DB 에도 upsert (내용 해시 id 기준, 재실행해도 중복 없음)",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=["off", "report", "drop"],
+        default="off",
+        help=(
+            "본문 해시 / MinHash 로 완전·유사 중복 판정 "
+            "(report: rt_dup_clusters.csv 에 묶음만 기록, drop: 중복 row 는 저장 안 함)"
+        ),
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help=(
+            "rt_reviews.csv 와 함께 site/title 파티션 Parquet 데이터셋"
+            "(rt_reviews.parquet/)도 씀 (pyarrow 필요)"
+        ),
+    )
+    parser.add_argument(
+        "--debug-snapshots",
+        choices=SNAPSHOT_LEVELS,
+        default="all",
+        help="debug/ HTML 스냅샷 저장 수준 (error: 오류만, sampled: 일부 타이틀만)",
+    )
+    parser.add_argument(
+        "--snapshot-compression", choices=SNAPSHOT_COMPRESSIONS, default="gzip"
+    )
+    parser.add_argument(
+        "--debug-max-mb", type=int, default=200, help="debug/ 전체 크기 상한(MB)"
+    )
+    parser.add_argument(
+        "--bounded-dom",
+        action="store_true",
+        help="처리한 리뷰 카드를 페이지에서 비워 DOM/메모리 크기를 일정하게 유지",
+    )
+    parser.add_argument(
+        "--no-pipeline",
+        action="store_true",
+        help="배치 저장(spool / DB / 중복 판정 / 체크포인트)을 크롤 스레드에서 바로 (비교·디버깅용)",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="rt_reviews.csv 에 이미 있는 리뷰에서 멈추고 새 리뷰만 추가 (정기 갱신용)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help=(
+            "시작 요청 속도 (초당 페이지 로드 + 클릭, 워커 합산). "
+            "스로틀 신호에 따라 자동으로 내리고 올린다"
+        ),
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=2,
+        help="캡차 / 타임아웃 / 빈 카드 목록으로 실패한 타이틀을 늦춰서 다시 시도할 횟수",
+    )
+    parser.add_argument(
+        "--title-timeout",
+        type=float,
+        default=1800.0,
+        help=(
+            "타이틀 하나의 시간 예산(초). 넘으면 브라우저를 죽이고 새 드라이버로 "
+            "체크포인트에서 이어서 재시도 (0 = 무제한)"
+        ),
+    )
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        default=10,
+        help="워커마다 이 개수의 타이틀을 처리하면 드라이버를 새로 띄움 (0 = 안 함)",
+    )
+    parser.add_argument(
+        "--max-browser-mb",
+        type=float,
+        default=2048.0,
+        help=(
+            "브라우저 RSS 가 이 값(MB)을 넘으면 타이틀 뒤에 드라이버 교체, "
+            "1.5배를 넘으면 타이틀 도중에도 끊고 재시도 (psutil 필요, 0 = 안 봄)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=RT_PROFILE_DIR,
+        help=(
+            "실행 간에 재사용하는 크롬 프로필 위치 (워커마다 worker-N 복사본, "
+            "디스크 캐시 / 쿠키 / 배너 동의 유지)"
+        ),
+    )
+    parser.add_argument(
+        "--warm-spares",
+        type=int,
+        default=0,
+        help=(
+            "워커 수 외에 미리 띄워 둘 예비 드라이버 수 (기본 0). "
+            "watchdog 재시작 / --recycle-after 교체가 잦은 긴 실행에서만 "
+            "1 정도로 (이번 실행 안에서만 쓰고, 실행이 끝나면 모두 종료)"
+        ),
+    )
+    parser.add_argument(
+        "--fresh-profile",
+        action="store_true",
+        help="프로필을 재사용하지 않고 매번 새 임시 프로필로 띄움",
+    )
+    parser.add_argument(
+        "--disk-cache-mb",
+        type=int,
+        default=256,
+        help="프로필마다 HTTP 디스크 캐시 상한(MB)",
+    )
+    parser.add_argument(
+        "--metrics-events",
+        help="단계별 시간 / 타이틀 요약을 이 파일에 JSON-lines 로 추가",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        help="타이틀이 끝날 때마다 이 경로에 Prometheus textfile 요약 (예: rt.prom)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="클릭 / 페이지마다 진행 로그 출력",
+    )
+    args = parser.parse_args()
 
-    try:
-        total = 0
-        for tgt in RT_TARGETS:
-            print(
-                f"\n[RT-CRAWL] {tgt['title_ko']} / {tgt['title_en']} ({tgt['year']})"
-            )
-            rows = crawl_rt_audience_reviews_for_target(
-                driver,
-                tgt,
-                max_pages=MAX_PAGES_PER_TITLE,
-            )
-            save_to_csv(OUTPUT_CSV, rows)
-            total += len(rows)
+    workers = max(1, min(args.workers, RT_MAX_WORKERS))
+    configure_metrics(
+        events_path=args.metrics_events,
+        prom_path=args.metrics_prom,
+        verbosity=LOG_DEBUG if args.verbose else LOG_INFO,
+    )
+    configure_snapshots(
+        level=args.debug_snapshots,
+        compression=args.snapshot_compression,
+        max_bytes=args.debug_max_mb * 1024 * 1024,
+    )
+    # 여러 개를 띄울 때는 항상 headless
+    headless = args.headless or workers > 1
+    # 워커마다 profile_dir/worker-N 을 빌려 쓴다 (디스크 캐시 / 쿠키가 다음 실행에도 남음)
+    profiles = (
+        None
+        if args.fresh_profile
+        else BrowserProfiles(args.profile_dir, cache_mb=args.disk_cache_mb)
+    )
+    limiter = limiter_for(RT_DOMAIN, rate=args.rate)
+
+    def _new_driver() -> webdriver.Chrome:
+        return create_driver(
+            headless=headless,
+            lean=args.lean,
+            lean_allow=args.lean_allow,
+            capture=args.extraction == "network",
+            profiles=profiles,
+        )
+
+    # 크롬은 아래 CSV / 체크포인트 / DB 준비와 겹쳐서 백그라운드로 띄운다.
+    # 띄우기만 하고 사이트 요청은 하지 않는다 (첫 요청과 쿠키 배너는 타이틀에서)
+    browser_pool = BrowserPool(
+        _new_driver,
+        warm=min(workers, len(RT_TARGETS)),
+        spares=args.warm_spares,
+        label="RT-POOL",
+    ).start()
+    atexit.register(browser_pool.close)
+
+    # row 는 라운드마다 타이틀별 spool 에 쓰고, 끝나면(또는 예외로 중단돼도)
+    # RT_TARGETS 순서대로 rt_reviews.csv 뒤에 붙인다
+    known_index = (
+        load_known_review_keys(OUTPUT_CSV, rt_review_key) if args.delta else None
+    )
+
+    spool = CsvSpoolWriter(OUTPUT_CSV, RT_FIELDNAMES, resume=args.resume)
+    if not args.resume and os.path.exists(RT_CHECKPOINT_PATH):
+        os.remove(RT_CHECKPOINT_PATH)
+    checkpoint = CheckpointStore(
+        RT_CHECKPOINT_PATH,
+        before_save=spool.sync,
+        sync_interval=spool.fsync_interval,
+    )
+    db = ReviewDB(args.db) if args.db else None
+    dedup = DedupIndex() if args.dedup != "off" else None
+
+    def _sink_for(key: str) -> Callable[[List[Dict[str, str]]], None]:
+        # spool ← (DB) ← (중복 판정) 순서로 감싼다
+        sink = spool.writer_for(key)
+        if db is not None:
+            sink = db.sink_for("RT", sink)
+        if dedup is not None:
+            sink = dedup.filter_sink(sink, "RT", drop=args.dedup == "drop")
+        return sink
+
+    keys = [t["rt_url"] for t in RT_TARGETS]
+    pending = [t for t in RT_TARGETS if not checkpoint.is_done(t["rt_url"])]
+    if len(pending) < len(RT_TARGETS):
+        print(
+            f"[RT-CRAWL] 체크포인트: {len(RT_TARGETS) - len(pending)}개 타이틀 완료됨, 스킵"
+        )
+
+    def _crawl_target(driver, tgt: Dict) -> List[Dict[str, str]]:
+        print(
+            f"\n[RT-CRAWL] {tgt['title_ko']} / {tgt['title_en']} ({tgt['year']})"
+        )
+        return crawl_rt_audience_reviews_for_target(
+            driver,
+            tgt,
+            max_pages=MAX_PAGES_PER_TITLE,
+            extraction=args.extraction,
+            row_sink=_sink_for(tgt["rt_url"]),
+            checkpoint=checkpoint,
+            known_keys=(
+                known_index.get(tgt["title_en"], set())
+                if known_index is not None
+                else None
+            ),
+            bounded_dom=args.bounded_dom,
+            pipelined=not args.no_pipeline,
+        )
 
-        print(f"\n[RT-CRAWL] 전체 타이틀 합산 {total}개 수집 완료")
+    total = 0
+
+    def _on_done(idx: int, tgt: Dict, rows: List[Dict[str, str]]) -> None:
+        nonlocal total
+        total += spool.finish(tgt["rt_url"])
+
+    def _on_failed(idx: int, tgt: Dict, error: Exception) -> None:
+        # 재시도해도 카드가 비어 있던(차단 표식 없는) 타이틀은 리뷰 0개로 완료 처리.
+        # 완료로 남기지 않으면 --resume 마다 같은 타이틀을 다시 시도한다
+        if isinstance(error, ThrottledError) and error.soft:
+            print(f"[RT-CRAWL] {tgt['title_en']} – {error.reason}, 0개로 완료 처리")
+            checkpoint.mark_done(tgt["rt_url"])
+
+    try:
+        crawl_targets_parallel(
+            pending,
+            create_driver_fn=_new_driver,
+            crawl_fn=_crawl_target,
+            workers=workers,
+            on_result=_on_done,
+            on_failed=_on_failed,
+            label="RT-CRAWL",
+            limiter=limiter,
+            max_retries=args.max_retries,
+            title_timeout=args.title_timeout,
+            recycle_after=args.recycle_after,
+            max_rss_mb=args.max_browser_mb,
+            browser_pool=browser_pool,
+        )
     finally:
-        driver.quit()
+        browser_pool.close()
+        # 끝난 타이틀만 rt_reviews.csv 뒤에 붙인다 (기존처럼 타이틀 단위).
+        # 중단된 타이틀의 spool 은 남겨 두고 --resume 때 이어서 쓴 뒤 붙인다.
+        spool.commit([k for k in keys if checkpoint.is_done(k)], append=True)
+        if checkpoint.all_done(keys):
+            checkpoint.clear()
+        else:
+            checkpoint.close()
+        if db is not None:
+            db.close()
+        if dedup is not None:
+            dedup.write_report(RT_DUP_REPORT)
+            dedup.close()
+        if args.parquet:
+            # pyarrow 는 --parquet 에서만 필요
+            from review_storage import export_csv_to_parquet
+
+            export_csv_to_parquet(OUTPUT_CSV, RT_PARQUET_DIR, site="RT")
+        flush_snapshots()
+        close_metrics()
+
+    print(f"\n[RT-CRAWL] 전체 타이틀 합산 {total}개 수집 완료")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 모듈이 저장소 최상위에 평평하게 있어서 그대로 import 할 수 있게
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,78 @@
+import os
+import shutil
+import threading
+
+import pytest
+
+import imdb_reviews_selenium
+from crawl_scheduler import ThrottledError
+from imdb_http import check_replay, fetch_imdb_reviews_http, make_replay_server
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "imdb_http")
+TTID = "tt0000001"
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _Session:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def post(self, *args, **kwargs):
+        return _Response(self.status_code)
+
+
+def test_check_replay_fixture():
+    assert check_replay(FIXTURES, TTID)
+
+
+def test_rate_limited_response_is_throttle_signal():
+    with pytest.raises(ThrottledError):
+        fetch_imdb_reviews_http("", TTID, 0, TTID, session=_Session(429))
+
+
+def test_fallback_carries_http_rows_and_ids(tmp_path, monkeypatch):
+    # 두 번째 페이지가 없는 녹화 → 첫 페이지 뒤 404 로 Selenium 경로에 폴백
+    shutil.copy(os.path.join(FIXTURES, f"{TTID}_0.json"), tmp_path)
+    replay = make_replay_server(str(tmp_path))
+    threading.Thread(target=replay.serve_forever, daemon=True).start()
+    host, port = replay.server_address[:2]
+
+    calls = {}
+    retired = []
+    driver = object()
+
+    def _fake_crawl(d, *args, seen_ids=None, carry=None, **kwargs):
+        calls.update(driver=d, seen_ids=set(seen_ids), rows=list(carry.rows))
+        return []
+
+    monkeypatch.setattr(imdb_reviews_selenium, "_crawl_imdb_reviews", _fake_crawl)
+    monkeypatch.setattr(imdb_reviews_selenium, "retire_driver", retired.append)
+    try:
+        imdb_reviews_selenium.crawl_imdb_reviews_for_title(
+            None,
+            "",
+            "Fixture",
+            2020,
+            TTID,
+            extraction="http",
+            graphql_url=f"http://{host}:{port}/",
+            driver_factory=lambda: driver,
+        )
+    finally:
+        replay.shutdown()
+        replay.server_close()
+
+    # 브라우저는 폴백할 때만 띄우고, 끝나면 끈다
+    assert calls["driver"] is driver
+    assert retired == [driver]
+    # sink 가 없을 때 HTTP 로 모은 row 와 id 가 그대로 넘어간다
+    expected = {
+        "https://www.imdb.com/review/rw0000001/",
+        "https://www.imdb.com/review/rw0000003/",
+    }
+    assert calls["seen_ids"] == expected
+    assert {r["review_id"] for r in calls["rows"]} == expected
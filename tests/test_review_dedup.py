@@ -0,0 +1,44 @@
+from review_dedup import DedupIndex
+
+TEXT = "this show was great and I would happily watch every episode again"
+
+
+def _rt_row(review, date="Aug 15"):
+    return {"site": "RT", "title_en": "Show", "date": date, "review": review}
+
+
+def test_filter_sink_reports_exact_reposts():
+    index = DedupIndex()
+    out = []
+    sink = index.filter_sink(out.extend, "RT")
+    sink([_rt_row(TEXT), _rt_row(TEXT)])
+    assert len(out) == 2
+    assert index.stats["unique"] == 1
+    assert index.stats["exact"] == 1
+
+
+def test_filter_sink_drop_keeps_only_first_copy():
+    index = DedupIndex()
+    out = []
+    sink = index.filter_sink(out.extend, "RT", drop=True)
+    sink([_rt_row(TEXT)])
+    sink([_rt_row(TEXT, date="Aug 16")])
+    assert len(out) == 1
+    assert index.stats["exact"] == 1
+
+
+def test_resent_rows_are_not_duplicates_of_themselves():
+    index = DedupIndex()
+    out = []
+    # 재시도한 타이틀은 새 sink 로 같은 row 를 다시 보낸다
+    index.filter_sink(out.extend, "RT", drop=True)([_rt_row(TEXT)])
+    index.filter_sink(out.extend, "RT", drop=True)([_rt_row(TEXT)])
+    imdb_row = {
+        "title_en": "Movie",
+        "review": "a slow start but the last hour of this film is worth the wait",
+        "review_id": "https://www.imdb.com/review/rw1/",
+    }
+    index.filter_sink(out.extend, "IMDB", drop=True)([imdb_row])
+    index.filter_sink(out.extend, "IMDB", drop=True)([imdb_row])
+    assert len(out) == 4
+    assert index.stats["exact"] == 0